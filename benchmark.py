@@ -0,0 +1,341 @@
+"""
+PDF / OCR 파이프라인 벤치마크 (오프라인)
+- 키워드 페이지 위치를 알고 있는 한글/영문 합성 PDF와 페이지 이미지를 생성
+- 처리 속도(페이지/초), 단계별 시간(렌더링/전처리/OCR/매칭), 최대 메모리(RSS), 키워드 재현율 측정
+- 스캔처럼 회색 배경/기울기/잡음을 넣은 문서로 전처리 전후 속도와 재현율 비교 가능
+- 결과는 커밋별로 비교할 수 있도록 JSON 파일로 저장
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from preprocess import PREPROCESS
+
+CORPUS_DIR = "output/bench/corpus"
+RESULT_DIR = "output/bench/results"
+
+#. 한글 글꼴 후보 (Windows / macOS / Linux)
+FONT_CANDIDATES = [
+    r"C:\Windows\Fonts\malgun.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/Library/Fonts/AppleGothic.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+]
+
+#. 본문 채우기용 단어 (키워드 글자가 들어가지 않게 고름)
+FILLER_WORDS = [
+    "환자", "체중", "체온", "혈액", "검사", "결과", "처방", "치료", "예방접종", "보호자",
+    "내원", "증상", "관찰", "투약", "수술", "회복", "소견", "영상", "초음파", "방사선",
+    "weight", "blood", "test", "result", "dose", "mg", "kg", "normal", "follow-up", "note",
+]
+KEYWORD_LINE = "병력 및 문진"
+
+SCENARIOS = ("pipeline", "scan", "images")
+
+#. --degrade 스캔 흉내 정도 (배경 밝기, 최대 기울기(도), 잡음 표준편차)
+DEGRADE = {"background": 215, "max_skew": 2.0, "noise": 18}
+
+
+def find_font(font_path: str = None) -> str:
+    if font_path:
+        return font_path
+    for candidate in FONT_CANDIDATES:
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError("한글 글꼴을 찾을 수 없습니다. --font 로 TTF/TTC 경로를 지정하세요.")
+
+
+def draw_page(page: int, keyword: bool, font_path: str, rng: random.Random, dpi: int = 150) -> Image.Image:
+    """A4 한 장 (keyword=True면 상단 제목 줄에 키워드를 넣음)"""
+    width, height = int(8.27 * dpi), int(11.69 * dpi)
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+
+    title_font = ImageFont.truetype(font_path, int(dpi * 0.22))
+    body_font = ImageFont.truetype(font_path, int(dpi * 0.13))
+    margin = int(dpi * 0.8)
+    line_height = int(dpi * 0.22)
+
+    title = KEYWORD_LINE if keyword else f"진료 기록 {page}"
+    draw.text((margin, margin), title, fill="black", font=title_font)
+
+    y = margin + line_height * 2
+    while y < height - margin:
+        words = rng.sample(FILLER_WORDS, 8)
+        draw.text((margin, y), " ".join(words), fill="black", font=body_font)
+        y += line_height
+
+    draw.text((width // 2, height - margin // 2), f"- {page} -", fill="black", font=body_font)
+    return img
+
+
+def degrade_page(img: Image.Image, rng: random.Random, background: int, max_skew: float, noise: float) -> Image.Image:
+    """스캔 문서처럼 회색 배경, 약간의 기울기, 잡음 추가"""
+    angle = rng.uniform(-max_skew, max_skew)
+    gray = img.convert("L").rotate(angle, resample=Image.BILINEAR, fillcolor=255)
+
+    values = np.asarray(gray, dtype=np.float64)
+    # 흰색(255)을 배경 밝기로 낮추고 글자 대비는 유지
+    values = values * (background / 255.0)
+    values += np.random.default_rng(rng.randrange(2 ** 32)).normal(0, noise, values.shape)
+    return Image.fromarray(np.clip(values, 0, 255).astype(np.uint8)).convert("RGB")
+
+
+def generate_corpus(
+    out_dir: str,
+    pages: int,
+    keyword_pages: List[int],
+    font_path: str = None,
+    seed: int = 0,
+    degrade: Dict = None,
+) -> Dict:
+    """
+    합성 PDF와 페이지별 PNG 생성
+
+    Args:
+        degrade: 스캔 흉내 설정 (DEGRADE 형식, None이면 깨끗한 페이지)
+
+    Returns:
+        {"pdf", "image_dir", "pages", "keyword_pages", "degraded"}
+    """
+    font_path = find_font(font_path)
+    rng = random.Random(seed)
+    image_dir = os.path.join(out_dir, "images")
+    os.makedirs(image_dir, exist_ok=True)
+
+    images = []
+    for page in range(1, pages + 1):
+        img = draw_page(page, page in keyword_pages, font_path, rng)
+        if degrade:
+            img = degrade_page(img, rng, **degrade)
+        img.save(os.path.join(image_dir, f"page_{page}.png"))
+        images.append(img)
+
+    pdf_path = os.path.join(out_dir, "corpus.pdf")
+    images[0].save(pdf_path, "PDF", resolution=150, save_all=True, append_images=images[1:])
+
+    return {
+        "pdf": pdf_path,
+        "image_dir": image_dir,
+        "pages": pages,
+        "keyword_pages": sorted(keyword_pages),
+        "degraded": bool(degrade),
+    }
+
+
+def _peak_rss_mb():
+    """현재 프로세스와 종료된 자식 프로세스 중 최대 RSS (MB)"""
+    try:
+        import resource
+        peak = max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        )
+        # ru_maxrss 단위: macOS는 바이트, Linux는 KB
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        except (ImportError, AttributeError):
+            return None
+
+
+def _recall(found: List[int], expected: List[int]) -> Dict:
+    hits = len(set(found) & set(expected))
+    return {
+        "found": sorted(found),
+        "recall": hits / len(expected) if expected else 1.0,
+        "precision": hits / len(found) if found else 1.0,
+    }
+
+
+def _run_scenario(name: str, corpus: Dict, options: Dict) -> Dict:
+    """별도 프로세스에서 실행 (시나리오마다 최대 메모리를 따로 측정)"""
+    from ocr_engine import set_default_backend
+    set_default_backend(options["ocr_backend"])
+
+    start = time.perf_counter()
+    result = {}
+
+    if name == "pipeline":
+        from pipeline import Pipeline
+        run = Pipeline(
+            corpus["pdf"],
+            dpi=options["dpi"],
+            chunk_size=options["chunk_size"],
+            ocr_workers=options["workers"],
+            text_dir=None,
+            preprocess=options.get("preprocess"),
+        ).run()
+        found = run["pages"]
+        result["stages"] = run["timings"]
+
+    elif name == "scan":
+        from pdf_to_image import find_target_pages
+        found = find_target_pages(
+            corpus["pdf"],
+            dpi=options["dpi"],
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            render={"preprocess": options.get("preprocess")},
+        )
+
+    elif name == "images":
+        import tempfile
+        from image_to_text import run_batch
+        from pdf_to_image import loose_match
+
+        with tempfile.TemporaryDirectory() as ocr_dir:
+            run_batch(
+                corpus["image_dir"], ocr_dir, workers=options["workers"], force=True, log_path=None, cache_path=None,
+                preprocess=options.get("preprocess"),
+            )
+            found = []
+            for filename in os.listdir(ocr_dir):
+                with open(os.path.join(ocr_dir, filename), encoding="utf-8") as f:
+                    if loose_match(f.read()):
+                        found.append(int(filename[len("page_"):-len(".txt")]))
+
+    else:
+        raise ValueError(f"알 수 없는 시나리오: {name}")
+
+    elapsed = time.perf_counter() - start
+    result.update({
+        "elapsed": elapsed,
+        "pages_per_sec": corpus["pages"] / elapsed if elapsed else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        **_recall(found, corpus["keyword_pages"]),
+    })
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(corpus: Dict, scenarios: List[str], options: Dict, compare_preprocess: Dict = None) -> Dict:
+    """
+    시나리오별 실행
+
+    Args:
+        compare_preprocess: 전처리 설정을 주면 시나리오마다 "<이름>+preprocess"로 한 번 더 실행
+    """
+    runs = [(name, options) for name in scenarios]
+    if compare_preprocess:
+        runs += [(f"{name}+preprocess", {**options, "preprocess": compare_preprocess}) for name in scenarios]
+
+    results = {}
+    for label, run_options in runs:
+        name = label.split("+")[0]
+        print(f"▶ {label} 실행 중...")
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results[label] = pool.submit(_run_scenario, name, corpus, run_options).result()
+
+        r = results[label]
+        print(
+            f"  {r['elapsed']:.1f}초, {r['pages_per_sec']:.2f} 페이지/초, "
+            f"재현율 {r['recall']:.2f}, 최대 RSS {r['peak_rss_mb'] or 0:.0f}MB"
+        )
+        for stage, seconds in r.get("stages", {}).items():
+            print(f"    {stage}: {seconds:.2f}초")
+
+    if compare_preprocess:
+        print("\n전처리 효과 (전처리 / 원본):")
+        for name in scenarios:
+            raw, pre = results[name], results[f"{name}+preprocess"]
+            speedup = raw["elapsed"] / pre["elapsed"] if pre["elapsed"] else 0.0
+            print(f"  {name}: 속도 {speedup:.2f}배, 재현율 {raw['recall']:.2f} -> {pre['recall']:.2f}")
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "platform": {"python": platform.python_version(), "system": platform.platform(), "cpus": os.cpu_count()},
+        "corpus": {key: corpus[key] for key in ("pages", "keyword_pages", "degraded")},
+        "options": options,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PDF / OCR 파이프라인 벤치마크",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 30페이지 합성 문서로 전체 시나리오 실행
+  python benchmark.py
+
+  # 100페이지, 키워드 페이지 지정, 파이프라인만
+  python benchmark.py --pages 100 --keyword-pages 5,50,99 --scenarios pipeline
+
+  # 스캔처럼 손상된 문서로 전처리 전후 비교
+  python benchmark.py --degrade --compare-preprocess --target-line-height 30
+        '''
+    )
+    parser.add_argument("--pages", type=int, default=30, help="합성 문서 페이지 수 (기본값: 30)")
+    parser.add_argument("--keyword-pages", default="2,11,23", help="키워드를 넣을 페이지 (쉼표 구분, 기본값: 2,11,23)")
+    parser.add_argument("--font", default=None, help="한글 글꼴 경로 (기본값: 시스템에서 검색)")
+    parser.add_argument("--seed", type=int, default=0, help="본문 생성 시드 (기본값: 0)")
+    parser.add_argument("--corpus-dir", default=CORPUS_DIR, help=f"합성 문서 저장 폴더 (기본값: {CORPUS_DIR})")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"실행할 시나리오 (기본값: {','.join(SCENARIOS)})")
+    parser.add_argument("--dpi", type=int, default=300, help="렌더링 해상도 (기본값: 300)")
+    parser.add_argument("--chunk-size", type=int, default=10, help="pdftoppm 한 번에 렌더링할 페이지 수 (기본값: 10)")
+    parser.add_argument("--workers", type=int, default=2, help="OCR 워커 수 (기본값: 2)")
+    parser.add_argument("--ocr-backend", default="auto", help="OCR 엔진 (기본값: auto)")
+    parser.add_argument("--degrade", action="store_true", help="회색 배경 / 기울기 / 잡음을 넣어 스캔 문서처럼 생성")
+    parser.add_argument("--compare-preprocess", action="store_true", help="시나리오마다 전처리를 켠 실행을 추가해 속도/재현율 비교")
+    parser.add_argument("--target-line-height", type=int, default=None, help="--compare-preprocess 축소 목표 줄 높이 (기본값: 축소 안 함)")
+    parser.add_argument("--output", default=None, help=f"결과 JSON 경로 (기본값: {RESULT_DIR}/<시각>_<커밋>.json)")
+    args = parser.parse_args()
+
+    keyword_pages = [int(page) for page in args.keyword_pages.split(",") if page]
+    scenarios = [name for name in args.scenarios.split(",") if name]
+
+    print(f"합성 문서 생성: {args.pages}페이지, 키워드 페이지 {keyword_pages}")
+    corpus = generate_corpus(
+        args.corpus_dir, args.pages, keyword_pages, args.font, args.seed,
+        degrade=DEGRADE if args.degrade else None,
+    )
+
+    options = {
+        "dpi": args.dpi,
+        "chunk_size": args.chunk_size,
+        "workers": args.workers,
+        "ocr_backend": args.ocr_backend,
+    }
+    compare_preprocess = {**PREPROCESS, "target_line_height": args.target_line_height} if args.compare_preprocess else None
+    report = run_benchmark(corpus, scenarios, options, compare_preprocess)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULT_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(RESULT_DIR, f"{stamp}_{report['commit'] or 'nogit'}.json")
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
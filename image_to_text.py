@@ -1,6 +1,14 @@
 import pytesseract
 from PIL import Image
 import os
+import time
+import json
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ocr_cache import OCRCache, CACHE_PATH, DEFAULT_MAX_BYTES, file_hash
+from ocr_engine import BACKENDS, get_engine, set_default_backend
+from preprocess import PREPROCESS, preprocess_image, describe as describe_preprocess
 
 # Tesseract 설치 경로 (Windows)
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
@@ -8,23 +16,173 @@ pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tessera
 IMAGE_DIR = "output/images"
 OCR_DIR = "output/ocr"
 
-os.makedirs(OCR_DIR, exist_ok=True)
+LOG_PATH = "output/ocr_log.jsonl"
 
-for filename in os.listdir(IMAGE_DIR):
-    if not filename.endswith(".png"):
-        continue
+OCR_LANG = "kor+eng"
+OCR_CONFIG = ""
 
-    image_path = os.path.join(IMAGE_DIR, filename)
-    text_path = os.path.join(OCR_DIR, filename.replace(".png", ".txt"))
+#. 워커 프로세스마다 하나씩 여는 캐시 연결과 전처리 설정
+_worker_cache = None
+_worker_preprocess = None
+
+
+#. 이미지 한 장 OCR (cache가 있으면 이미지 내용 해시로 먼저 조회)
+#. 이미지는 페이지 개념이 없으므로 캐시 키의 page, dpi는 0으로 저장
+def ocr_image(image_path, cache=None, preprocess=None):
+    cache_config = f"{OCR_CONFIG} {describe_preprocess(preprocess)}".strip()
+
+    if cache is not None:
+        image_hash = file_hash(image_path)
+        text = cache.get(image_hash, 0, 0, OCR_LANG, cache_config)
+        if text is not None:
+            return text, True
 
     img = Image.open(image_path)
+    if preprocess:
+        img = preprocess_image(img, **preprocess)
+
+    text = get_engine(OCR_LANG, OCR_CONFIG).image_to_string(img)
+
+    if cache is not None:
+        cache.put(image_hash, 0, 0, OCR_LANG, cache_config, text)
+    return text, False
+
+#. 결과 .txt가 원본 이미지보다 새로우면 이미 처리된 것으로 봄
+def is_up_to_date(image_path, text_path):
+    return os.path.exists(text_path) and os.path.getmtime(text_path) >= os.path.getmtime(image_path)
+
+def _init_worker(cache_path, cache_bytes, preprocess):
+    global _worker_cache, _worker_preprocess
+    _worker_preprocess = preprocess
+    if cache_path:
+        _worker_cache = OCRCache(cache_path, max_bytes=cache_bytes)
+
+#. 워커 프로세스에서 실행: 이미지 한 장 OCR 후 .txt 저장, 처리 결과 반환 (예외는 결과에 기록)
+def _process_file(image_path, text_path):
+    start = time.perf_counter()
+    try:
+        text, cached = ocr_image(image_path, _worker_cache, _worker_preprocess)
+
+        # 중간에 죽어도 반쯤 쓴 .txt가 최신 파일로 남지 않도록 임시 파일에 쓰고 교체
+        tmp_path = text_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, text_path)
+
+        status = "cached" if cached else "ok"
+        error = None
+    except Exception as e:
+        status = "error"
+        error = str(e)
+
+    return {
+        "file": os.path.basename(image_path),
+        "status": status,
+        "seconds": round(time.perf_counter() - start, 3),
+        "error": error,
+    }
+
+def run_batch(image_dir, ocr_dir, workers=1, force=False, log_path=LOG_PATH, cache_path=CACHE_PATH, cache_bytes=DEFAULT_MAX_BYTES, preprocess=None):
+    """
+    폴더 단위 OCR 실행
+
+    Args:
+        image_dir: 입력 이미지 폴더
+        ocr_dir: OCR 결과 폴더
+        workers: OCR 프로세스 수
+        force: 이미 처리된 이미지도 다시 OCR
+        log_path: 파일별 처리 결과를 추가할 JSONL 경로 (None이면 기록 안 함)
+        cache_path: OCR 캐시 경로 (None이면 캐시 사용 안 함)
+        preprocess: OCR 전 전처리 설정 (preprocess.PREPROCESS 형식, None이면 전처리 안 함)
 
-    text = pytesseract.image_to_string(
-        img,
-        lang="kor+eng"
+    Returns:
+        {"ok", "cached", "error", "skipped"} 개수
+    """
+    os.makedirs(ocr_dir, exist_ok=True)
+
+    jobs = []
+    skipped = 0
+    for filename in sorted(os.listdir(image_dir)):
+        if not filename.endswith(".png"):
+            continue
+
+        image_path = os.path.join(image_dir, filename)
+        text_path = os.path.join(ocr_dir, filename.replace(".png", ".txt"))
+
+        if not force and is_up_to_date(image_path, text_path):
+            skipped += 1
+            continue
+        jobs.append((image_path, text_path))
+
+    counts = {"ok": 0, "cached": 0, "error": 0, "skipped": skipped}
+    print(f"OCR 대상: {len(jobs)}개 (이미 처리됨: {skipped}개)")
+    if not jobs:
+        return counts
+
+    if log_path:
+        log_dir = os.path.dirname(log_path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+    log_file = open(log_path, "a", encoding="utf-8") if log_path else None
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_path, cache_bytes, preprocess)
+        ) as pool:
+            futures = [pool.submit(_process_file, image_path, text_path) for image_path, text_path in jobs]
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                counts[result["status"]] += 1
+
+                if log_file:
+                    log_file.write(json.dumps({"time": datetime.now().isoformat(timespec="seconds"), **result}, ensure_ascii=False) + "\n")
+                    log_file.flush()
+
+                if result["status"] == "error":
+                    print(f"[{done}/{len(jobs)}] OCR 실패: {result['file']} - {result['error']}")
+                else:
+                    suffix = " (캐시)" if result["status"] == "cached" else ""
+                    print(f"[{done}/{len(jobs)}] OCR 완료: {result['file']} {result['seconds']}초{suffix}")
+    finally:
+        if log_file:
+            log_file.close()
+
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 폴더 OCR")
+    parser.add_argument("--image-dir", default=IMAGE_DIR, help=f"입력 이미지 폴더 (기본값: {IMAGE_DIR})")
+    parser.add_argument("--ocr-dir", default=OCR_DIR, help=f"OCR 결과 폴더 (기본값: {OCR_DIR})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="OCR 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--force", action="store_true", help="결과 .txt가 최신이어도 다시 OCR")
+    parser.add_argument("--log", default=LOG_PATH, help=f"파일별 처리 시간을 기록할 JSONL 경로 (기본값: {LOG_PATH})")
+    parser.add_argument("--no-cache", action="store_true", help="OCR 캐시를 사용하지 않음")
+    parser.add_argument("--cache-path", default=CACHE_PATH, help=f"OCR 캐시 파일 경로 (기본값: {CACHE_PATH})")
+    parser.add_argument(
+        "--cache-size-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help=f"OCR 캐시 최대 크기 MB (기본값: {DEFAULT_MAX_BYTES // (1024 * 1024)})"
     )
+    parser.add_argument("--ocr-backend", choices=BACKENDS, default="auto", help="OCR 엔진 (기본값: auto - tesserocr가 있으면 사용)")
+    parser.add_argument("--preprocess", action="store_true", help="OCR 전 테두리 제거 / 기울기 보정 / 적응형 이진화")
+    parser.add_argument("--target-line-height", type=int, default=None, help="--preprocess 사용 시 텍스트 줄 높이가 이 픽셀 수가 되도록 축소")
+    args = parser.parse_args()
+
+    set_default_backend(args.ocr_backend)
 
-    with open(text_path, "w", encoding="utf-8") as f:
-        f.write(text)
+    counts = run_batch(
+        args.image_dir,
+        args.ocr_dir,
+        workers=args.workers,
+        force=args.force,
+        log_path=args.log,
+        cache_path=None if args.no_cache else args.cache_path,
+        cache_bytes=args.cache_size_mb * 1024 * 1024,
+        preprocess={**PREPROCESS, "target_line_height": args.target_line_height} if args.preprocess else None
+    )
+    print(f"완료: OCR {counts['ok']}개, 캐시 {counts['cached']}개, 실패 {counts['error']}개, 건너뜀 {counts['skipped']}개")
 
-    print(f"OCR 완료: {filename}")
+if __name__ == "__main__":
+    main()
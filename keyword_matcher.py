@@ -0,0 +1,271 @@
+"""
+여러 키워드 그룹을 한 번에 찾는 매처
+- 모든 키워드를 Aho-Corasick 오토마톤 하나로 만들어서 페이지 텍스트를 한 번만 훑음
+- max_edits > 0이면 편집 거리 이내로 틀린 OCR 결과도 찾음
+  키워드를 max_edits + 1 조각으로 나누면 틀린 글자가 max_edits개 이하일 때 적어도 한 조각은 그대로 남음
+  -> 조각을 오토마톤으로 찾고, 찾은 위치 주변만 편집 거리 계산으로 확인
+- jamo=True면 한글을 자모로 풀어서 비교 (병력 -> 변력은 글자 1개가 아니라 자모 1개 차이)
+- 공백은 무시 (normalize와 같은 기준), 결과 위치는 원문 기준
+"""
+
+import argparse
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+
+def to_jamo(ch: str) -> str:
+    """한글 음절 한 글자를 초성/중성/종성 자모로 분리 (한글이 아니면 그대로)"""
+    code = ord(ch)
+    if not _HANGUL_BASE <= code <= _HANGUL_LAST:
+        return ch
+    index = code - _HANGUL_BASE
+    jamo = chr(0x1100 + index // 588) + chr(0x1161 + (index % 588) // 28)
+    if index % 28:
+        jamo += chr(0x11A7 + index % 28)
+    return jamo
+
+
+def to_units(text: str, jamo: bool = False) -> Tuple[str, List[int]]:
+    """
+    비교 단위 문자열과 단위별 원문 위치 (공백은 건너뜀)
+
+    Returns:
+        (단위 문자열, [원문 인덱스])
+    """
+    units = []
+    positions = []
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            continue
+        part = to_jamo(ch) if jamo else ch
+        units.append(part)
+        positions.extend([i] * len(part))
+    return "".join(units), positions
+
+
+def split_pieces(term: str, count: int) -> List[Tuple[int, str]]:
+    """키워드를 길이가 비슷한 count개 조각으로 나눔 [(조각 시작 위치, 조각)]"""
+    bounds = [round(i * len(term) / count) for i in range(count + 1)]
+    return [(bounds[i], term[bounds[i]:bounds[i + 1]]) for i in range(count)]
+
+
+def best_alignment(pattern: str, window: str) -> Tuple[int, int, int]:
+    """
+    pattern과 가장 가까운 window의 부분 문자열 (시작/끝은 어디든 가능)
+
+    Returns:
+        (편집 거리, 시작, 끝) window 기준 위치
+    """
+    # prev[j] = (pattern[:i]를 window[..j]에 맞춘 최소 거리, 그때 시작 위치)
+    prev = [(0, j) for j in range(len(window) + 1)]
+    for i in range(1, len(pattern) + 1):
+        cur = [(i, 0)]
+        for j in range(1, len(window) + 1):
+            best = (prev[j - 1][0] + (pattern[i - 1] != window[j - 1]), prev[j - 1][1])
+            if prev[j][0] + 1 < best[0]:
+                best = (prev[j][0] + 1, prev[j][1])
+            if cur[j - 1][0] + 1 < best[0]:
+                best = (cur[j - 1][0] + 1, cur[j - 1][1])
+            cur.append(best)
+        prev = cur
+
+    # 거리가 같으면 더 긴 부분 문자열 (키워드 끝 글자를 잘라내지 않게)
+    cost, _, end = min((cost, start - j, j) for j, (cost, start) in enumerate(prev))
+    return cost, prev[end][1], end
+
+
+class AhoCorasick:
+    """문자열 여러 개를 한 번에 찾는 오토마톤"""
+
+    def __init__(self, patterns: List[str]):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.output[state].append(pattern_id)
+
+        # 너비 우선으로 실패 링크 연결 (실패 상태의 출력도 물려받음)
+        pending = deque(self.goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, child in self.goto[state].items():
+                pending.append(child)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(ch, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+        self.lengths = [len(pattern) for pattern in patterns]
+
+    def iter_matches(self, text: str):
+        """(패턴 번호, 시작, 끝)을 텍스트 순서대로 생성"""
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            for pattern_id in self.output[state]:
+                yield pattern_id, i + 1 - self.lengths[pattern_id], i + 1
+
+
+class KeywordMatcher:
+    """키워드 그룹 매처"""
+
+    def __init__(self, groups: List, max_edits: int = 0, jamo: bool = False):
+        """
+        Args:
+            groups: 키워드 그룹 리스트. 각 그룹은 문자열 또는 동의어 리스트 (그룹 안은 OR)
+            max_edits: 허용 편집 거리 (jamo=True면 자모 단위)
+                       짧은 키워드의 오탐을 막기 위해 키워드마다 비교 단위 길이의 1/3까지만 적용
+            jamo: 한글을 자모 단위로 비교
+        """
+        self.groups = [[group] if isinstance(group, str) else list(group) for group in groups]
+        self.max_edits = max_edits
+        self.jamo = jamo
+
+        # 키워드: (그룹 번호, 원래 키워드, 비교 단위 문자열, 허용 편집 거리)
+        self.terms = []
+        pieces = []
+        self._piece_owners = []
+        for group_id, terms in enumerate(self.groups):
+            for term in terms:
+                units, _ = to_units(term, jamo)
+                if not units:
+                    continue
+                edits = min(max_edits, len(units) // 3)
+                term_id = len(self.terms)
+                self.terms.append((group_id, term, units, edits))
+                for offset, piece in split_pieces(units, edits + 1):
+                    pieces.append(piece)
+                    self._piece_owners.append((term_id, offset))
+
+        self.automaton = AhoCorasick(pieces)
+
+    def effective_max_edits(self) -> int:
+        """키워드별 상한(길이의 1/3)을 적용한 뒤 실제로 허용되는 최대 편집 거리"""
+        return max((edits for _, _, _, edits in self.terms), default=0)
+
+    def find(self, text: str) -> List[Dict]:
+        """
+        텍스트 한 번 훑어서 모든 키워드 위치 찾기
+
+        Returns:
+            [{"group": 그룹 번호, "keyword": 그룹 대표 키워드, "term", "start", "end", "text", "edits"}]
+            start/end는 원문 인덱스, 원문 순서대로
+        """
+        units, positions = to_units(text, self.jamo)
+        candidates = {}
+
+        for piece_id, start, end in self.automaton.iter_matches(units):
+            term_id, offset = self._piece_owners[piece_id]
+            group_id, term, term_units, edits = self.terms[term_id]
+
+            if edits == 0:
+                found = (0, start, end)
+            else:
+                # 조각 위치로 키워드 시작 위치를 추정하고 앞뒤로 edits만큼 여유를 둔 구간만 확인
+                lo = max(start - offset - edits, 0)
+                hi = min(start - offset + len(term_units) + edits, len(units))
+                cost, window_start, window_end = best_alignment(term_units, units[lo:hi])
+                if cost > edits or window_end <= window_start:
+                    continue
+                found = (cost, lo + window_start, lo + window_end)
+
+            key = (term_id, found[1], found[2])
+            candidates[key] = found[0]
+
+        # 같은 키워드끼리 겹치는 후보는 편집 거리가 작은 것 하나만 남김
+        kept = []
+        taken = {}
+        for (term_id, start, end), cost in sorted(candidates.items(), key=lambda item: (item[1], item[0][1])):
+            spans = taken.setdefault(term_id, [])
+            if any(start < other_end and other_start < end for other_start, other_end in spans):
+                continue
+            spans.append((start, end))
+            kept.append((term_id, start, end, cost))
+
+        matches = []
+        for term_id, start, end, cost in kept:
+            group_id, term, _, _ = self.terms[term_id]
+            text_start, text_end = positions[start], positions[end - 1] + 1
+            matches.append({
+                "group": group_id,
+                "keyword": self.groups[group_id][0],
+                "term": term,
+                "start": text_start,
+                "end": text_end,
+                "text": text[text_start:text_end],
+                "edits": cost,
+            })
+        return sorted(matches, key=lambda match: (match["start"], match["group"]))
+
+    def groups_found(self, text: str) -> set:
+        """텍스트에 보이는 그룹 번호"""
+        return {match["group"] for match in self.find(text)}
+
+    def match(self, text: str, mode: str = "and") -> bool:
+        """mode: "and" (모든 그룹 포함) 또는 "or" (하나라도 포함), 그룹이 없으면 항상 False"""
+        if not self.groups:
+            return False
+        found = self.groups_found(text)
+        if mode == "and":
+            return len(found) == len(self.groups)
+        return bool(found)
+
+
+def capped_edits_warning(matcher: KeywordMatcher) -> Optional[str]:
+    """max_edits를 줬는데 키워드별 상한 때문에 모두 0이 되면 경고 문구 (아니면 None)"""
+    if matcher.max_edits <= 0 or matcher.effective_max_edits() > 0:
+        return None
+    keywords = [term for _, term, _, _ in matcher.terms]
+    hint = "" if matcher.jamo else ", --jamo를 쓰면 자모 단위로 길이를 셈"
+    return f"경고: --max-edits {matcher.max_edits}가 적용되지 않습니다 (키워드마다 길이의 1/3까지만 허용, {keywords}는 모두 0{hint})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 파일에서 키워드 그룹 위치 찾기")
+    parser.add_argument("files", nargs="+", help="텍스트 파일 (예: output/ocr/*.txt)")
+    parser.add_argument("--groups", nargs="+", default=None, help="키워드 그룹, 그룹 안의 동의어는 | 로 구분 (기본값: KEYWORD_GROUPS)")
+    parser.add_argument("--max-edits", type=int, default=0, help="허용 편집 거리 (기본값: 0)")
+    parser.add_argument("--jamo", action="store_true", help="한글을 자모 단위로 비교")
+    args = parser.parse_args()
+
+    if args.groups:
+        groups = [group.split("|") for group in args.groups]
+    else:
+        from pdf_to_image import KEYWORD_GROUPS
+        groups = KEYWORD_GROUPS
+
+    matcher = KeywordMatcher(groups, args.max_edits, args.jamo)
+    warning = capped_edits_warning(matcher)
+    if warning:
+        print(warning)
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        matches = matcher.find(text)
+        if not matches:
+            continue
+
+        status = "모두 포함" if len({match["group"] for match in matches}) == len(matcher.groups) else "일부 포함"
+        print(f"{path} ({status})")
+        for match in matches:
+            line = text.count("\n", 0, match["start"]) + 1
+            print(f"  [{match['keyword']}] {line}번째 줄 {match['text']!r} (편집 거리 {match['edits']})")
+
+
+if __name__ == "__main__":
+    main()
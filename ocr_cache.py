@@ -0,0 +1,146 @@
+"""
+OCR 결과 디스크 캐시 (SQLite)
+- 키: 문서 내용 해시, 페이지 번호, dpi, lang, Tesseract 설정
+- 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+
+CACHE_PATH = "output/ocr_cache.sqlite3"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def file_hash(path: str) -> str:
+    """파일 내용의 sha256 (경로나 수정 시각이 바뀌어도 같은 문서면 같은 키)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class OCRCache:
+    """페이지 단위 OCR 텍스트 캐시"""
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_bytes: 저장할 OCR 텍스트 총 크기 상한 (바이트)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS ocr (
+                doc_hash TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                dpi INTEGER NOT NULL,
+                lang TEXT NOT NULL,
+                config TEXT NOT NULL,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (doc_hash, page, dpi, lang, config)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_last_access ON ocr (last_access)")
+        self.conn.commit()
+
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr").fetchone()[0]
+
+    def get(self, doc_hash: str, page: int, dpi: int, lang: str, config: str):
+        """캐시된 텍스트, 없으면 None"""
+        return self.get_many(doc_hash, [page], dpi, lang, config).get(page)
+
+    def get_many(self, doc_hash: str, pages, dpi: int, lang: str, config: str) -> dict:
+        """
+        여러 페이지 한 번에 조회
+
+        Returns:
+            {페이지 번호: 텍스트} (캐시에 있는 페이지만)
+        """
+        pages = list(pages)
+        found = {}
+
+        # SQLite 변수 개수 제한 때문에 나눠서 조회
+        for i in range(0, len(pages), 500):
+            batch = pages[i:i + 500]
+            rows = self.conn.execute(
+                f"""
+                SELECT page, text FROM ocr
+                WHERE doc_hash = ? AND dpi = ? AND lang = ? AND config = ?
+                  AND page IN ({','.join('?' * len(batch))})
+                """,
+                [doc_hash, dpi, lang, config, *batch]
+            ).fetchall()
+            found.update(rows)
+
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                """
+                UPDATE ocr SET last_access = ?
+                WHERE doc_hash = ? AND page = ? AND dpi = ? AND lang = ? AND config = ?
+                """,
+                [(now, doc_hash, page, dpi, lang, config) for page in found]
+            )
+            self.conn.commit()
+
+        return found
+
+    def put(self, doc_hash: str, page: int, dpi: int, lang: str, config: str, text: str):
+        """OCR 결과 저장 (같은 키가 있으면 덮어씀)"""
+        size = len(text.encode("utf-8"))
+
+        old = self.conn.execute(
+            "SELECT size FROM ocr WHERE doc_hash = ? AND page = ? AND dpi = ? AND lang = ? AND config = ?",
+            (doc_hash, page, dpi, lang, config)
+        ).fetchone()
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO ocr VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (doc_hash, page, dpi, lang, config, text, size, time.time())
+        )
+        self.conn.commit()
+
+        self.total_bytes += size - (old[0] if old else 0)
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self, target_bytes: int = None):
+        """
+        오래 안 쓴 항목부터 삭제
+
+        Args:
+            target_bytes: 이 크기 이하가 될 때까지 삭제 (기본값: max_bytes의 90%)
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+
+        rows = self.conn.execute(
+            "SELECT rowid, size FROM ocr ORDER BY last_access"
+        ).fetchall()
+
+        removed = []
+        for rowid, size in rows:
+            if self.total_bytes <= target_bytes:
+                break
+            removed.append((rowid,))
+            self.total_bytes -= size
+
+        self.conn.executemany("DELETE FROM ocr WHERE rowid = ?", removed)
+        self.conn.commit()
+        return len(removed)
+
+    def close(self):
+        self.conn.close()
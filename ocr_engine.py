@@ -0,0 +1,252 @@
+"""
+OCR 엔진 추상화
+- pytesseract: 호출마다 tesseract 프로세스 실행 + traineddata 로드
+- tesserocr: C-API로 초기화한 엔진을 프로세스당 하나 유지하며 재사용
+- get_engine()은 (백엔드, lang, config)별로 프로세스 안에서 인스턴스를 하나만 만든다
+- 백엔드를 지정하지 않으면 OCR_BACKEND 환경변수를 따름 (워커 프로세스에도 그대로 전달됨)
+- image_to_data()는 두 백엔드 모두 같은 형식의 단어 목록 반환
+  [(단어, left, top, width, height, 신뢰도, 줄 번호)] (줄 번호는 페이지 안에서 0부터 증가)
+"""
+
+import os
+import re
+import time
+import argparse
+import statistics
+from typing import Dict, List, Tuple
+
+import pytesseract
+
+BACKENDS = ("auto", "pytesseract", "tesserocr")
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+#. tesserocr용 tessdata 폴더 (None이면 TESSDATA_PREFIX 환경변수 또는 기본 경로)
+TESSDATA_PATH = os.environ.get("TESSDATA_PREFIX")
+
+_engines = {}
+
+
+class PytesseractEngine:
+    """pytesseract (호출마다 subprocess)"""
+
+    name = "pytesseract"
+
+    def __init__(self, lang: str, config: str = ""):
+        self.lang = lang
+        self.config = config
+
+    def image_to_string(self, img) -> str:
+        return pytesseract.image_to_string(img, lang=self.lang, config=self.config)
+
+    def image_to_data(self, img) -> List[Tuple]:
+        data = pytesseract.image_to_data(img, lang=self.lang, config=self.config, output_type=pytesseract.Output.DICT)
+
+        words = []
+        line_keys = {}
+        for i, text in enumerate(data["text"]):
+            text = text.strip()
+            conf = float(data["conf"][i])
+            # conf -1은 블록/문단/줄 같은 단어가 아닌 행
+            if not text or conf < 0:
+                continue
+            key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            line = line_keys.setdefault(key, len(line_keys))
+            words.append((text, data["left"][i], data["top"][i], data["width"][i], data["height"][i], conf, line))
+        return words
+
+    def close(self):
+        pass
+
+
+class TesserocrEngine:
+    """tesserocr (한 번 초기화한 PyTessBaseAPI 재사용)"""
+
+    name = "tesserocr"
+
+    def __init__(self, lang: str, config: str = ""):
+        if tesserocr is None:
+            raise ImportError("tesserocr가 설치되어 있지 않습니다. (pip install tesserocr)")
+
+        self.lang = lang
+        self.config = config
+
+        options = parse_config(config)
+        kwargs = {"lang": lang}
+        if TESSDATA_PATH:
+            kwargs["path"] = TESSDATA_PATH
+        if "psm" in options:
+            kwargs["psm"] = options["psm"]
+        if "oem" in options:
+            kwargs["oem"] = options["oem"]
+
+        self.api = tesserocr.PyTessBaseAPI(**kwargs)
+        for name, value in options["variables"].items():
+            self.api.SetVariable(name, value)
+
+    def image_to_string(self, img) -> str:
+        self.api.SetImage(img)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, img) -> List[Tuple]:
+        self.api.SetImage(img)
+        self.api.Recognize()
+
+        words = []
+        line = -1
+        level = tesserocr.RIL.WORD
+        for word in tesserocr.iterate_level(self.api.GetIterator(), level):
+            if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line += 1
+            text = (word.GetUTF8Text(level) or "").strip()
+            if not text:
+                continue
+            left, top, right, bottom = word.BoundingBox(level)
+            words.append((text, left, top, right - left, bottom - top, word.Confidence(level), max(line, 0)))
+        return words
+
+    def close(self):
+        self.api.End()
+
+
+def parse_config(config: str) -> Dict:
+    """
+    Tesseract 명령줄 설정 문자열 파싱
+
+    Args:
+        config: 예) "--oem 1 --psm 6 -c preserve_interword_spaces=1"
+
+    Returns:
+        {"psm": int, "oem": int, "variables": {이름: 값}} (지정된 항목만)
+    """
+    options = {"variables": {}}
+
+    psm = re.search(r"--psm\s+(\d+)", config)
+    if psm:
+        options["psm"] = int(psm.group(1))
+
+    oem = re.search(r"--oem\s+(\d+)", config)
+    if oem:
+        options["oem"] = int(oem.group(1))
+
+    for name, value in re.findall(r"-c\s+(\w+)=(\S+)", config):
+        options["variables"][name] = value
+
+    return options
+
+
+def resolve_backend(backend: str = None) -> str:
+    if backend is None:
+        backend = os.environ.get("OCR_BACKEND", "auto")
+    if backend == "auto":
+        return "tesserocr" if tesserocr is not None else "pytesseract"
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 OCR 백엔드: {backend} (사용 가능: {', '.join(BACKENDS)})")
+    return backend
+
+
+def get_engine(lang: str, config: str = "", backend: str = None):
+    """
+    현재 프로세스의 OCR 엔진 (같은 설정이면 같은 인스턴스를 재사용)
+
+    Args:
+        lang: Tesseract 언어 (예: "kor", "kor+eng")
+        config: Tesseract 설정 문자열
+        backend: "auto" | "pytesseract" | "tesserocr" (None이면 OCR_BACKEND 환경변수, 없으면 "auto")
+    """
+    backend = resolve_backend(backend)
+    key = (backend, lang, config)
+
+    if key not in _engines:
+        _engines[key] = create_engine(lang, config, backend)
+    return _engines[key]
+
+
+def create_engine(lang: str, config: str = "", backend: str = None):
+    """
+    공유하지 않는 새 엔진 (스레드마다 따로 엔진이 필요할 때 사용, 다 쓰면 close() 호출)
+    """
+    backend = resolve_backend(backend)
+    engine_class = TesserocrEngine if backend == "tesserocr" else PytesseractEngine
+    return engine_class(lang, config)
+
+
+def set_default_backend(backend: str):
+    """이후 만들어지는 워커 프로세스까지 포함해 기본 백엔드 지정"""
+    os.environ["OCR_BACKEND"] = resolve_backend(backend)
+
+
+def close_engines():
+    for engine in _engines.values():
+        engine.close()
+    _engines.clear()
+
+
+def benchmark(image_paths: List[str], lang: str, config: str = "", backends=("pytesseract", "tesserocr"), repeat: int = 1) -> Dict:
+    """
+    백엔드별 페이지당 OCR 시간 측정
+
+    Returns:
+        {백엔드: {"pages", "init", "mean", "median", "min", "max"}} (초 단위)
+    """
+    from PIL import Image
+
+    images = [Image.open(path).convert("L") for path in image_paths]
+    results = {}
+
+    for backend in backends:
+        if backend == "tesserocr" and tesserocr is None:
+            print("tesserocr가 설치되어 있지 않아 건너뜁니다.")
+            continue
+
+        start = time.perf_counter()
+        engine = get_engine(lang, config, backend)
+        init_time = time.perf_counter() - start
+
+        timings = []
+        for _ in range(repeat):
+            for img in images:
+                start = time.perf_counter()
+                engine.image_to_string(img)
+                timings.append(time.perf_counter() - start)
+
+        results[backend] = {
+            "pages": len(timings),
+            "init": init_time,
+            "mean": statistics.mean(timings),
+            "median": statistics.median(timings),
+            "min": min(timings),
+            "max": max(timings),
+        }
+
+    close_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 백엔드별 페이지당 처리 시간 비교")
+    parser.add_argument("images", nargs="+", help="측정에 사용할 페이지 이미지")
+    parser.add_argument("--lang", default="kor", help="Tesseract 언어 (기본값: kor)")
+    parser.add_argument("--config", default="--oem 1 --psm 6", help="Tesseract 설정 (기본값: --oem 1 --psm 6)")
+    parser.add_argument("--repeat", type=int, default=3, help="이미지별 반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    results = benchmark(args.images, args.lang, args.config, repeat=args.repeat)
+
+    print(f"{'백엔드':<12} {'페이지':>6} {'초기화':>8} {'평균':>8} {'중앙값':>8} {'최소':>8} {'최대':>8}")
+    for backend, r in results.items():
+        print(
+            f"{backend:<12} {r['pages']:>6} {r['init']:>8.3f} {r['mean']:>8.3f} "
+            f"{r['median']:>8.3f} {r['min']:>8.3f} {r['max']:>8.3f}"
+        )
+
+    if "pytesseract" in results and "tesserocr" in results:
+        speedup = results["pytesseract"]["mean"] / results["tesserocr"]["mean"]
+        print(f"\ntesserocr가 페이지당 평균 {speedup:.2f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+OCR 텍스트 역색인 (SQLite)
+- (문서, 페이지) 단위로 OCR 텍스트 저장
+- 공백 제거(normalize) 후 글자 2-gram으로 색인 -> 한글 띄어쓰기/OCR 줄바꿈에 영향 없음
+- 키워드 그룹 AND / OR 검색, 새 PDF만 추가 색인
+"""
+
+import os
+import time
+import sqlite3
+import argparse
+from typing import List, Dict, Tuple
+
+from ocr_cache import OCRCache, CACHE_PATH, file_hash
+from pdf_to_image import (
+    KEYWORD_GROUPS,
+    MIN_TEXT_CHARS,
+    normalize,
+    get_page_count,
+    extract_text_layer,
+    has_usable_text,
+    ocr_pages,
+)
+
+INDEX_PATH = "output/ocr_index.sqlite3"
+NGRAM = 2
+
+
+def ngrams(text: str, n: int = NGRAM) -> set:
+    """normalize 된 텍스트의 글자 n-gram 집합"""
+    text = normalize(text)
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class OCRIndex:
+    """여러 PDF의 페이지 텍스트 역색인"""
+
+    def __init__(self, path: str = INDEX_PATH):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                doc_hash TEXT NOT NULL,
+                pages INTEGER NOT NULL,
+                indexed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                doc_id INTEGER NOT NULL,
+                page INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                normalized TEXT NOT NULL,
+                PRIMARY KEY (doc_id, page)
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                gram TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                page INTEGER NOT NULL,
+                PRIMARY KEY (gram, doc_id, page)
+            ) WITHOUT ROWID;
+            -- 다시 색인할 때 문서 하나의 postings를 지우는 용도 (기본 키는 gram이 앞이라 doc_id 조회에 못 씀)
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings(doc_id);
+        """)
+        self.conn.commit()
+
+    def is_indexed(self, path: str, doc_hash: str) -> bool:
+        """같은 경로, 같은 내용의 문서가 이미 색인되어 있는지"""
+        row = self.conn.execute(
+            "SELECT doc_hash FROM documents WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return row is not None and row[0] == doc_hash
+
+    def add_document(self, path: str, doc_hash: str, page_texts: Dict[int, str]):
+        """
+        문서 한 개 색인 (같은 경로가 있으면 지우고 다시 색인)
+
+        Args:
+            path: PDF 경로
+            doc_hash: PDF 내용 해시
+            page_texts: {페이지 번호: 텍스트}
+        """
+        path = os.path.abspath(path)
+
+        with self.conn:
+            self._remove(path)
+            cursor = self.conn.execute(
+                "INSERT INTO documents (path, doc_hash, pages, indexed_at) VALUES (?, ?, ?, ?)",
+                (path, doc_hash, len(page_texts), time.time())
+            )
+            doc_id = cursor.lastrowid
+
+            self.conn.executemany(
+                "INSERT INTO pages VALUES (?, ?, ?, ?)",
+                [(doc_id, page, text, normalize(text)) for page, text in page_texts.items()]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO postings VALUES (?, ?, ?)",
+                [
+                    (gram, doc_id, page)
+                    for page, text in page_texts.items()
+                    for gram in ngrams(text)
+                ]
+            )
+
+    def remove_document(self, path: str):
+        with self.conn:
+            self._remove(os.path.abspath(path))
+
+    def _remove(self, path: str):
+        row = self.conn.execute("SELECT doc_id FROM documents WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return
+        self.conn.execute("DELETE FROM postings WHERE doc_id = ?", row)
+        self.conn.execute("DELETE FROM pages WHERE doc_id = ?", row)
+        self.conn.execute("DELETE FROM documents WHERE doc_id = ?", row)
+
+    def _term_pages(self, term: str) -> set:
+        """키워드 하나가 들어 있는 (doc_id, page) 집합"""
+        term = normalize(term)
+        grams = ngrams(term)
+        if not grams:
+            return set()
+
+        if len(term) < NGRAM:
+            # n-gram보다 짧은 키워드는 색인으로 못 찾으므로 본문 검색
+            rows = self.conn.execute(
+                "SELECT doc_id, page FROM pages WHERE instr(normalized, ?) > 0", (term,)
+            ).fetchall()
+            return set(rows)
+
+        # 모든 n-gram이 들어 있는 페이지만 후보로 고른 뒤 원문에서 연속 여부 확인
+        rows = self.conn.execute(
+            f"""
+            SELECT p.doc_id, p.page FROM pages p
+            JOIN (
+                SELECT doc_id, page FROM postings
+                WHERE gram IN ({','.join('?' * len(grams))})
+                GROUP BY doc_id, page
+                HAVING COUNT(*) = ?
+            ) c ON p.doc_id = c.doc_id AND p.page = c.page
+            WHERE instr(p.normalized, ?) > 0
+            """,
+            [*grams, len(grams), term]
+        ).fetchall()
+        return set(rows)
+
+    def query(self, groups: List, mode: str = "and") -> List[Tuple[str, int]]:
+        """
+        키워드 그룹 검색
+
+        Args:
+            groups: 키워드 그룹 리스트. 각 그룹은 문자열 또는 동의어 리스트 (그룹 안은 OR)
+            mode: "and" (모든 그룹 포함) 또는 "or" (하나라도 포함)
+
+        Returns:
+            [(PDF 경로, 페이지 번호)] 경로, 페이지 순
+        """
+        matched = None
+        for group in groups:
+            terms = [group] if isinstance(group, str) else group
+            group_pages = set()
+            for term in terms:
+                group_pages |= self._term_pages(term)
+
+            if matched is None:
+                matched = group_pages
+            elif mode == "and":
+                matched &= group_pages
+            else:
+                matched |= group_pages
+
+        if not matched:
+            return []
+
+        paths = dict(self.conn.execute("SELECT doc_id, path FROM documents").fetchall())
+        return sorted((paths[doc_id], page) for doc_id, page in matched)
+
+    def documents(self) -> List[Tuple[str, int]]:
+        return self.conn.execute("SELECT path, pages FROM documents ORDER BY path").fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def collect_page_texts(pdf_path, dpi=300, chunk_size=10, workers=1, min_text_chars=MIN_TEXT_CHARS, cache=None):
+    """
+    색인할 페이지별 텍스트 수집 (텍스트 레이어 우선, 없으면 OCR)
+
+    Returns:
+        {페이지 번호: 텍스트}
+    """
+    last_page = get_page_count(pdf_path)
+    texts = {}
+    ocr_targets = []
+
+    for page, text in enumerate(extract_text_layer(pdf_path, last_page=last_page), start=1):
+        if has_usable_text(text, min_text_chars):
+            texts[page] = text
+        else:
+            ocr_targets.append(page)
+
+    for page, region_texts in ocr_pages(pdf_path, ocr_targets, dpi, chunk_size, workers, cache=cache).items():
+        texts[page] = "\n".join(region_texts)
+
+    return dict(sorted(texts.items()))
+
+
+def find_pdfs(paths: List[str]) -> List[str]:
+    pdfs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                pdfs.extend(os.path.join(root, f) for f in sorted(files) if f.lower().endswith(".pdf"))
+        else:
+            pdfs.append(path)
+    return pdfs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="OCR 텍스트 역색인",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # input 폴더의 PDF 색인 (이미 색인된 파일은 건너뜀)
+  python ocr_index.py add input --workers 4
+
+  # 모든 키워드 그룹이 들어간 페이지 검색 (기본값: KEYWORD_GROUPS)
+  python ocr_index.py query 병력 문진
+
+  # 하나라도 들어간 페이지 검색, 그룹 안의 동의어는 | 로 구분
+  python ocr_index.py query "병력|과거력" 문진 --any
+        '''
+    )
+    parser.add_argument("--index-path", default=INDEX_PATH, help=f"색인 파일 경로 (기본값: {INDEX_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="PDF 색인 추가")
+    add_parser.add_argument("paths", nargs="+", help="PDF 파일 또는 폴더")
+    add_parser.add_argument("--dpi", type=int, default=300, help="OCR 렌더링 해상도 (기본값: 300)")
+    add_parser.add_argument("--chunk-size", type=int, default=10, help="pdftoppm 한 번에 렌더링할 페이지 수 (기본값: 10)")
+    add_parser.add_argument("--workers", type=int, default=1, help="렌더링 + OCR 프로세스 수 (기본값: 1)")
+    add_parser.add_argument("--force", action="store_true", help="이미 색인된 PDF도 다시 색인")
+    add_parser.add_argument("--cache-path", default=CACHE_PATH, help=f"OCR 캐시 파일 경로 (기본값: {CACHE_PATH})")
+
+    query_parser = subparsers.add_parser("query", help="키워드 검색")
+    query_parser.add_argument("groups", nargs="*", help="키워드 그룹 (기본값: KEYWORD_GROUPS)")
+    query_parser.add_argument("--any", action="store_true", help="그룹 중 하나라도 포함된 페이지 검색 (기본값: 모두 포함)")
+
+    subparsers.add_parser("list", help="색인된 PDF 목록")
+
+    args = parser.parse_args()
+    index = OCRIndex(args.index_path)
+
+    try:
+        if args.command == "add":
+            cache = OCRCache(args.cache_path)
+            for pdf_path in find_pdfs(args.paths):
+                doc_hash = file_hash(pdf_path)
+                if not args.force and index.is_indexed(pdf_path, doc_hash):
+                    print(f"건너뜀 (이미 색인됨): {pdf_path}")
+                    continue
+
+                print(f"색인 중: {pdf_path}")
+                texts = collect_page_texts(pdf_path, args.dpi, args.chunk_size, args.workers, cache=cache)
+                index.add_document(pdf_path, doc_hash, texts)
+                print(f"색인 완료: {pdf_path} ({len(texts)}페이지)")
+            cache.close()
+
+        elif args.command == "query":
+            groups = [group.split("|") for group in args.groups] or KEYWORD_GROUPS
+            start = time.perf_counter()
+            results = index.query(groups, mode="or" if args.any else "and")
+            elapsed = (time.perf_counter() - start) * 1000
+
+            current = None
+            for path, page in results:
+                if path != current:
+                    current = path
+                    print(path)
+                print(f"  {page}페이지")
+            print(f"검색 결과: {len(results)}페이지 ({elapsed:.1f}ms)")
+
+        elif args.command == "list":
+            for path, pages in index.documents():
+                print(f"{path} ({pages}페이지)")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+OCR 단어 위치 저장소 (NumPy 열 단위 배열)
+- image_to_data 결과(단어, 상자, 신뢰도, 줄 번호)를 문서 + dpi별 .npz 파일 하나에 저장
+- 좌표는 페이지 크기 대비 비율로 저장 -> "상단 40%" 같은 영역 조건을 dpi와 상관없이 사용
+- 저장된 단어만으로 영역 / 최소 신뢰도 조건을 걸어 키워드 그룹 검색 (OCR 다시 안 함)
+"""
+
+import os
+import time
+import argparse
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ocr_cache import file_hash
+from ocr_engine import BACKENDS, get_engine, set_default_backend
+from keyword_matcher import KeywordMatcher, capped_edits_warning
+from pdf_to_image import (
+    KEYWORD_GROUPS,
+    OCR_LANG,
+    OCR_CONFIG,
+    RENDER,
+    normalize,
+    iter_pages,
+    group_ranges,
+    get_page_count,
+    _run_ranges,
+)
+
+LAYOUT_DIR = "output/layout"
+
+#. 단어별 열 (text 외에는 모두 숫자 배열)
+COLUMNS = ("page", "line", "x0", "y0", "x1", "y1", "conf", "text")
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    columns = {name: np.zeros(0, dtype=np.float32) for name in ("x0", "y0", "x1", "y1", "conf")}
+    columns["page"] = np.zeros(0, dtype=np.int32)
+    columns["line"] = np.zeros(0, dtype=np.int32)
+    columns["text"] = np.zeros(0, dtype="<U1")
+    columns["pages"] = np.zeros(0, dtype=np.int32)
+    return columns
+
+
+def words_to_columns(results) -> Dict[str, np.ndarray]:
+    """
+    페이지별 단어 목록을 열 단위 배열로 변환
+
+    Args:
+        results: [(페이지, (가로, 세로), [(단어, left, top, width, height, 신뢰도, 줄 번호)])]
+    """
+    rows = []
+    pages = []
+    for page, (width, height), words in results:
+        pages.append(page)
+        for text, left, top, w, h, conf, line in words:
+            rows.append((page, line, left / width, top / height, (left + w) / width, (top + h) / height, conf, text))
+
+    columns = _empty_columns()
+    columns["pages"] = np.array(sorted(pages), dtype=np.int32)
+    if not rows:
+        return columns
+
+    page, line, x0, y0, x1, y1, conf, text = zip(*rows)
+    columns.update({
+        "page": np.array(page, dtype=np.int32),
+        "line": np.array(line, dtype=np.int32),
+        "x0": np.array(x0, dtype=np.float32),
+        "y0": np.array(y0, dtype=np.float32),
+        "x1": np.array(x1, dtype=np.float32),
+        "y1": np.array(y1, dtype=np.float32),
+        "conf": np.array(conf, dtype=np.float32),
+        "text": np.array(text),
+    })
+    return columns
+
+
+def merge_columns(old: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """두 저장본 합치기 (new에 있는 페이지는 new 쪽을 사용, 페이지 순으로 정렬)"""
+    keep = ~np.isin(old["page"], new["pages"])
+    merged = {name: np.concatenate([old[name][keep], new[name]]) for name in COLUMNS}
+
+    # 같은 페이지 안에서는 원래 단어 순서 유지
+    order = np.argsort(merged["page"], kind="stable")
+    merged = {name: values[order] for name, values in merged.items()}
+    merged["pages"] = np.union1d(old["pages"], new["pages"]).astype(np.int32)
+    return merged
+
+
+class LayoutStore:
+    """문서별 단어 위치 .npz 파일 모음"""
+
+    def __init__(self, directory: str = LAYOUT_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def path(self, doc_hash: str, dpi: int) -> str:
+        return os.path.join(self.directory, f"{doc_hash[:16]}_{dpi}dpi.npz")
+
+    def load(self, doc_hash: str, dpi: int, config: str = OCR_CONFIG) -> Optional[Dict[str, np.ndarray]]:
+        """저장된 열 배열 (없거나 다른 OCR 설정으로 만든 것이면 None)"""
+        path = self.path(doc_hash, dpi)
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path) as data:
+            if str(data["config"]) != config:
+                return None
+            return {name: data[name] for name in (*COLUMNS, "pages")}
+
+    def save(self, doc_hash: str, dpi: int, columns: Dict[str, np.ndarray], config: str = OCR_CONFIG):
+        # 중간에 끊겨도 기존 파일이 깨지지 않도록 임시 파일에 쓰고 교체
+        path = self.path(doc_hash, dpi)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, config=np.array(config), **columns)
+        os.replace(tmp_path, path)
+
+
+#. 워커 프로세스에서 실행: 한 구간을 렌더링 + image_to_data 하고 [(페이지, (가로, 세로), 단어 목록, 오류)] 반환
+def _layout_range(pdf_path, start, end, dpi, config, render):
+    engine = get_engine(OCR_LANG, config)
+    results = []
+    try:
+        for page, img in iter_pages(
+            pdf_path,
+            dpi=dpi,
+            first_page=start,
+            last_page=end,
+            chunk_size=end - start + 1,
+            mode=render["mode"],
+            to_files=render["to_files"]
+        ):
+            try:
+                results.append((page, img.size, engine.image_to_data(img.convert("L")), None))
+            except Exception as e:
+                results.append((page, img.size, [], f"OCR 실패: {e}"))
+    except Exception as e:
+        done = {page for page, _, _, _ in results}
+        for page in range(start, end + 1):
+            if page not in done:
+                results.append((page, (1, 1), [], f"렌더링 실패: {e}"))
+    return results
+
+
+def build_layout(pdf_path, pages=None, dpi=300, chunk_size=10, workers=1, config=OCR_CONFIG, render=None, store=None):
+    """
+    저장되지 않은 페이지만 OCR 해서 단어 위치 저장
+
+    Args:
+        pages: OCR 할 페이지 번호 목록 (None이면 전체)
+        render: 렌더링 설정 (pdf_to_image.RENDER 형식, 좌표가 바뀌는 preprocess는 사용 안 함)
+        store: LayoutStore (None이면 기본 폴더)
+
+    Returns:
+        문서 전체 열 배열
+    """
+    store = store or LayoutStore()
+    render = {**RENDER, **(render or {})}
+    doc_hash = file_hash(pdf_path)
+
+    if pages is None:
+        pages = range(1, get_page_count(pdf_path) + 1)
+    columns = store.load(doc_hash, dpi, config) or _empty_columns()
+    todo = [page for page in pages if page not in set(columns["pages"].tolist())]
+    if not todo:
+        return columns
+
+    results = []
+    for page, size, words, error in _run_ranges(
+        _layout_range, pdf_path, group_ranges(todo, chunk_size), workers, dpi, config, render
+    ):
+        if error:
+            print(f"{page}페이지 {error}")
+            continue
+        results.append((page, size, words))
+
+    columns = merge_columns(columns, words_to_columns(results))
+    store.save(doc_hash, dpi, columns, config)
+    return columns
+
+
+def select_words(columns: Dict[str, np.ndarray], regions=None, min_conf: float = 0.0) -> np.ndarray:
+    """
+    조건에 맞는 단어 마스크
+
+    Args:
+        regions: [(위 비율, 아래 비율)] 또는 [(위, 아래, 왼쪽, 오른쪽)], 단어 상자 중심 기준 (None이면 페이지 전체)
+        min_conf: 최소 신뢰도 (0~100)
+    """
+    mask = columns["conf"] >= min_conf
+    if not regions:
+        return mask
+
+    cx = (columns["x0"] + columns["x1"]) / 2
+    cy = (columns["y0"] + columns["y1"]) / 2
+    in_region = np.zeros(len(mask), dtype=bool)
+    for region in regions:
+        top, bottom = region[:2]
+        left, right = region[2:] if len(region) == 4 else (0.0, 1.0)
+        in_region |= (cy >= top) & (cy < bottom) & (cx >= left) & (cx < right)
+    return mask & in_region
+
+
+def page_texts(columns: Dict[str, np.ndarray], regions=None, min_conf: float = 0.0) -> Dict[int, str]:
+    """조건에 맞는 단어만으로 다시 만든 페이지별 텍스트 (저장된 모든 페이지 포함)"""
+    mask = select_words(columns, regions, min_conf)
+    lines = defaultdict(list)
+    for page, line, text in zip(columns["page"][mask].tolist(), columns["line"][mask].tolist(), columns["text"][mask].tolist()):
+        lines[(page, line)].append(text)
+
+    texts = {page: [] for page in columns["pages"].tolist()}
+    for (page, _), words in lines.items():
+        texts[page].append(" ".join(words))
+    return {page: "\n".join(page_lines) for page, page_lines in texts.items()}
+
+
+def match_pages(
+    columns: Dict[str, np.ndarray],
+    groups=KEYWORD_GROUPS,
+    regions=None,
+    min_conf: float = 0.0,
+    mode: str = "and",
+    max_edits: int = 0,
+    jamo: bool = False,
+) -> List[int]:
+    """
+    저장된 단어 위치로 키워드 그룹 검색
+
+    Args:
+        groups: 키워드 그룹 리스트. 각 그룹은 문자열 또는 동의어 리스트 (그룹 안은 OR)
+        regions: select_words와 같음
+        min_conf: 최소 신뢰도
+        mode: "and" (모든 그룹 포함) 또는 "or" (하나라도 포함)
+        max_edits, jamo: keyword_matcher.KeywordMatcher 설정
+    """
+    matcher = KeywordMatcher(groups, max_edits, jamo)
+    return sorted(page for page, text in page_texts(columns, regions, min_conf).items() if matcher.match(text, mode))
+
+
+def keyword_boxes(columns: Dict[str, np.ndarray], term: str, page: int = None, regions=None, min_conf: float = 0.0) -> List[Dict]:
+    """키워드가 들어 있는 단어의 위치 [{"page", "text", "box": (x0, y0, x1, y1), "conf"}]"""
+    mask = select_words(columns, regions, min_conf) & (np.char.find(columns["text"], normalize(term)) >= 0)
+    if page is not None:
+        mask &= columns["page"] == page
+
+    return [
+        {"page": int(p), "text": str(text), "box": (float(x0), float(y0), float(x1), float(y1)), "conf": float(conf)}
+        for p, text, x0, y0, x1, y1, conf in zip(
+            columns["page"][mask], columns["text"][mask],
+            columns["x0"][mask], columns["y0"][mask], columns["x1"][mask], columns["y1"][mask],
+            columns["conf"][mask],
+        )
+    ]
+
+
+def _parse_region(value: str):
+    region = tuple(float(v) for v in value.split(","))
+    if len(region) not in (2, 4):
+        raise argparse.ArgumentTypeError("영역은 '위,아래' 또는 '위,아래,왼쪽,오른쪽' 비율로 지정하세요. (예: 0,0.4)")
+    return region
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="OCR 단어 위치 저장 / 영역 조건 키워드 검색",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 단어 위치 저장 (이미 저장된 페이지는 건너뜀)
+  python ocr_layout.py build input/animal.pdf --workers 4
+
+  # 페이지 상단 40%에 병력, 문진이 모두 있는 페이지 (신뢰도 60 이상 단어만)
+  python ocr_layout.py query input/animal.pdf --region 0,0.4 --min-conf 60
+
+  # 그룹 안의 동의어는 | 로 구분
+  python ocr_layout.py query input/animal.pdf "병력|과거력" 문진 --region 0,0.3
+        '''
+    )
+    parser.add_argument("--layout-dir", default=LAYOUT_DIR, help=f"저장 폴더 (기본값: {LAYOUT_DIR})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="PDF 단어 위치 저장")
+    build_parser.add_argument("pdf", help="PDF 경로")
+    build_parser.add_argument("--dpi", type=int, default=300, help="렌더링 해상도 (기본값: 300)")
+    build_parser.add_argument("--chunk-size", type=int, default=10, help="pdftoppm 한 번에 렌더링할 페이지 수 (기본값: 10)")
+    build_parser.add_argument("--workers", type=int, default=1, help="렌더링 + OCR 프로세스 수 (기본값: 1)")
+    build_parser.add_argument("--ocr-backend", choices=BACKENDS, default="auto", help="OCR 엔진 (기본값: auto)")
+
+    query_parser = subparsers.add_parser("query", help="저장된 단어 위치로 키워드 검색")
+    query_parser.add_argument("pdf", help="PDF 경로")
+    query_parser.add_argument("groups", nargs="*", help="키워드 그룹 (기본값: KEYWORD_GROUPS)")
+    query_parser.add_argument("--dpi", type=int, default=300, help="저장할 때 사용한 해상도 (기본값: 300)")
+    query_parser.add_argument("--region", type=_parse_region, action="append", default=None, help="검색 영역 비율 '위,아래[,왼쪽,오른쪽]' (여러 번 지정 가능)")
+    query_parser.add_argument("--min-conf", type=float, default=0.0, help="이 신뢰도 미만 단어는 무시 (0~100, 기본값: 0)")
+    query_parser.add_argument("--any", action="store_true", help="그룹 중 하나라도 포함된 페이지 검색 (기본값: 모두 포함)")
+    query_parser.add_argument("--max-edits", type=int, default=0, help="허용 편집 거리 (기본값: 0)")
+    query_parser.add_argument("--jamo", action="store_true", help="한글을 자모 단위로 비교")
+    query_parser.add_argument("--boxes", action="store_true", help="키워드가 있는 단어의 위치도 출력")
+
+    args = parser.parse_args()
+    store = LayoutStore(args.layout_dir)
+
+    if args.command == "build":
+        set_default_backend(args.ocr_backend)
+        start = time.perf_counter()
+        columns = build_layout(args.pdf, dpi=args.dpi, chunk_size=args.chunk_size, workers=args.workers, store=store)
+        print(f"저장 완료: {len(columns['pages'])}페이지, 단어 {len(columns['text'])}개 ({time.perf_counter() - start:.1f}초)")
+
+    elif args.command == "query":
+        columns = store.load(file_hash(args.pdf), args.dpi)
+        if columns is None:
+            parser.error(f"저장된 단어 위치가 없습니다. 먼저 실행하세요: python ocr_layout.py build {args.pdf} --dpi {args.dpi}")
+
+        groups = [group.split("|") for group in args.groups] or KEYWORD_GROUPS
+        warning = capped_edits_warning(KeywordMatcher(groups, args.max_edits, args.jamo))
+        if warning:
+            print(warning)
+        start = time.perf_counter()
+        pages = match_pages(
+            columns, groups, args.region, args.min_conf,
+            mode="or" if args.any else "and", max_edits=args.max_edits, jamo=args.jamo
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+
+        for page in pages:
+            print(f"{page}페이지")
+            if args.boxes:
+                for group in groups:
+                    for term in ([group] if isinstance(group, str) else group):
+                        for hit in keyword_boxes(columns, term, page, args.region, args.min_conf):
+                            x0, y0, x1, y1 = hit["box"]
+                            print(f"  {hit['text']} ({x0:.3f}, {y0:.3f}) - ({x1:.3f}, {y1:.3f}) 신뢰도 {hit['conf']:.0f}")
+        print(f"검색 결과: {len(pages)}페이지 ({elapsed:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,18 @@
-from pdf2image import convert_from_path
-import pytesseract
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
 import re
 import os
+import json
+import argparse
+import tempfile
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from ocr_cache import OCRCache, CACHE_PATH, DEFAULT_MAX_BYTES, file_hash
+from ocr_engine import BACKENDS, get_engine, set_default_backend
+from preprocess import PREPROCESS, preprocess_image, describe as describe_preprocess
+from scan_journal import ScanJournal, journal_path
+from keyword_matcher import KeywordMatcher, capped_edits_warning
 
 PDF_PATH = "input/animal.pdf"
 OUTPUT_DIR = "output/image"
@@ -12,6 +23,49 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 #. 특정 키워드 추출
 KEYWORD_GROUPS = ["병력", "문진"]
 
+#. 키워드 매칭 설정 (max_edits: 허용 편집 거리, jamo: 한글을 자모 단위로 비교)
+MATCH = {"max_edits": 0, "jamo": False}
+_matcher = None
+
+#. 텍스트 레이어에 한글/영문/숫자가 이 개수 이상 있어야 OCR 없이 사용
+MIN_TEXT_CHARS = 20
+
+OCR_LANG = "kor"
+OCR_CONFIG = "--oem 1 --psm 6"
+
+#. 캐시에 영역별 텍스트를 한 문자열로 저장할 때 구분자 (Tesseract 출력의 \f와 겹치지 않게)
+REGION_SEPARATOR = "\x1e"
+
+#. 페이지 상단 영역 (세로 비율 기준 (시작, 끝))
+HEADER_REGIONS = [(0.0, 0.4)]
+
+#. 1단계(저해상도 사전 검사) 기본 설정
+#. min_hits: 헤더 OCR 결과에 KEYWORD_GROUPS 중 몇 개 이상 보이면 후보로 볼지
+PRESCREEN = {
+    "dpi": 100,
+    "regions": HEADER_REGIONS,
+    "min_hits": 1,
+    "config": OCR_CONFIG,
+}
+
+#. 렌더링 기본 설정
+#. mode: "rgb" | "gray" | "mono" (gray/mono는 pdftoppm이 바로 흑백으로 렌더링 -> 페이지당 메모리 1/3)
+#. to_files: 청크를 임시 파일로 렌더링하고 한 장씩 열어서 사용 (메모리에는 워커당 한 장만 올라감)
+#. memory_budget_mb: 렌더링된 페이지가 차지할 메모리 상한 (None이면 제한 없음)
+#. preprocess: OCR 전 전처리 설정 (preprocess.PREPROCESS 형식, None이면 흑백 변환만)
+RENDER = {
+    "mode": "rgb",
+    "to_files": False,
+    "memory_budget_mb": None,
+    "preprocess": None,
+}
+RENDER_MODES = ("rgb", "gray", "mono")
+
+#. -mono는 하프톤 스크리닝이 들어가서 작은 글씨가 많은 문서는 gray가 OCR 결과가 더 좋음
+_PDFTOPPM_FLAGS = {"rgb": [], "gray": ["-gray"], "mono": ["-mono"]}
+#. PIL은 "1" 모드도 픽셀당 1바이트로 들고 있음
+_BYTES_PER_PIXEL = {"rgb": 3, "gray": 1, "mono": 1}
+
 def loose_match(text: str) -> bool:
     text = normalize(text)
     return (
@@ -22,89 +76,691 @@ def loose_match(text: str) -> bool:
 def normalize(text: str) -> str:
     return re.sub(r"\s+", "", text)
 
-def get_candidate_regions(img):
+#. regions: [(위 비율, 아래 비율), ...], None이면 페이지 전체
+def get_candidate_regions(img, regions=None):
+    if not regions:
+        return [img]
+
     w, h = img.size
     return [
-        # img.crop((0, 0, w, int(h * 0.4))),
-        # img.crop((0, int(h * 0.3), w, int(h * 0.7))),
-        img
+        img.crop((0, int(h * top), w, int(h * bottom)))
+        for top, bottom in regions
     ]
 
-def page_contains_keyword(img):
-    regions = get_candidate_regions(img)
-    
-    for i, region in enumerate(regions):
+def ocr_region_texts(img, regions=None, config=OCR_CONFIG):
+    engine = get_engine(OCR_LANG, config)
+    for region in get_candidate_regions(img, regions):
         region = region.convert("L")
-        text = pytesseract.image_to_string(
-            region,
-            lang="kor",
-            config="--oem 1 --psm 6"
-        )
+        yield engine.image_to_string(region)
+
+def page_contains_keyword(img, regions=None):
+    for text in ocr_region_texts(img, regions):
 
-        # print(f"[OCR] region {i}:", text[:50]) 
+        # print(f"[OCR] region:", text[:50])
 
         if loose_match(text):
             return True
     return False
 
+#. KEYWORD_GROUPS 전체를 한 번에 찾는 매처 (MATCH 설정이 바뀌면 다시 만듦)
+def get_matcher():
+    global _matcher
+    if _matcher is None or (_matcher.max_edits, _matcher.jamo) != (MATCH["max_edits"], MATCH["jamo"]):
+        _matcher = KeywordMatcher(KEYWORD_GROUPS, **MATCH)
+    return _matcher
+
+def set_match_options(max_edits=0, jamo=False):
+    MATCH.update(max_edits=max_edits, jamo=jamo)
+
+#. 텍스트에 보이는 KEYWORD_GROUPS 개수
+def keyword_hits(text: str) -> int:
+    return len(get_matcher().groups_found(text))
+
 def loose_match(text: str) -> bool:
-    text = normalize(text)
-    return all(group in text for group in KEYWORD_GROUPS)
+    return get_matcher().match(text)
+
+#. 키워드 그룹별 위치 [{"group", "keyword", "start", "end", "text", "edits"}]
+def keyword_matches(text: str):
+    return get_matcher().find(text)
+
+def get_page_count(pdf_path):
+    info = pdfinfo_from_path(pdf_path, poppler_path=POPPLER_PATH)
+    return int(info["Pages"])
+
+def _last_page(pdf_path, total_pages=None):
+    last_page = get_page_count(pdf_path)
+    if total_pages is not None:
+        last_page = min(last_page, total_pages)
+    return last_page
+
+def _poppler_bin(name):
+    if POPPLER_PATH and os.path.isdir(POPPLER_PATH):
+        return os.path.join(POPPLER_PATH, name)
+    return name
+
+#. pdftotext 한 번 실행으로 페이지별 텍스트 레이어 추출 (페이지 구분자: \f)
+def extract_text_layer(pdf_path, first_page=1, last_page=None):
+    if last_page is None:
+        last_page = get_page_count(pdf_path)
+
+    result = subprocess.run(
+        [
+            _poppler_bin("pdftotext"),
+            "-f", str(first_page),
+            "-l", str(last_page),
+            "-enc", "UTF-8",
+            "-layout",
+            pdf_path,
+            "-"
+        ],
+        capture_output=True,
+        check=True
+    )
+    texts = result.stdout.decode("utf-8", errors="ignore").split("\f")
 
-def find_target_pages(pdf_path, total_pages=300, dpi=300):
-    pages = []
+    count = last_page - first_page + 1
+    texts = texts[:count]
+    texts += [""] * (count - len(texts))
+    return texts
+
+#. 첫 페이지 크기 기준 렌더링된 페이지 한 장의 메모리 크기 (바이트)
+def page_bytes(pdf_path, dpi, mode="rgb"):
+    info = pdfinfo_from_path(pdf_path, poppler_path=POPPLER_PATH)
+    # 예: "595.276 x 841.89 pts (A4)"
+    width, height = re.findall(r"[\d.]+", info["Page size"])[:2]
+    pixels = int(float(width) / 72 * dpi) * int(float(height) / 72 * dpi)
+    return pixels * _BYTES_PER_PIXEL[mode]
+
+#. 메모리 예산 안에 들어가도록 워커 수와 청크 크기 조정
+#. 메모리에 렌더링하면 워커마다 청크 하나가, 임시 파일로 렌더링하면 워커마다 한 장이 올라감
+def fit_memory_budget(pdf_path, dpi, render, chunk_size, workers):
+    resident = int(render["memory_budget_mb"] * 1024 * 1024 // page_bytes(pdf_path, dpi, render["mode"]))
+    resident = max(1, resident)
+
+    workers = min(workers, resident)
+    if not render["to_files"]:
+        chunk_size = min(chunk_size, max(1, resident // workers))
+    return chunk_size, workers
+
+#. 폰트 인코딩이 깨진 PDF는 기호만 잔뜩 나오므로 한글/영문/숫자만 센다
+def has_usable_text(text, min_chars=MIN_TEXT_CHARS):
+    return len(re.sub(r"[^0-9A-Za-z가-힣]", "", text)) >= min_chars
+
+#. pdftoppm으로 한 구간을 임시 폴더에 렌더링하고 한 장씩 열어서 반환
+#. 무압축 PPM/PGM/PBM이라 PIL이 파일을 메모리 매핑해서 읽음
+#. 반환한 이미지는 다음 페이지로 넘어가면 닫고 파일도 지우므로 그 전에 처리를 끝내야 함
+def _iter_rendered_files(pdf_path, start, end, dpi, mode):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        subprocess.run(
+            [
+                _poppler_bin("pdftoppm"),
+                "-r", str(dpi),
+                "-f", str(start),
+                "-l", str(end),
+                *_PDFTOPPM_FLAGS[mode],
+                pdf_path,
+                os.path.join(tmp_dir, "page")
+            ],
+            capture_output=True,
+            check=True
+        )
+
+        # 파일명 숫자는 자릿수가 맞춰져 있어서 이름순 = 페이지순
+        for page, filename in zip(range(start, end + 1), sorted(os.listdir(tmp_dir))):
+            path = os.path.join(tmp_dir, filename)
+            img = Image.open(path)
+            try:
+                yield page, img
+            finally:
+                img.close()
+                os.remove(path)
+
+#. 청크 단위로 렌더링하여 (페이지 번호, 이미지)를 순서대로 반환
+#. pdftoppm 프로세스는 청크당 한 번만 실행됨
+#. mono는 pdf2image가 지원하지 않아 항상 임시 파일로 렌더링
+def iter_pages(pdf_path, dpi=300, first_page=1, last_page=None, chunk_size=10, mode="rgb", to_files=False):
+    if last_page is None:
+        last_page = get_page_count(pdf_path)
+
+    for start in range(first_page, last_page + 1, chunk_size):
+        end = min(start + chunk_size - 1, last_page)
+
+        if to_files or mode == "mono":
+            yield from _iter_rendered_files(pdf_path, start, end, dpi, mode)
+            continue
 
-    for page in range(1, total_pages + 1):
         images = convert_from_path(
             pdf_path,
             dpi=dpi,
-            first_page=page,
-            last_page=page,
+            first_page=start,
+            last_page=end,
+            grayscale=(mode == "gray"),
             poppler_path=POPPLER_PATH
         )
-        img = images[0]
 
-        if page_contains_keyword(img):
-            pages.append(page)
+        page = start
+        while images:
+            # 넘겨준 이미지는 리스트에서 빼서 처리 후 바로 해제되게 함
+            yield page, images.pop(0)
+            page += 1
+
+#. 페이지 이미지 저장 설정
+#. format: "png" | "webp" | "tiff"
+#. png_level: PNG zlib 압축 수준 0~9 (낮을수록 빠르고 파일이 큼, PIL 기본값은 6)
+#. webp_quality / webp_lossless: WebP 화질 (0~100) / 무손실 여부
+#. mode: 렌더링 색상 모드 (tiff는 rgb를 지정해도 흑백으로 저장, mono면 1비트 Group 4 압축)
+EXPORT = {
+    "format": "png",
+    "png_level": 1,
+    "webp_quality": 80,
+    "webp_lossless": False,
+    "mode": "rgb",
+}
+EXPORT_FORMATS = ("png", "webp", "tiff")
+
+#. 띄엄띄엄 있는 페이지 목록을 연속 구간으로 묶음 (구간 하나는 최대 chunk_size 페이지)
+def group_ranges(pages, chunk_size):
+    ranges = []
+    for page in sorted(pages):
+        if ranges and ranges[-1][1] == page - 1 and page - ranges[-1][0] < chunk_size:
+            ranges[-1] = (ranges[-1][0], page)
+        else:
+            ranges.append((page, page))
+    return ranges
+
+def _ocr_page(page, img, regions, config, render):
+    try:
+        if render["preprocess"]:
+            img = preprocess_image(img, **render["preprocess"])
+        return page, list(ocr_region_texts(img, regions, config)), None
+    except Exception as e:
+        return page, None, f"OCR 실패: {e}"
+
+#. 워커 프로세스에서 실행: 한 구간을 렌더링 + OCR 하고 [(페이지, [영역별 텍스트], 오류)] 반환
+#. 실패한 페이지는 텍스트 대신 None과 실패 사유를 반환 (구간 전체를 중단하지 않음)
+def _ocr_range(pdf_path, start, end, dpi, regions, config, render):
+    results = []
+    try:
+        for page, img in iter_pages(
+            pdf_path,
+            dpi=dpi,
+            first_page=start,
+            last_page=end,
+            chunk_size=end - start + 1,
+            mode=render["mode"],
+            to_files=render["to_files"]
+        ):
+            results.append(_ocr_page(page, img, regions, config, render))
+    except Exception as e:
+        done = {page for page, _, _ in results}
+        remaining = [page for page in range(start, end + 1) if page not in done]
+        if end > start:
+            # 렌더링 실패: 남은 페이지를 한 장씩 다시 렌더링해서 문제 페이지만 실패로 남김
+            for page in remaining:
+                results.extend(_ocr_range(pdf_path, page, page, dpi, regions, config, render))
+        else:
+            results.extend((page, None, f"렌더링 실패: {e}") for page in remaining)
+    return results
+
+#. 동시에 제출하는 구간 수를 workers * 2로 제한 -> 메모리에 올라가는 이미지 수가 일정함
+#. 결과는 제출한 순서대로 받기 때문에 페이지 순서가 유지됨
+def _run_parallel(task, pdf_path, ranges, workers, *args):
+    remaining = iter(ranges)
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start, end in remaining:
+            pending.append((end, pool.submit(task, pdf_path, start, end, *args)))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            end, future = pending.popleft()
+            yield from future.result()
+            print(f"{end}/{ranges[-1][1]}페이지 처리 중...")
+
+            next_range = next(remaining, None)
+            if next_range is not None:
+                start, next_end = next_range
+                pending.append((next_end, pool.submit(task, pdf_path, start, next_end, *args)))
+
+def _run_ranges(task, pdf_path, ranges, workers, *args):
+    if not ranges:
+        return
+    if workers > 1:
+        yield from _run_parallel(task, pdf_path, ranges, workers, *args)
+        return
+
+    for start, end in ranges:
+        yield from task(pdf_path, start, end, *args)
+        print(f"{end}/{ranges[-1][1]}페이지 처리 중...")
+
+#. 캐시 키에 들어가는 설정 문자열 (같은 dpi라도 OCR 영역이나 렌더링 모드가 다르면 결과가 다름)
+def cache_config_key(config, regions, mode="rgb", preprocess=None):
+    key = config
+    if regions:
+        key += f" regions={regions}"
+    if mode == "gray":
+        key += " grayscale"
+    elif mode != "rgb":
+        key += f" {mode}"
+    if preprocess:
+        key += f" {describe_preprocess(preprocess)}"
+    return key
+
+#. 페이지별 OCR 텍스트 {페이지: [영역별 텍스트]} (실패한 페이지는 빠짐)
+#. cache가 있으면 캐시에 없는 페이지만 렌더링 + OCR 하고, 끝난 페이지는 바로 캐시에 저장
+#. on_page(페이지, [영역별 텍스트] 또는 None, 오류)는 페이지가 끝날 때마다 호출
+def ocr_pages(pdf_path, pages, dpi=300, chunk_size=10, workers=1, regions=None, config=OCR_CONFIG, render=None, cache=None, on_page=None):
+    pages = list(pages)
+    texts = {}
+    render = {**RENDER, **(render or {})}
+
+    if cache is not None:
+        doc_hash = file_hash(pdf_path)
+        cache_config = cache_config_key(config, regions, render["mode"], render["preprocess"])
+        for page, text in cache.get_many(doc_hash, pages, dpi, OCR_LANG, cache_config).items():
+            texts[page] = text.split(REGION_SEPARATOR)
+        if texts:
+            print(f"OCR 캐시 사용: {len(texts)}/{len(pages)}페이지")
+
+    if on_page is not None:
+        for page in pages:
+            if page in texts:
+                on_page(page, texts[page], None)
+
+    todo = [page for page in pages if page not in texts]
+    if todo and render["memory_budget_mb"]:
+        chunk_size, workers = fit_memory_budget(pdf_path, dpi, render, chunk_size, workers)
+        print(f"메모리 예산 {render['memory_budget_mb']}MB: 워커 {workers}개, 청크 {chunk_size}페이지")
+
+    for page, region_texts, error in _run_ranges(
+        _ocr_range, pdf_path, group_ranges(todo, chunk_size), workers, dpi, regions, config, render
+    ):
+        if error:
+            print(f"{page}페이지 {error}")
+        else:
+            texts[page] = region_texts
+            if cache is not None:
+                cache.put(doc_hash, page, dpi, OCR_LANG, cache_config, REGION_SEPARATOR.join(region_texts))
+
+        if on_page is not None:
+            on_page(page, region_texts, error)
+
+    return texts
+
+#. 지정한 페이지들을 OCR 해서 키워드가 있는 페이지 반환
+#. prescreen 설정이 있으면 저해상도 헤더 검사를 통과한 페이지만 전체 해상도로 다시 OCR
+#. journal이 있으면 이미 끝난 페이지는 건너뛰고, 페이지 결과(실패 포함)를 끝나는 대로 기록
+def scan_pages(pdf_path, pages, dpi=300, chunk_size=10, workers=1, prescreen=None, cache=None, render=None, journal=None):
+    all_pages = list(pages)
+    pages = all_pages
+    render = {**RENDER, **(render or {})}
+
+    if journal is not None:
+        pages = [page for page in all_pages if not journal.is_done(page)]
+        if len(pages) < len(all_pages):
+            print(f"진행 기록 사용: {len(all_pages) - len(pages)}/{len(all_pages)}페이지 완료 (마지막 완료 페이지: {journal.last_completed()})")
+
+    if prescreen:
+        print(f"1단계: {prescreen['dpi']}dpi 헤더 사전 검사")
+        prescreen_render = {**render, "mode": "mono" if render["mode"] == "mono" else "gray"}
+        texts = ocr_pages(
+            pdf_path, pages, prescreen["dpi"], chunk_size, workers,
+            regions=prescreen["regions"], config=prescreen["config"], render=prescreen_render, cache=cache
+        )
+        # 1단계에서 실패한 페이지는 후보에서 뺄 근거가 없으므로 2단계로 넘김
+        candidates = [
+            page for page in pages
+            if page not in texts or any(keyword_hits(text) >= prescreen["min_hits"] for text in texts[page])
+        ]
+        if journal is not None:
+            for page in pages:
+                if page not in candidates:
+                    journal.record(page, matched=False, source="prescreen")
+        pages = candidates
+        print(f"1단계 후보 페이지: {pages}")
+        print(f"2단계: {dpi}dpi 전체 OCR")
+
+    def record(page, region_texts, error):
+        matched = region_texts is not None and any(loose_match(text) for text in region_texts)
+        journal.record(page, matched=matched, source="ocr", error=error)
+
+    texts = ocr_pages(
+        pdf_path, pages, dpi, chunk_size, workers, render=render, cache=cache,
+        on_page=record if journal is not None else None
+    )
+
+    failed = [page for page in pages if page not in texts]
+    if failed:
+        print(f"실패 페이지: {failed}")
+
+    if journal is not None:
+        matched = set(journal.matched_pages())
+        return [page for page in all_pages if page in matched]
+    return [page for page in pages if page in texts and any(loose_match(text) for text in texts[page])]
+
+#. 텍스트 레이어가 있는 페이지는 바로 매칭하고, 없는 페이지만 렌더링 + OCR
+#. 반환값: 페이지별 [{"page", "source": "text" | "ocr", "matched"}] (journal에 실패로 기록된 페이지는 "error" 포함)
+def scan_with_text_layer(pdf_path, total_pages=None, dpi=300, chunk_size=10, workers=1, min_text_chars=MIN_TEXT_CHARS, prescreen=None, cache=None, render=None, journal=None):
+    last_page = _last_page(pdf_path, total_pages)
+    texts = extract_text_layer(pdf_path, last_page=last_page)
+
+    report = []
+    ocr_targets = []
+    for page, text in enumerate(texts, start=1):
+        if has_usable_text(text, min_text_chars):
+            report.append({"page": page, "source": "text", "matched": loose_match(text)})
+            if journal is not None and not journal.is_done(page):
+                journal.record(page, matched=report[-1]["matched"], source="text")
+        else:
+            report.append({"page": page, "source": "ocr", "matched": False})
+            ocr_targets.append(page)
+
+    matched = set(scan_pages(pdf_path, ocr_targets, dpi, chunk_size, workers, prescreen, cache, render, journal))
+    failed = journal.failed_pages() if journal is not None else {}
+    for entry in report:
+        if entry["source"] == "ocr":
+            entry["matched"] = entry["page"] in matched
+            if entry["page"] in failed:
+                entry["error"] = failed[entry["page"]]
+
+    return report
+
+def find_target_pages(pdf_path, total_pages=None, dpi=300, chunk_size=10, workers=1, text_layer=False, min_text_chars=MIN_TEXT_CHARS, prescreen=None, cache=None, render=None, journal=None):
+    if text_layer:
+        report = scan_with_text_layer(pdf_path, total_pages, dpi, chunk_size, workers, min_text_chars, prescreen, cache, render, journal)
+        return [entry["page"] for entry in report if entry["matched"]]
+
+    last_page = _last_page(pdf_path, total_pages)
+    return scan_pages(pdf_path, range(1, last_page + 1), dpi, chunk_size, workers, prescreen, cache, render, journal)
+
+#. 2단계 결과를 전체 해상도 전수 검사 결과와 비교
+def check_recall(pdf_path, found_pages, total_pages=None, dpi=300, chunk_size=10, workers=1, cache=None, render=None):
+    expected = find_target_pages(pdf_path, total_pages, dpi, chunk_size, workers, cache=cache, render=render)
+    found = set(found_pages)
+    missed = [page for page in expected if page not in found]
 
-        if page % 10 == 0:
-            print(f"{page}페이지 처리 중...")
+    return {
+        "expected": expected,
+        "found": sorted(found),
+        "missed": missed,
+        "extra": sorted(found - set(expected)),
+        "recall": (len(expected) - len(missed)) / len(expected) if expected else 1.0,
+    }
 
-    return pages
+#. "1-5,8,10-12" -> [1, 2, 3, 4, 5, 8, 10, 11, 12]
+def parse_page_ranges(spec):
+    pages = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+            if start > end:
+                raise ValueError(f"잘못된 페이지 구간: {part}")
+            pages.update(range(start, end + 1))
+        else:
+            pages.add(int(part))
+    return sorted(pages)
 
-pages = find_target_pages(PDF_PATH)
-print("키워드 포함 페이지:", pages)
+def _save_page(img, path, export):
+    fmt = export["format"]
+    if fmt == "png":
+        img.save(path, "PNG", compress_level=export["png_level"])
+    elif fmt == "webp":
+        img.save(path, "WEBP", quality=export["webp_quality"], lossless=export["webp_lossless"], method=4)
+    elif fmt == "tiff":
+        if img.mode == "1":
+            img.save(path, "TIFF", compression="group4")
+        else:
+            img.convert("L").save(path, "TIFF", compression="tiff_lzw")
+    else:
+        raise ValueError(f"알 수 없는 저장 형식: {fmt} (사용 가능: {', '.join(EXPORT_FORMATS)})")
 
+#. 워커 프로세스에서 실행: 한 구간을 pdftoppm 한 번으로 렌더링하고 페이지별로 인코딩 + 저장
+#. 반환값: [(페이지, 저장 경로, 오류)] (실패한 페이지는 경로 대신 None과 실패 사유)
+def _export_range(pdf_path, start, end, dpi, out_dir, export):
+    mode = export["mode"]
+    if export["format"] == "tiff" and mode == "rgb":
+        mode = "gray"
 
-#
+    results = []
+    try:
+        # 임시 파일로 렌더링하고 한 장씩 열어서 저장 -> 메모리에는 한 장만 올라감
+        for page, img in iter_pages(pdf_path, dpi=dpi, first_page=start, last_page=end, chunk_size=end - start + 1, mode=mode, to_files=True):
+            path = os.path.join(out_dir, f"page_{page}.{export['format']}")
+            try:
+                tmp_path = path + ".tmp"
+                _save_page(img, tmp_path, export)
+                os.replace(tmp_path, path)
+                results.append((page, path, None))
+            except Exception as e:
+                results.append((page, None, f"저장 실패: {e}"))
+    except Exception as e:
+        done = {page for page, _, _ in results}
+        remaining = [page for page in range(start, end + 1) if page not in done]
+        if end > start:
+            for page in remaining:
+                results.extend(_export_range(pdf_path, page, page, dpi, out_dir, export))
+        else:
+            results.extend((page, None, f"렌더링 실패: {e}") for page in remaining)
+    return results
 
-# pages = find_target_pages(PDF_PATH)
+def export_pages(pdf_path, pages, out_dir=OUTPUT_DIR, dpi=300, chunk_size=10, workers=1, export=None):
+    """
+    지정한 페이지만 렌더링해서 이미지로 저장
+
+    Args:
+        pages: 페이지 번호 목록 (parse_page_ranges 또는 find_target_pages 결과)
+        out_dir: 저장 폴더 (page_<번호>.<형식>)
+        chunk_size: pdftoppm 한 번에 렌더링할 연속 페이지 수
+        workers: 렌더링 + 저장 프로세스 수
+        export: 저장 설정 (EXPORT 형식)
+
+    Returns:
+        {"saved": {페이지: 경로}, "failed": {페이지: 실패 사유}, "bytes": 저장된 파일 크기 합}
+    """
+    export = {**EXPORT, **(export or {})}
+    os.makedirs(out_dir, exist_ok=True)
+
+    saved = {}
+    failed = {}
+    for page, path, error in _run_ranges(
+        _export_range, pdf_path, group_ranges(pages, chunk_size), workers, dpi, out_dir, export
+    ):
+        if error:
+            failed[page] = error
+            print(f"{page}페이지 {error}")
+        else:
+            saved[page] = path
+
+    return {
+        "saved": saved,
+        "failed": failed,
+        "bytes": sum(os.path.getsize(path) for path in saved.values()),
+    }
+
+def _run_export(args, pages):
+    export = {
+        "format": args.export_format,
+        "png_level": args.png_level,
+        "webp_quality": args.webp_quality,
+        "webp_lossless": args.webp_lossless,
+        "mode": args.render_mode,
+    }
+    result = export_pages(
+        args.pdf,
+        pages,
+        out_dir=args.output_dir,
+        dpi=args.export_dpi or args.dpi,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        export=export
+    )
+    print(f"{len(result['saved'])}페이지 저장 완료: {args.output_dir} ({result['bytes'] / (1024 * 1024):.1f}MB)")
+    if result["failed"]:
+        print(f"저장 실패 페이지: {sorted(result['failed'])}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PDF에서 키워드가 포함된 페이지 찾기 / 페이지 이미지 저장",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 키워드 페이지 찾기
+  python pdf_to_image.py --workers 4
+
+  # 찾은 페이지를 WebP로 저장
+  python pdf_to_image.py --workers 4 --export --export-format webp
+
+  # 검색 없이 지정한 페이지만 흑백 TIFF로 저장
+  python pdf_to_image.py --pages 312-323,400 --export-format tiff --workers 4
+        '''
+    )
+    parser.add_argument("--pdf", default=PDF_PATH, help=f"PDF 경로 (기본값: {PDF_PATH})")
+    parser.add_argument("--dpi", type=int, default=300, help="렌더링 해상도 (기본값: 300)")
+    parser.add_argument("--total-pages", type=int, default=None, help="앞에서부터 검사할 최대 페이지 수 (기본값: 전체)")
+    parser.add_argument("--chunk-size", type=int, default=10, help="pdftoppm 한 번에 렌더링할 페이지 수 (기본값: 10)")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="렌더링 + OCR 프로세스 수 (기본값: 1). 메모리에는 최대 workers * chunk-size 장의 이미지가 올라감"
+    )
+    parser.add_argument("--text-layer", action="store_true", help="PDF 텍스트 레이어를 먼저 확인하고 텍스트가 없는 페이지만 OCR")
+    parser.add_argument("--min-text-chars", type=int, default=MIN_TEXT_CHARS, help=f"텍스트 레이어 사용 기준 글자 수 (기본값: {MIN_TEXT_CHARS})")
+    parser.add_argument("--report", default=None, help="--text-layer 사용 시 페이지별 처리 방식을 저장할 JSON 경로")
+    parser.add_argument("--two-stage", action="store_true", help="저해상도 헤더 OCR로 후보 페이지를 먼저 고른 뒤 후보만 전체 해상도로 OCR")
+    parser.add_argument("--prescreen-dpi", type=int, default=PRESCREEN["dpi"], help=f"1단계 렌더링 해상도 (기본값: {PRESCREEN['dpi']})")
+    parser.add_argument("--header-ratio", type=float, default=HEADER_REGIONS[0][1], help=f"1단계에서 OCR 할 페이지 상단 비율 (기본값: {HEADER_REGIONS[0][1]})")
+    parser.add_argument("--min-hits", type=int, default=PRESCREEN["min_hits"], help=f"1단계 후보 기준 키워드 개수 (기본값: {PRESCREEN['min_hits']})")
+    parser.add_argument("--check-recall", action="store_true", help="--two-stage 결과를 전체 해상도 전수 검사와 비교")
+    parser.add_argument("--no-cache", action="store_true", help="OCR 캐시를 사용하지 않음")
+    parser.add_argument("--cache-path", default=CACHE_PATH, help=f"OCR 캐시 파일 경로 (기본값: {CACHE_PATH})")
+    parser.add_argument(
+        "--cache-size-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help=f"OCR 캐시 최대 크기 MB (기본값: {DEFAULT_MAX_BYTES // (1024 * 1024)})"
+    )
+    parser.add_argument("--ocr-backend", choices=BACKENDS, default="auto", help="OCR 엔진 (기본값: auto - tesserocr가 있으면 사용)")
+    parser.add_argument("--render-mode", choices=RENDER_MODES, default=RENDER["mode"], help="렌더링 색상 모드 (기본값: rgb, gray/mono는 메모리 1/3)")
+    parser.add_argument("--render-to-files", action="store_true", help="청크를 임시 파일로 렌더링하고 한 장씩 읽음")
+    parser.add_argument("--memory-budget-mb", type=int, default=None, help="렌더링된 페이지가 차지할 메모리 상한 MB (워커 수/청크 크기 자동 조정)")
+    parser.add_argument("--preprocess", action="store_true", help="OCR 전 테두리 제거 / 기울기 보정 / 적응형 이진화")
+    parser.add_argument("--target-line-height", type=int, default=None, help="--preprocess 사용 시 텍스트 줄 높이가 이 픽셀 수가 되도록 축소")
+    parser.add_argument("--max-edits", type=int, default=MATCH["max_edits"], help="키워드 매칭 허용 편집 거리 (기본값: 0, 정확히 일치)")
+    parser.add_argument("--jamo", action="store_true", help="키워드를 한글 자모 단위로 비교 (--max-edits와 함께 사용)")
+    parser.add_argument("--export", action="store_true", help="찾은 페이지를 이미지로 저장")
+    parser.add_argument("--pages", default=None, help="검색 없이 이 페이지들만 저장 (예: 312-323,400)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help=f"이미지 저장 폴더 (기본값: {OUTPUT_DIR})")
+    parser.add_argument("--export-format", choices=EXPORT_FORMATS, default=EXPORT["format"], help="저장 형식 (기본값: png, tiff는 흑백)")
+    parser.add_argument("--export-dpi", type=int, default=None, help="저장 해상도 (기본값: --dpi)")
+    parser.add_argument("--png-level", type=int, choices=range(10), default=EXPORT["png_level"], help=f"PNG 압축 수준 0~9 (기본값: {EXPORT['png_level']}, 높을수록 작고 느림)")
+    parser.add_argument("--webp-quality", type=int, default=EXPORT["webp_quality"], help=f"WebP 화질 0~100 (기본값: {EXPORT['webp_quality']})")
+    parser.add_argument("--webp-lossless", action="store_true", help="WebP 무손실 저장")
+    parser.add_argument("--journal", default=None, help="페이지별 진행 기록 JSONL 경로 (기본값: output/journal/<PDF 이름>.jsonl)")
+    parser.add_argument("--no-journal", action="store_true", help="진행 기록을 남기지 않음")
+    parser.add_argument("--resume", action="store_true", help="진행 기록에서 완료된 페이지는 건너뛰고 이어서 검사 (실패한 페이지는 다시 시도)")
+    args = parser.parse_args()
+
+    render = {
+        "mode": args.render_mode,
+        "to_files": args.render_to_files,
+        "memory_budget_mb": args.memory_budget_mb,
+        "preprocess": {**PREPROCESS, "target_line_height": args.target_line_height} if args.preprocess else None,
+    }
+
+    if args.pages:
+        _run_export(args, parse_page_ranges(args.pages))
+        return
+
+    set_default_backend(args.ocr_backend)
+    set_match_options(args.max_edits, args.jamo)
+    warning = capped_edits_warning(get_matcher())
+    if warning:
+        print(warning)
+
+    cache = None
+    if not args.no_cache:
+        cache = OCRCache(args.cache_path, max_bytes=args.cache_size_mb * 1024 * 1024)
+
+    prescreen = None
+    if args.two_stage:
+        prescreen = {
+            **PRESCREEN,
+            "dpi": args.prescreen_dpi,
+            "regions": [(0.0, args.header_ratio)],
+            "min_hits": args.min_hits,
+        }
+
+    journal = None
+    if not args.no_journal:
+        # 검사 결과에 영향을 주는 설정이 같을 때만 이어서 검사
+        settings = {
+            "dpi": args.dpi,
+            "lang": OCR_LANG,
+            "config": OCR_CONFIG,
+            "keywords": KEYWORD_GROUPS,
+            "match": MATCH,
+            "text_layer": args.text_layer,
+            "min_text_chars": args.min_text_chars if args.text_layer else None,
+            "prescreen": prescreen,
+            "render_mode": render["mode"],
+            "preprocess": render["preprocess"],
+        }
+        journal = ScanJournal(args.journal or journal_path(args.pdf), args.pdf, settings, resume=args.resume)
+        print(f"진행 기록: {journal.path}")
+
+    if args.text_layer:
+        report = scan_with_text_layer(
+            args.pdf,
+            total_pages=args.total_pages,
+            dpi=args.dpi,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            min_text_chars=args.min_text_chars,
+            prescreen=prescreen,
+            cache=cache,
+            render=render,
+            journal=journal
+        )
+        pages = [entry["page"] for entry in report if entry["matched"]]
+
+        text_count = sum(1 for entry in report if entry["source"] == "text")
+        print(f"텍스트 레이어 사용: {text_count}페이지 / OCR: {len(report) - text_count}페이지")
+
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"리포트 저장 완료: {args.report}")
+    else:
+        pages = find_target_pages(
+            args.pdf,
+            total_pages=args.total_pages,
+            dpi=args.dpi,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            prescreen=prescreen,
+            cache=cache,
+            render=render,
+            journal=journal
+        )
+    print("키워드 포함 페이지:", pages)
 
-# for page in pages:
-#     images = convert_from_path(
-#         PDF_PATH,
-#         dpi=300,
-#         fmt="png",
-#         first_page=page,
-#         last_page=page,
-#         poppler_path=POPPLER_PATH
-#     )
-#     images[0].save(f"{OUTPUT_DIR}/page_{page}.png", "PNG")
-#     print(f"{page}페이지 저장 완료")
+    if journal is not None:
+        failed = journal.failed_pages()
+        if failed:
+            print(f"실패 페이지 {len(failed)}개 (--resume으로 다시 시도):")
+            for page, error in failed.items():
+                print(f"  {page}페이지: {error}")
+        journal.close()
 
+    if args.export and pages:
+        _run_export(args, pages)
 
-#. 특정 페이지만 추출
+    if args.check_recall:
+        print("전체 해상도 전수 검사로 재현율 확인 중...")
+        recall = check_recall(args.pdf, pages, args.total_pages, args.dpi, args.chunk_size, args.workers, cache, render)
+        print(f"재현율: {recall['recall']:.3f} (누락 페이지: {recall['missed']}, 추가 페이지: {recall['extra']})")
 
-# PAGE_RANGES = [
-#     (312, 323) #. 변환할 페이지
-# ]
-# for start, end in PAGE_RANGES:
-#     for page in range(start, end + 1):
-#         images = convert_from_path(
-#             PDF_PATH,
-#             dpi=300,
-#             fmt="png",
-#             poppler_path=POPPLER_PATH
-#         ) 
-#     images[0].save(f"{OUTPUT_DIR}/page_{page}.png", "PNG")
-#     print(f"{page}페이지 변환 완료")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+PDF -> OCR 통합 파이프라인
+- 렌더링 -> 전처리 -> OCR -> 매칭/저장 단계를 스레드로 나누고 크기 제한 큐로 연결
+- 페이지는 메모리 안의 이미지로만 전달 (PNG 저장 후 다시 읽지 않음)
+- 페이지 이미지 파일 저장은 선택 사항 (image_dir)
+"""
+
+import os
+import time
+import queue
+import argparse
+import threading
+from collections import defaultdict
+from typing import Dict, List
+
+from ocr_cache import OCRCache, CACHE_PATH, file_hash
+from ocr_engine import BACKENDS, create_engine, set_default_backend
+from preprocess import PREPROCESS, preprocess_image
+from pdf_to_image import (
+    PDF_PATH,
+    OCR_LANG,
+    OCR_CONFIG,
+    iter_pages,
+    group_ranges,
+    get_page_count,
+    loose_match,
+    cache_config_key,
+    set_match_options,
+    get_matcher,
+)
+from keyword_matcher import capped_edits_warning
+
+TEXT_DIR = "output/ocr"
+STAGES = ("render", "preprocess", "ocr", "match")
+
+_DONE = object()
+
+
+class Pipeline:
+    """렌더링 / 전처리 / OCR / 매칭·저장 단계를 동시에 실행하는 파이프라인"""
+
+    def __init__(
+        self,
+        pdf_path: str,
+        dpi: int = 300,
+        chunk_size: int = 10,
+        ocr_workers: int = 2,
+        queue_size: int = 4,
+        text_dir: str = TEXT_DIR,
+        image_dir: str = None,
+        image_format: str = "png",
+        cache: OCRCache = None,
+        preprocess: Dict = None,
+    ):
+        """
+        Args:
+            pdf_path: PDF 경로
+            dpi: 렌더링 해상도
+            chunk_size: pdftoppm 한 번에 렌더링할 페이지 수
+            ocr_workers: OCR 스레드 수 (스레드마다 엔진 하나)
+            queue_size: 단계 사이 큐 크기 (메모리에 대기하는 페이지 수 상한)
+            text_dir: 페이지별 OCR 텍스트 저장 폴더 (None이면 저장 안 함)
+            image_dir: 페이지 이미지 저장 폴더 (None이면 저장 안 함)
+            image_format: 페이지 이미지 형식 (PIL 포맷 이름)
+            cache: OCR 캐시 (캐시에 있는 페이지는 렌더링부터 건너뜀)
+            preprocess: 전처리 설정 (preprocess.PREPROCESS 형식, None이면 흑백 변환만)
+        """
+        self.pdf_path = pdf_path
+        self.dpi = dpi
+        self.chunk_size = chunk_size
+        self.ocr_workers = ocr_workers
+        self.queue_size = queue_size
+        self.text_dir = text_dir
+        self.image_dir = image_dir
+        self.image_format = image_format
+        self.cache = cache
+        self.preprocess = preprocess
+        self.cache_config = cache_config_key(OCR_CONFIG, None, preprocess=preprocess)
+
+        self.timings = defaultdict(float)
+        self._timing_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._errors = []
+
+    # ------------------------------------------------------------
+    # 큐 / 공용 처리
+    # ------------------------------------------------------------
+    def _put(self, q, item):
+        # 다른 단계가 실패해서 멈춘 경우 꽉 찬 큐에서 영원히 기다리지 않게 함
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q):
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _add_time(self, stage, seconds):
+        with self._timing_lock:
+            self.timings[stage] += seconds
+
+    def _run_stage(self, target, *args):
+        try:
+            target(*args)
+        except Exception as e:
+            self._errors.append(e)
+            self._stop.set()
+
+    # ------------------------------------------------------------
+    # 단계
+    # ------------------------------------------------------------
+    def _render(self, pages, out_q):
+        try:
+            for start, end in group_ranges(pages, self.chunk_size):
+                # 멈춘 뒤에는 남은 청크를 렌더링하지 않음
+                if self._stop.is_set():
+                    return
+                rendered = iter_pages(self.pdf_path, dpi=self.dpi, first_page=start, last_page=end, chunk_size=end - start + 1)
+                try:
+                    while True:
+                        t0 = time.perf_counter()
+                        item = next(rendered, None)
+                        self._add_time("render", time.perf_counter() - t0)
+
+                        if item is None:
+                            break
+                        if self._stop.is_set():
+                            return
+                        self._put(out_q, item)
+                finally:
+                    rendered.close()
+        finally:
+            for _ in range(self.ocr_workers):
+                self._put(out_q, _DONE)
+
+    def _preprocess(self, in_q, out_q):
+        done = 0
+        while done < self.ocr_workers:
+            item = self._get(in_q)
+            if item is _DONE:
+                done += 1
+                self._put(out_q, _DONE)
+                if self._stop.is_set():
+                    return
+                continue
+
+            page, img = item
+            t0 = time.perf_counter()
+            if self.preprocess:
+                gray = preprocess_image(img, **self.preprocess)
+            else:
+                gray = img.convert("L")
+            self._add_time("preprocess", time.perf_counter() - t0)
+
+            # 이미지 저장을 안 하면 원본은 여기서 버려서 뒤 단계 메모리를 줄임
+            self._put(out_q, (page, gray, img if self.image_dir else None))
+
+    def _ocr(self, in_q, out_q):
+        engine = create_engine(OCR_LANG, OCR_CONFIG)
+        try:
+            while True:
+                item = self._get(in_q)
+                if item is _DONE:
+                    break
+
+                page, gray, original = item
+                t0 = time.perf_counter()
+                text = engine.image_to_string(gray)
+                self._add_time("ocr", time.perf_counter() - t0)
+
+                self._put(out_q, (page, text, original))
+        finally:
+            engine.close()
+            self._put(out_q, _DONE)
+
+    def _match(self, page, text, original, matched, doc_hash):
+        t0 = time.perf_counter()
+
+        if loose_match(text):
+            matched.append(page)
+
+        if self.text_dir:
+            with open(os.path.join(self.text_dir, f"page_{page}.txt"), "w", encoding="utf-8") as f:
+                f.write(text)
+
+        if original is not None:
+            original.save(os.path.join(self.image_dir, f"page_{page}.{self.image_format}"), self.image_format.upper())
+
+        if self.cache is not None and doc_hash is not None:
+            self.cache.put(doc_hash, page, self.dpi, OCR_LANG, self.cache_config, text)
+
+        self._add_time("match", time.perf_counter() - t0)
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+    def run(self, pages: List[int] = None) -> Dict:
+        """
+        파이프라인 실행
+
+        Args:
+            pages: 처리할 페이지 번호 목록 (None이면 전체)
+
+        Returns:
+            {"pages": 키워드 포함 페이지, "processed", "cached", "elapsed", "pages_per_sec", "timings": 단계별 누적 시간}
+        """
+        start_time = time.perf_counter()
+        if pages is None:
+            pages = range(1, get_page_count(self.pdf_path) + 1)
+        pages = list(pages)
+
+        for directory in (self.text_dir, self.image_dir):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        matched = []
+        cached = {}
+        doc_hash = None
+        if self.cache is not None:
+            doc_hash = file_hash(self.pdf_path)
+            cached = self.cache.get_many(doc_hash, pages, self.dpi, OCR_LANG, self.cache_config)
+
+        # 이미지 저장이 필요하면 캐시에 있어도 렌더링해야 함
+        if self.image_dir:
+            cached = {}
+
+        for page, text in cached.items():
+            self._match(page, text, None, matched, None)
+
+        todo = [page for page in pages if page not in cached]
+        processed = 0
+
+        if todo:
+            render_q = queue.Queue(maxsize=self.queue_size)
+            ocr_in_q = queue.Queue(maxsize=self.queue_size)
+            ocr_out_q = queue.Queue(maxsize=self.queue_size)
+
+            threads = [
+                threading.Thread(target=self._run_stage, args=(self._render, todo, render_q), daemon=True),
+                threading.Thread(target=self._run_stage, args=(self._preprocess, render_q, ocr_in_q), daemon=True),
+            ]
+            threads += [
+                threading.Thread(target=self._run_stage, args=(self._ocr, ocr_in_q, ocr_out_q), daemon=True)
+                for _ in range(self.ocr_workers)
+            ]
+            for thread in threads:
+                thread.start()
+
+            done = 0
+            try:
+                while done < self.ocr_workers:
+                    item = self._get(ocr_out_q)
+                    if item is _DONE:
+                        done += 1
+                        if self._stop.is_set():
+                            break
+                        continue
+
+                    page, text, original = item
+                    self._match(page, text, original, matched, doc_hash)
+                    processed += 1
+
+                    if processed % 10 == 0:
+                        print(f"{processed}/{len(todo)}페이지 처리 중...")
+            finally:
+                self._stop.set()
+                for thread in threads:
+                    thread.join()
+
+            if self._errors:
+                raise self._errors[0]
+
+        elapsed = time.perf_counter() - start_time
+        return {
+            "pages": sorted(matched),
+            "processed": processed,
+            "cached": len(cached),
+            "elapsed": elapsed,
+            "pages_per_sec": len(pages) / elapsed if elapsed else 0.0,
+            "timings": {stage: self.timings[stage] for stage in STAGES},
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 렌더링 -> OCR -> 키워드 매칭 파이프라인")
+    parser.add_argument("--pdf", default=PDF_PATH, help=f"PDF 경로 (기본값: {PDF_PATH})")
+    parser.add_argument("--dpi", type=int, default=300, help="렌더링 해상도 (기본값: 300)")
+    parser.add_argument("--chunk-size", type=int, default=10, help="pdftoppm 한 번에 렌더링할 페이지 수 (기본값: 10)")
+    parser.add_argument("--ocr-workers", type=int, default=2, help="OCR 스레드 수 (기본값: 2)")
+    parser.add_argument("--queue-size", type=int, default=4, help="단계 사이 대기 페이지 수 (기본값: 4)")
+    parser.add_argument("--text-dir", default=TEXT_DIR, help=f"페이지별 OCR 텍스트 저장 폴더 (기본값: {TEXT_DIR})")
+    parser.add_argument("--no-text", action="store_true", help="OCR 텍스트 파일을 저장하지 않음")
+    parser.add_argument("--save-images", default=None, metavar="DIR", help="페이지 이미지도 이 폴더에 저장")
+    parser.add_argument("--image-format", default="png", help="--save-images 이미지 형식 (기본값: png)")
+    parser.add_argument("--no-cache", action="store_true", help="OCR 캐시를 사용하지 않음")
+    parser.add_argument("--cache-path", default=CACHE_PATH, help=f"OCR 캐시 파일 경로 (기본값: {CACHE_PATH})")
+    parser.add_argument("--ocr-backend", choices=BACKENDS, default="auto", help="OCR 엔진 (기본값: auto)")
+    parser.add_argument("--max-edits", type=int, default=0, help="키워드 매칭 허용 편집 거리 (기본값: 0)")
+    parser.add_argument("--jamo", action="store_true", help="키워드를 한글 자모 단위로 비교")
+    parser.add_argument("--preprocess", action="store_true", help="OCR 전 테두리 제거 / 기울기 보정 / 적응형 이진화")
+    parser.add_argument("--target-line-height", type=int, default=None, help="--preprocess 사용 시 텍스트 줄 높이가 이 픽셀 수가 되도록 축소")
+    args = parser.parse_args()
+
+    set_default_backend(args.ocr_backend)
+    set_match_options(args.max_edits, args.jamo)
+    warning = capped_edits_warning(get_matcher())
+    if warning:
+        print(warning)
+    cache = None if args.no_cache else OCRCache(args.cache_path)
+
+    pipeline = Pipeline(
+        args.pdf,
+        dpi=args.dpi,
+        chunk_size=args.chunk_size,
+        ocr_workers=args.ocr_workers,
+        queue_size=args.queue_size,
+        text_dir=None if args.no_text else args.text_dir,
+        image_dir=args.save_images,
+        image_format=args.image_format,
+        cache=cache,
+        preprocess={**PREPROCESS, "target_line_height": args.target_line_height} if args.preprocess else None,
+    )
+    result = pipeline.run()
+
+    print("키워드 포함 페이지:", result["pages"])
+    print(f"처리: {result['processed']}페이지, 캐시: {result['cached']}페이지, {result['elapsed']:.1f}초 ({result['pages_per_sec']:.2f} 페이지/초)")
+    for stage, seconds in result["timings"].items():
+        print(f"  {stage}: {seconds:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
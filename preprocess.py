@@ -0,0 +1,209 @@
+"""
+OCR 전 이미지 전처리 (NumPy 벡터 연산)
+- 테두리 잘라내기: 스캔 가장자리의 검은 띠와 빈 여백 제거
+- 기울기 보정: 글자 픽셀을 각도별로 기울여 가로 투영이 가장 뾰족한 각도 선택
+- 축소: 텍스트 줄 높이가 목표 픽셀 수가 되도록 (Tesseract 시간은 픽셀 수에 비례)
+- 적응형 이진화: Sauvola (적분 영상으로 창 평균/표준편차 계산) -> 회색 배경, 얼룩 제거
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+from PIL import Image
+
+#. 기본 설정 (target_line_height가 None이면 축소하지 않음)
+PREPROCESS = {
+    "crop": True,
+    "deskew": True,
+    "target_line_height": None,
+    "binarize": True,
+}
+
+#. 기울기 탐색 범위/간격 (도)
+MAX_SKEW = 5.0
+SKEW_STEP = 0.1
+
+#. 기울기 추정용 축소 이미지 가로 크기
+SKEW_SAMPLE_WIDTH = 1000
+
+
+def otsu_threshold(gray: np.ndarray) -> int:
+    """Otsu 전역 임계값 (gray: uint8, 이 값 이하가 글자)"""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    total = hist.sum()
+    levels = np.arange(256)
+
+    weight_bg = np.cumsum(hist)
+    weight_fg = total - weight_bg
+    cum_mean = np.cumsum(hist * levels)
+    mean_bg = cum_mean / np.maximum(weight_bg, 1)
+    mean_fg = (cum_mean[-1] - cum_mean) / np.maximum(weight_fg, 1)
+
+    between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    return int(np.argmax(between))
+
+
+def sauvola(gray: np.ndarray, window: int = 25, k: float = 0.2, r: float = 128.0) -> np.ndarray:
+    """
+    Sauvola 적응형 이진화
+
+    Args:
+        gray: uint8 흑백 배열
+        window: 지역 창 크기 (홀수)
+        k, r: Sauvola 파라미터
+
+    Returns:
+        uint8 배열 (글자 0, 배경 255)
+    """
+    window |= 1
+    pad = window // 2
+    values = gray.astype(np.float64)
+    padded = np.pad(values, pad, mode="edge")
+
+    # 맨 앞에 0 행/열을 붙인 적분 영상 -> 창 합계를 네 꼭짓점 덧셈으로 계산
+    integral = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1))
+    integral[1:, 1:] = padded.cumsum(0).cumsum(1)
+    integral_sq = np.zeros_like(integral)
+    integral_sq[1:, 1:] = (padded ** 2).cumsum(0).cumsum(1)
+
+    def window_sum(table):
+        return (
+            table[window:, window:] - table[:-window, window:]
+            - table[window:, :-window] + table[:-window, :-window]
+        )
+
+    area = window * window
+    mean = window_sum(integral) / area
+    std = np.sqrt(np.maximum(window_sum(integral_sq) / area - mean ** 2, 0))
+    threshold = mean * (1 + k * (std / r - 1))
+
+    return np.where(values > threshold, 255, 0).astype(np.uint8)
+
+
+def crop_borders(gray: np.ndarray, ink: np.ndarray, margin: int = 10) -> np.ndarray:
+    """
+    테두리 잘라내기
+
+    Args:
+        gray: 흑백 배열
+        ink: 글자(어두운) 픽셀 마스크
+        margin: 글자 영역 바깥으로 남길 여백 (픽셀)
+    """
+    # 절반 이상이 검은 행/열은 스캔 가장자리 띠로 보고 글자 영역 계산에서 제외
+    border_rows = ink.mean(axis=1) > 0.5
+    border_cols = ink.mean(axis=0) > 0.5
+    ink = ink & ~border_rows[:, None] & ~border_cols[None, :]
+
+    text_rows = np.nonzero(ink.mean(axis=1) > 0.001)[0]
+    text_cols = np.nonzero(ink.mean(axis=0) > 0.001)[0]
+    if len(text_rows) == 0 or len(text_cols) == 0:
+        return gray
+
+    top = max(text_rows[0] - margin, 0)
+    bottom = min(text_rows[-1] + margin + 1, gray.shape[0])
+    left = max(text_cols[0] - margin, 0)
+    right = min(text_cols[-1] + margin + 1, gray.shape[1])
+    return gray[top:bottom, left:right]
+
+
+def estimate_skew(ink: np.ndarray, max_angle: float = MAX_SKEW, step: float = SKEW_STEP) -> float:
+    """
+    기울기 각도 추정 (도, 반시계 방향 양수)
+
+    각도마다 이미지를 회전하지 않고 글자 픽셀의 y 좌표만 기울여서 가로 투영을 계산
+    """
+    scale = min(1.0, SKEW_SAMPLE_WIDTH / ink.shape[1])
+    if scale < 1.0:
+        step_px = int(round(1 / scale))
+        ink = ink[::step_px, ::step_px]
+
+    ys, xs = np.nonzero(ink)
+    if len(ys) < 100:
+        return 0.0
+
+    angles = np.arange(-max_angle, max_angle + step / 2, step)
+    offset = int(np.ceil(ink.shape[1] * np.tan(np.radians(max_angle)))) + 1
+    best_angle, best_score = 0.0, -1.0
+
+    for angle in angles:
+        shifted = np.round(ys + xs * np.tan(np.radians(angle))).astype(np.int64) + offset
+        profile = np.bincount(shifted, minlength=ink.shape[0] + 2 * offset).astype(np.float64)
+        # 줄이 수평일수록 글자 행과 빈 행의 차이가 커짐
+        score = np.sum(np.diff(profile) ** 2)
+        if score > best_score:
+            best_angle, best_score = angle, score
+
+    return float(best_angle)
+
+
+def estimate_line_height(ink: np.ndarray) -> Optional[float]:
+    """글자가 있는 행이 연속된 구간 길이의 중앙값 (픽셀)"""
+    rows = ink.mean(axis=1) > 0.002
+    if not rows.any():
+        return None
+
+    # 0/1 경계 위치로 연속 구간 길이 계산
+    edges = np.diff(np.concatenate(([0], rows.astype(np.int8), [0])))
+    starts = np.nonzero(edges == 1)[0]
+    ends = np.nonzero(edges == -1)[0]
+    heights = ends - starts
+    heights = heights[heights >= 3]
+    if len(heights) == 0:
+        return None
+    return float(np.median(heights))
+
+
+def preprocess_image(
+    img: Image.Image,
+    crop: bool = True,
+    deskew: bool = True,
+    target_line_height: Optional[int] = None,
+    binarize: bool = True,
+) -> Image.Image:
+    """
+    OCR용 전처리
+
+    Args:
+        img: PIL 이미지
+        crop: 테두리 잘라내기
+        deskew: 기울기 보정
+        target_line_height: 텍스트 줄 높이가 이 값보다 크면 이 값에 맞춰 축소 (None이면 축소 안 함)
+        binarize: Sauvola 이진화
+
+    Returns:
+        흑백("L") PIL 이미지
+    """
+    gray = np.asarray(img.convert("L"), dtype=np.uint8)
+    ink = gray <= otsu_threshold(gray)
+
+    if crop:
+        gray = crop_borders(gray, ink)
+        ink = gray <= otsu_threshold(gray)
+
+    if deskew:
+        angle = estimate_skew(ink)
+        if abs(angle) >= SKEW_STEP:
+            # 추정 각도만큼 기울어져 있으므로 같은 방향으로 돌려서 수평으로 맞춤
+            rotated = Image.fromarray(gray).rotate(-angle, resample=Image.BILINEAR, fillcolor=255)
+            gray = np.asarray(rotated, dtype=np.uint8)
+            ink = gray <= otsu_threshold(gray)
+
+    if target_line_height:
+        line_height = estimate_line_height(ink)
+        # 표/그림 때문에 줄 구분이 안 되는 페이지는 (페이지 높이의 10% 이상) 축소하지 않음
+        if line_height and target_line_height < line_height < gray.shape[0] * 0.1:
+            scale = target_line_height / line_height
+            size = (max(1, int(gray.shape[1] * scale)), max(1, int(gray.shape[0] * scale)))
+            gray = np.asarray(Image.fromarray(gray).resize(size, Image.LANCZOS), dtype=np.uint8)
+
+    if binarize:
+        gray = sauvola(gray)
+
+    return Image.fromarray(gray)
+
+
+def describe(options: Optional[Dict]) -> str:
+    """캐시 키 등에 넣을 설정 문자열"""
+    if not options:
+        return ""
+    return "preprocess=" + ",".join(f"{key}:{options[key]}" for key in sorted(options))
@@ -0,0 +1,146 @@
+"""
+긴 PDF 검사 진행 기록 (JSONL)
+- 페이지 하나가 끝날 때마다 결과(키워드 포함 여부 / 실패 사유)를 한 줄씩 추가하고 바로 디스크에 기록
+- 중간에 끊겨도 (절전, poppler 오류 등) 기록된 페이지까지는 다시 처리하지 않고 이어서 검사
+  (이어서 쓰기 전에 끊긴 마지막 줄을 잘라내고, 첫 줄까지 끊겼으면 다시 씀)
+- 첫 줄에 문서 해시와 검사 설정을 남겨서 다른 문서/설정의 기록으로 이어가지 않게 함
+"""
+
+import os
+import json
+from datetime import datetime
+from typing import Dict, List
+
+from ocr_cache import file_hash
+
+JOURNAL_DIR = "output/journal"
+
+
+def _truncate_partial_line(path: str):
+    """쓰다가 끊긴 마지막 줄 제거 (다음에 추가하는 줄과 붙지 않게)"""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # 마지막 줄바꿈 위치 찾기
+        position = size
+        while position > 0:
+            step = min(64 * 1024, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step)
+            index = block.rfind(b"\n")
+            if index >= 0:
+                f.truncate(position + index + 1)
+                return
+        f.truncate(0)
+
+
+def journal_path(pdf_path: str) -> str:
+    """PDF별 기본 진행 기록 경로"""
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(JOURNAL_DIR, f"{name}.jsonl")
+
+
+class ScanJournal:
+    """페이지별 검사 결과 기록"""
+
+    def __init__(self, path: str, pdf_path: str, settings: Dict, resume: bool = False):
+        """
+        Args:
+            path: 진행 기록 JSONL 경로
+            pdf_path: 검사할 PDF 경로
+            settings: 결과에 영향을 주는 검사 설정 (dpi, 사전 검사, 렌더링 설정 등)
+            resume: 기존 기록을 이어서 사용 (False면 새로 시작)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.doc_hash = file_hash(pdf_path)
+        self.settings = json.loads(json.dumps(settings, ensure_ascii=False))
+        self.entries = {}
+
+        header = {"type": "start", "pdf": pdf_path, "doc_hash": self.doc_hash, "settings": self.settings}
+        if resume and os.path.exists(path):
+            _truncate_partial_line(path)
+            has_header = self._load()
+            self.file = open(path, "a", encoding="utf-8")
+            if not has_header:
+                self._write(header)
+        else:
+            self.file = open(path, "w", encoding="utf-8")
+            self._write(header)
+
+    def _load(self) -> bool:
+        """기존 기록 읽기 (첫 줄이 없으면 False)"""
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.readlines()
+        if not lines:
+            return False
+
+        header = json.loads(lines[0])
+        if header.get("doc_hash") != self.doc_hash:
+            raise ValueError(f"진행 기록의 문서가 다릅니다: {self.path} (새로 시작하려면 --resume 없이 실행)")
+        if header.get("settings") != self.settings:
+            raise ValueError(f"진행 기록의 검사 설정이 다릅니다: {self.path} (기록된 설정: {header.get('settings')})")
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # 깨진 줄 (끊긴 마지막 줄은 열 때 잘라냄)
+                continue
+            self.entries[entry["page"]] = entry
+        return True
+
+    def _write(self, entry: Dict):
+        self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def record(self, page: int, matched: bool = False, source: str = "ocr", error: str = None):
+        """
+        페이지 결과 기록
+
+        Args:
+            page: 페이지 번호
+            matched: 키워드 포함 여부
+            source: "text" | "prescreen" | "ocr" (어느 단계에서 결과가 정해졌는지)
+            error: 실패 사유 (None이면 성공)
+        """
+        entry = {
+            "page": page,
+            "status": "error" if error else "ok",
+            "matched": bool(matched) and not error,
+            "source": source,
+            "time": datetime.now().isoformat(timespec="seconds"),
+        }
+        if error:
+            entry["error"] = error
+        self.entries[page] = entry
+        self._write(entry)
+
+    def is_done(self, page: int) -> bool:
+        """성공적으로 끝난 페이지인지 (실패한 페이지는 이어서 실행할 때 다시 시도)"""
+        entry = self.entries.get(page)
+        return entry is not None and entry["status"] == "ok"
+
+    def last_completed(self) -> int:
+        done = [page for page in self.entries if self.is_done(page)]
+        return max(done) if done else 0
+
+    def matched_pages(self) -> List[int]:
+        return sorted(page for page, entry in self.entries.items() if entry["matched"])
+
+    def failed_pages(self) -> Dict[int, str]:
+        return {page: entry["error"] for page, entry in sorted(self.entries.items()) if entry["status"] == "error"}
+
+    def close(self):
+        self.file.close()
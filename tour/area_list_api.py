@@ -0,0 +1,165 @@
+"""
+구석구석 지역 목록 AJAX API (areaListAjax.do) 클라이언트
+- 브라우저 없이 requests 세션 하나(연결 재사용)로 목록 페이지를 받아서 cotid 수집
+- 첫 페이지에 전체 개수가 있으면 나머지 페이지를 한 번에 병렬 요청,
+  없으면 workers개씩 묶어서 요청하다가 빈 페이지가 나오면 종료
+- 응답이 예상과 다르면 AreaListError -> 크롤러는 Selenium 경로로 대체
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://korean.visitkorea.or.kr"
+LIST_API_PATH = "/main/areaListAjax.do"
+LIST_PAGE_PATH = "/main/area_list.do?type=Place"
+PAGE_SIZE = 12
+
+#. 지역 코드 파라미터 (기본값은 서울 - Selenium 경로에서 '서울' 필터를 누르는 것과 같은 범위)
+AREA_CODE_PARAM = "areaCode"
+SEOUL_AREA_CODE = "1"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+#. 응답에서 전체 개수가 들어 있을 수 있는 키 (body 또는 최상위)
+_TOTAL_KEYS = ("totalCount", "totCnt", "totalCnt", "total")
+
+
+class AreaListError(Exception):
+    """목록 API를 사용할 수 없음 (HTTP 오류, JSON이 아닌 응답, 예상과 다른 구조)"""
+
+
+class AreaListClient:
+    """areaListAjax.do 페이지 단위 조회"""
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        workers: int = 4,
+        page_size: int = PAGE_SIZE,
+        timeout: float = 10,
+        retries: int = 3,
+        params: Optional[Dict] = None,
+    ):
+        """
+        Args:
+            base_url: 사이트 주소 (로컬 테스트 서버 주소로 바꿀 수 있음)
+            workers: 동시에 요청할 페이지 수 (연결 풀 크기)
+            page_size: 페이지당 항목 수
+            timeout: 요청 하나의 제한 시간 (초)
+            retries: 연결 오류 / 429 / 5xx 응답 재시도 횟수
+            params: 요청에 추가할 파라미터 (예: 지역 코드)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.workers = max(1, workers)
+        self.page_size = page_size
+        self.timeout = timeout
+        self.params = params or {}
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "X-Requested-With": "XMLHttpRequest",
+            "Referer": self.base_url + LIST_PAGE_PATH,
+        })
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,
+        )
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch_page(self, page: int) -> Dict:
+        """
+        목록 한 페이지 조회
+
+        Returns:
+            {"items": [항목 딕셔너리], "total": 전체 개수 또는 None}
+        """
+        payload = {"page": page, "pageSize": self.page_size, "type": "Place", **self.params}
+        try:
+            resp = self.session.post(self.base_url + LIST_API_PATH, data=payload, timeout=self.timeout)
+            resp.raise_for_status()
+            data = resp.json()
+        except requests.RequestException as e:
+            raise AreaListError(f"{page}페이지 요청 실패: {e}") from e
+        except ValueError as e:
+            raise AreaListError(f"{page}페이지 응답이 JSON이 아닙니다: {resp.text[:100]!r}") from e
+
+        body = data.get("body") if isinstance(data, dict) else None
+        if not isinstance(body, dict) or not isinstance(body.get("result"), list):
+            raise AreaListError(f"{page}페이지 응답 구조가 예상과 다릅니다: {str(data)[:100]}")
+
+        total = None
+        for source in (body, data):
+            for key in _TOTAL_KEYS:
+                try:
+                    total = int(source[key])
+                    break
+                except (KeyError, TypeError, ValueError):
+                    continue
+            if total is not None:
+                break
+
+        return {"items": body["result"], "total": total}
+
+    def fetch_items(self, max_pages: Optional[int] = None) -> List[Dict]:
+        """
+        전체 목록 항목 (페이지 순서대로)
+
+        Args:
+            max_pages: 최대 페이지 수 (None이면 끝까지)
+        """
+        first = self.fetch_page(1)
+        if not first["items"]:
+            raise AreaListError("첫 페이지가 비어 있습니다.")
+
+        pages = {1: first["items"]}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            if first["total"] is not None:
+                last_page = math.ceil(first["total"] / self.page_size)
+                if max_pages:
+                    last_page = min(last_page, max_pages)
+                numbers = list(range(2, last_page + 1))
+                for number, result in zip(numbers, pool.map(self.fetch_page, numbers)):
+                    pages[number] = result["items"]
+            else:
+                next_page = 2
+                while not max_pages or next_page <= max_pages:
+                    last = next_page + self.workers - 1
+                    if max_pages:
+                        last = min(last, max_pages)
+                    numbers = list(range(next_page, last + 1))
+
+                    finished = False
+                    for number, result in zip(numbers, pool.map(self.fetch_page, numbers)):
+                        if not result["items"]:
+                            finished = True
+                            break
+                        pages[number] = result["items"]
+                    if finished:
+                        break
+                    next_page = last + 1
+
+        return [item for number in sorted(pages) for item in pages[number]]
+
+    def fetch_ids(self, max_pages: Optional[int] = None) -> List[str]:
+        """전체 cotid (중복 제거, 목록 순서 유지)"""
+        ids = []
+        seen = set()
+        for item in self.fetch_items(max_pages):
+            cotid = item.get("cotid") if isinstance(item, dict) else None
+            if cotid and cotid not in seen:
+                seen.add(cotid)
+                ids.append(cotid)
+        return ids
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,239 @@
+"""
+상세 페이지 비동기 수집 (aiohttp)
+- 동시 요청 수 제한 (asyncio.Semaphore) + 호스트별 토큰 버킷으로 초당 요청 수 제한
+- 429 / 5xx / 연결 오류는 Retry-After 또는 지수 백오프로 재시도
+- ETag / Last-Modified가 있으면 조건부 요청 (304면 {'not_modified': True} 결과)
+- 파싱은 VisitKoreaCrawler.parse_detail_page (_parse_detail_section / _extract_photo_urls) 그대로 사용
+- 정적 HTML에 상세정보가 없는 페이지는 따로 알려줘서 브라우저로 다시 크롤링
+"""
+
+import time
+import json
+import asyncio
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+from area_list_api import BASE_URL, USER_AGENT
+
+DETAIL_PATH = "/detail/ms_detail.do?cotid={}"
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        # 잠금을 쥔 채로 기다려서 먼저 온 요청부터 토큰을 받게 함
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _retry_delay(resp, attempt: int) -> float:
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        return 0.5 * 2 ** attempt
+
+
+class AsyncDetailFetcher:
+    """ms_detail.do 동시 수집기"""
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        concurrency: int = 8,
+        rate: float = 5.0,
+        burst: Optional[float] = None,
+        timeout: float = 15,
+        retries: int = 2,
+        parse_page: Optional[Callable] = None,
+        validators: Optional[Dict[str, Dict]] = None,
+    ):
+        """
+        Args:
+            base_url: 사이트 주소 (로컬 테스트 서버 주소로 바꿀 수 있음)
+            concurrency: 동시에 진행하는 요청 수
+            rate: 호스트당 초당 최대 요청 수
+            burst: 토큰 버킷 크기 (None이면 rate)
+            timeout: 요청 하나의 제한 시간 (초)
+            retries: 재시도 횟수
+            parse_page: (html, location_id, url) -> 결과 딕셔너리 또는 None
+                        (None이면 VisitKoreaCrawler.parse_detail_page)
+            validators: {장소 ID: {"etag", "last_modified"}} 조건부 요청에 사용하고,
+                        응답에서 받은 새 값으로 갱신됨
+        """
+        if parse_page is None:
+            from visitkorea_crawler import VisitKoreaCrawler
+            parse_page = VisitKoreaCrawler.parse_detail_page
+
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self.retries = retries
+        self.parse_page = parse_page
+        self.validators = validators if validators is not None else {}
+        self.buckets = {}
+
+    def detail_url(self, location_id: str) -> str:
+        return self.base_url + DETAIL_PATH.format(location_id)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    async def _get(self, session: aiohttp.ClientSession, url: str, headers: Optional[Dict] = None) -> Tuple[int, str, Dict]:
+        """
+        Returns:
+            (상태 코드, 본문, {"etag", "last_modified"})  304면 본문은 빈 문자열
+        """
+        for attempt in range(self.retries + 1):
+            await self._bucket(url).acquire()
+            try:
+                async with session.get(url, headers=headers) as resp:
+                    if resp.status in RETRY_STATUS and attempt < self.retries:
+                        delay = _retry_delay(resp, attempt)
+                    elif resp.status == 304:
+                        return 304, "", {}
+                    else:
+                        resp.raise_for_status()
+                        received = {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+                        return resp.status, await resp.text(), received
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+                delay = 0.5 * 2 ** attempt
+            await asyncio.sleep(delay)
+
+    async def _fetch_one(self, session, semaphore, index: int, location_id: str) -> Tuple[int, Optional[Dict]]:
+        url = self.detail_url(location_id)
+        known = self.validators.get(location_id, {})
+        headers = {}
+        if known.get("etag"):
+            headers["If-None-Match"] = known["etag"]
+        if known.get("last_modified"):
+            headers["If-Modified-Since"] = known["last_modified"]
+
+        async with semaphore:
+            try:
+                status, html, received = await self._get(session, url, headers)
+            except Exception as e:
+                return index, {'id': location_id, 'name': '오류', 'url': url, 'error': str(e) or type(e).__name__}
+
+        if status == 304:
+            return index, {'id': location_id, 'url': url, 'not_modified': True}
+        try:
+            result = self.parse_page(html, location_id, url)
+        except Exception as e:
+            # 파싱 실패는 이 장소만 오류로 기록 (검증값도 저장하지 않아서 다음에 다시 받음)
+            return index, {'id': location_id, 'name': '오류', 'url': url, 'error': str(e) or type(e).__name__}
+        if received["etag"] or received["last_modified"]:
+            self.validators[location_id] = received
+        return index, result
+
+    async def fetch_all(self, location_ids: List[str], on_result: Optional[Callable] = None) -> Tuple[List[Optional[Dict]], List[int]]:
+        """
+        Args:
+            location_ids: 장소 ID 리스트
+            on_result: 결과가 나올 때마다 호출 (완료 순서, JavaScript가 필요한 항목은 제외)
+
+        Returns:
+            (입력 순서 결과 리스트, JavaScript가 필요한 항목의 인덱스 리스트)
+            JavaScript가 필요한 항목의 결과 자리는 None
+        """
+        results = [None] * len(location_ids)
+        needs_js = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}, connector=connector, timeout=timeout) as session:
+            tasks = [self._fetch_one(session, semaphore, index, location_id) for index, location_id in enumerate(location_ids)]
+            for done, task in enumerate(asyncio.as_completed(tasks), 1):
+                index, result = await task
+                prefix = f"[{done}/{len(location_ids)}]"
+                if result is None:
+                    needs_js.append(index)
+                    print(f"{prefix} 🌐 {location_ids[index]} - 정적 HTML에 상세정보 없음 (브라우저 필요)")
+                elif 'error' in result:
+                    results[index] = result
+                    print(f"{prefix} ❌ {location_ids[index]} - {result['error']}")
+                elif result.get('not_modified'):
+                    results[index] = result
+                    print(f"{prefix} = {location_ids[index]} - 변경 없음 (304)")
+                else:
+                    results[index] = result
+                    print(f"{prefix} ✓ {result['name']}")
+                if result is not None and on_result:
+                    on_result(result)
+
+        return results, sorted(needs_js)
+
+
+def fetch_details(
+    location_ids: List[str],
+    base_url: str = BASE_URL,
+    concurrency: int = 8,
+    rate: float = 5.0,
+    parse_page: Optional[Callable] = None,
+    validators: Optional[Dict[str, Dict]] = None,
+    on_result: Optional[Callable] = None,
+) -> Tuple[List[Optional[Dict]], List[int]]:
+    """AsyncDetailFetcher.fetch_all 동기 실행 (처리 속도 출력, validators는 응답 값으로 갱신됨)"""
+    fetcher = AsyncDetailFetcher(base_url, concurrency=concurrency, rate=rate, parse_page=parse_page, validators=validators)
+
+    start = time.perf_counter()
+    results, needs_js = asyncio.run(fetcher.fetch_all(location_ids, on_result))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n⚡ {len(location_ids)}개 페이지 {elapsed:.1f}초 ({len(location_ids) / elapsed if elapsed else 0:.1f}페이지/초)")
+    return results, needs_js
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상세 페이지 비동기 수집 (브라우저 없이)")
+    parser.add_argument("ids", help="장소 ID 목록 JSON (visitkorea_crawler.py가 저장한 *_ids.json)")
+    parser.add_argument("--output", "-o", default="visitkorea_async.json", help="결과 JSON 경로 (기본값: visitkorea_async.json)")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"사이트 주소 (기본값: {BASE_URL})")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수 (기본값: 8)")
+    parser.add_argument("--rate", type=float, default=5.0, help="호스트당 초당 최대 요청 수 (기본값: 5)")
+    args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error("--rate는 0보다 커야 합니다")
+
+    with open(args.ids, encoding="utf-8") as f:
+        location_ids = json.load(f)
+
+    results, needs_js = fetch_details(location_ids, args.base_url, args.concurrency, args.rate)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump([result for result in results if result is not None], f, ensure_ascii=False, indent=2)
+
+    print(f"💾 저장 완료: {args.output}")
+    if needs_js:
+        print(f"🌐 브라우저가 필요한 장소 {len(needs_js)}개: {[location_ids[i] for i in needs_js]}")
+
+
+if __name__ == "__main__":
+    main()
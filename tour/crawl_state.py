@@ -0,0 +1,154 @@
+"""
+장소별 크롤링 상태 (SQLite) - 증분 재크롤링용
+- 키: cotid
+- 마지막 크롤링 시각, 상세정보 내용 해시, HTTP 검증값 (ETag / Last-Modified), 마지막 결과
+- TTL이 지난 장소와 새 장소만 다시 크롤링하고, 해시가 바뀐 결과만 다시 씀
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from typing import Dict, List, Optional
+
+STATE_PATH = "data/crawl_state.sqlite3"
+
+#. 내용 해시에서 제외하는 키 (내용이 아니라 위치 정보)
+_UNHASHED_KEYS = ("id", "url")
+
+
+def content_hash(record: Dict) -> str:
+    """상세정보 결과의 sha256 (키 순서와 무관)"""
+    content = {key: value for key, value in record.items() if key not in _UNHASHED_KEYS}
+    return hashlib.sha256(json.dumps(content, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class CrawlState:
+    """cotid별 크롤링 상태 저장소"""
+
+    def __init__(self, path: str = STATE_PATH):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                cotid TEXT PRIMARY KEY,
+                crawled_at REAL NOT NULL,
+                changed_at REAL NOT NULL,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                record TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def _rows(self, location_ids: List[str], columns: str) -> Dict[str, tuple]:
+        found = {}
+        # SQLite 변수 개수 제한 때문에 나눠서 조회
+        for i in range(0, len(location_ids), 500):
+            batch = location_ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT cotid, {columns} FROM crawl_state WHERE cotid IN ({','.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            found.update((row[0], row[1:]) for row in rows)
+        return found
+
+    def due(self, location_ids: List[str], ttl: float) -> List[str]:
+        """
+        다시 크롤링할 장소 (처음 보거나 마지막 크롤링이 ttl초보다 오래된 것, 입력 순서 유지)
+        """
+        rows = self._rows(location_ids, "crawled_at")
+        limit = time.time() - ttl
+        return [location_id for location_id in location_ids if location_id not in rows or rows[location_id][0] < limit]
+
+    def validators(self, location_ids: List[str]) -> Dict[str, Dict]:
+        """{cotid: {"etag", "last_modified"}} (검증값이 하나라도 있는 장소만)"""
+        rows = self._rows(location_ids, "etag, last_modified")
+        return {
+            location_id: {"etag": etag, "last_modified": last_modified}
+            for location_id, (etag, last_modified) in rows.items()
+            if etag or last_modified
+        }
+
+    def hashes(self, location_ids: List[str]) -> Dict[str, str]:
+        """{cotid: 마지막으로 저장한 결과의 내용 해시}"""
+        return {location_id: row[0] for location_id, row in self._rows(location_ids, "content_hash").items()}
+
+    def records(self, location_ids: List[str]) -> Dict[str, Dict]:
+        """{cotid: 마지막으로 저장한 결과}"""
+        rows = self._rows(location_ids, "record")
+        return {location_id: json.loads(record) for location_id, (record,) in rows.items()}
+
+    def update(self, results: List[Dict], validators: Optional[Dict[str, Dict]] = None) -> Dict[str, int]:
+        """
+        크롤링 결과 반영 (한 트랜잭션)
+        - 오류 결과는 반영하지 않음 (다음 실행 때 다시 크롤링)
+        - {'not_modified': True} 결과와 해시가 같은 결과는 크롤링 시각 / 검증값만 갱신
+
+        Args:
+            results: 크롤링 결과 리스트
+            validators: 응답에서 받은 {cotid: {"etag", "last_modified"}}
+
+        Returns:
+            {"new", "changed", "unchanged", "failed"} 개수
+        """
+        validators = validators or {}
+        counts = {"new": 0, "changed": 0, "unchanged": 0, "failed": 0}
+        ids = [result["id"] for result in results if result]
+        hashes = self.hashes(ids)
+        now = time.time()
+
+        with self.conn:
+            for result in results:
+                if not result or "error" in result:
+                    counts["failed"] += 1
+                    continue
+                location_id = result["id"]
+                checked = validators.get(location_id, {})
+
+                if result.get("not_modified"):
+                    if location_id not in hashes:
+                        counts["failed"] += 1
+                        continue
+                    new_hash = hashes[location_id]
+                else:
+                    new_hash = content_hash(result)
+
+                if hashes.get(location_id) == new_hash:
+                    counts["unchanged"] += 1
+                    self.conn.execute(
+                        """
+                        UPDATE crawl_state
+                        SET crawled_at = ?, etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                        WHERE cotid = ?
+                        """,
+                        (now, checked.get("etag"), checked.get("last_modified"), location_id)
+                    )
+                    continue
+
+                counts["changed" if location_id in hashes else "new"] += 1
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO crawl_state VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        location_id, now, now, new_hash,
+                        checked.get("etag"), checked.get("last_modified"),
+                        json.dumps(result, ensure_ascii=False)
+                    )
+                )
+
+        return counts
+
+    def close(self):
+        self.conn.close()
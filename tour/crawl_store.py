@@ -0,0 +1,317 @@
+"""
+크롤링 결과 저장소 (SQLite)
+- places: 장소 상세정보 (visitkorea_crawler.py)
+- courses / course_stops: 여행 코스와 세부 코스 (crawling_course.ipynb)
+- cotid 기준 upsert를 batch_size개씩 한 트랜잭션으로 처리 (페이지마다 파일 전체를 다시 쓰지 않음)
+- JSON / CSV는 필요할 때 export_* 로 생성 (기존 파일과 같은 형식)
+
+사용 예시:
+  python crawl_store.py export places -o visitkorea_data
+  python crawl_store.py export courses -o data/visitkorea_courses
+"""
+
+import os
+import csv
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from typing import Dict, Iterator, List, Optional
+
+from result_sink import BASE_COLUMNS, CsvSink, write_json_array
+
+STORE_PATH = "data/visitkorea.sqlite3"
+
+#. 장소 결과에서 상세정보(details)가 아닌 키
+_PLACE_KEYS = ("id", "name", "url", "photo_urls", "error")
+
+#. 코스 CSV 열 (세부 코스 한 줄씩, 기존 crawling_course.ipynb CSV와 같은 열)
+COURSE_CSV_COLUMNS = [
+    "cotid", "코스 이름", "코스 지역", "코스 개요", "일정", "테마", "페이지태그",
+    "세부코스 번호", "세부코스 제목", "세부코스 주소", "세부코스 태그",
+]
+
+
+class CrawlStore:
+    """장소 / 코스 저장소"""
+
+    def __init__(self, path: str = STORE_PATH, batch_size: int = 50):
+        """
+        Args:
+            path: SQLite 파일 경로
+            batch_size: 몇 개씩 모아서 한 트랜잭션으로 저장할지
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.pending_places: List[Dict] = []
+        self.pending_courses: List[Dict] = []
+        # DriverPool 작업 스레드에서도 결과를 넘기므로 연결은 잠금으로 보호
+        self.lock = threading.RLock()
+
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # cotid 조회는 모두 기본 키 인덱스를 탐 (course_stops는 (cotid, position))
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS places (
+                cotid TEXT PRIMARY KEY,
+                name TEXT,
+                url TEXT,
+                photo_urls TEXT NOT NULL DEFAULT '[]',
+                details TEXT NOT NULL DEFAULT '{}',
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS courses (
+                cotid TEXT PRIMARY KEY,
+                title TEXT,
+                area TEXT,
+                description TEXT,
+                schedule TEXT,
+                theme TEXT,
+                tags TEXT NOT NULL DEFAULT '[]',
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS course_stops (
+                cotid TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                cos_no TEXT,
+                cos_title TEXT,
+                cos_add TEXT,
+                cos_tag TEXT NOT NULL DEFAULT '[]',
+                PRIMARY KEY (cotid, position)
+            );
+        """)
+        self.conn.commit()
+
+    def put_place(self, record: Dict):
+        """장소 결과 저장 (batch_size개가 모이면 한 번에 기록)"""
+        with self.lock:
+            self.pending_places.append(record)
+            if len(self.pending_places) >= self.batch_size:
+                self.flush()
+
+    def put_course(self, page_data: Dict):
+        """코스 페이지 저장 (crawling_course.ipynb의 page_data 형식)"""
+        with self.lock:
+            self.pending_courses.append(page_data)
+            if len(self.pending_courses) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """모아 둔 결과를 한 트랜잭션으로 upsert"""
+        with self.lock:
+            if not self.pending_places and not self.pending_courses:
+                return
+            now = time.time()
+            with self.conn:
+                # 오류 결과는 이전에 성공한 결과를 덮어쓰지 않음
+                self.conn.executemany(
+                    """
+                    INSERT INTO places VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (cotid) DO UPDATE SET
+                        name = excluded.name, url = excluded.url, photo_urls = excluded.photo_urls,
+                        details = excluded.details, error = excluded.error, updated_at = excluded.updated_at
+                    WHERE excluded.error IS NULL OR places.error IS NOT NULL
+                    """,
+                    [
+                        (
+                            record["id"],
+                            record.get("name"),
+                            record.get("url"),
+                            json.dumps(record.get("photo_urls", []), ensure_ascii=False),
+                            json.dumps({key: value for key, value in record.items() if key not in _PLACE_KEYS}, ensure_ascii=False),
+                            record.get("error"),
+                            now,
+                        )
+                        for record in self.pending_places
+                    ]
+                )
+
+                for page in self.pending_courses:
+                    self.conn.execute(
+                        """
+                        INSERT INTO courses VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (cotid) DO UPDATE SET
+                            title = excluded.title, area = excluded.area, description = excluded.description,
+                            schedule = excluded.schedule, theme = excluded.theme, tags = excluded.tags,
+                            updated_at = excluded.updated_at
+                        """,
+                        (
+                            page["cotid"],
+                            page.get("코스 이름"),
+                            page.get("코스 지역"),
+                            page.get("코스 개요"),
+                            page.get("일정"),
+                            page.get("테마"),
+                            json.dumps(page.get("페이지태그") or [], ensure_ascii=False),
+                            now,
+                        )
+                    )
+                    # 세부 코스는 페이지 단위로 통째로 교체 (개수가 줄었을 때 남는 줄이 없게)
+                    self.conn.execute("DELETE FROM course_stops WHERE cotid = ?", (page["cotid"],))
+                    self.conn.executemany(
+                        "INSERT INTO course_stops VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                page["cotid"], position,
+                                stop.get("cos_no"), stop.get("cos_title"), stop.get("cos_add"),
+                                json.dumps(stop.get("cos_tag") or [], ensure_ascii=False),
+                            )
+                            for position, stop in enumerate(page.get("courses") or [])
+                        ]
+                    )
+
+            self.pending_places = []
+            self.pending_courses = []
+
+    def place_ids(self, include_errors: bool = False) -> set:
+        """저장된 장소 cotid"""
+        self.flush()
+        query = "SELECT cotid FROM places" + ("" if include_errors else " WHERE error IS NULL")
+        return {row[0] for row in self.conn.execute(query)}
+
+    def course_ids(self) -> set:
+        """저장된 코스 cotid"""
+        self.flush()
+        return {row[0] for row in self.conn.execute("SELECT cotid FROM courses")}
+
+    def _place_rows(self, location_ids: List[str]) -> Iterator[tuple]:
+        # SQLite 변수 개수 제한 때문에 나눠서 조회, 입력 순서대로 (저장소에 없는 ID는 건너뜀)
+        for i in range(0, len(location_ids), 500):
+            batch = location_ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT cotid, name, url, photo_urls, details, error FROM places WHERE cotid IN ({','.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            found = {row[0]: row for row in rows}
+            for location_id in dict.fromkeys(batch):
+                if location_id in found:
+                    yield found[location_id]
+
+    def iter_places(self, location_ids: Optional[List[str]] = None) -> Iterator[Dict]:
+        """장소 결과 (visitkorea_crawler 결과와 같은 형식, location_ids를 주면 그 장소만 입력 순서로, 아니면 전체를 저장 순서로)"""
+        self.flush()
+        if location_ids is None:
+            rows = self.conn.execute("SELECT cotid, name, url, photo_urls, details, error FROM places ORDER BY rowid")
+        else:
+            rows = self._place_rows(location_ids)
+        for cotid, name, url, photo_urls, details, error in rows:
+            record = {"id": cotid, "name": name, "url": url}
+            if error is None:
+                record["photo_urls"] = json.loads(photo_urls)
+                record.update(json.loads(details))
+            else:
+                record["error"] = error
+            yield record
+
+    def iter_courses(self) -> Iterator[Dict]:
+        """코스 페이지 (crawling_course.ipynb의 page_data 형식, 저장 순서)"""
+        self.flush()
+        rows = self.conn.execute(
+            "SELECT cotid, title, area, description, schedule, theme, tags FROM courses ORDER BY rowid"
+        )
+        for cotid, title, area, description, schedule, theme, tags in rows:
+            stops = self.conn.execute(
+                "SELECT cos_no, cos_title, cos_add, cos_tag FROM course_stops WHERE cotid = ? ORDER BY position",
+                (cotid,)
+            )
+            yield {
+                "cotid": cotid,
+                "코스 이름": title,
+                "코스 지역": area,
+                "코스 개요": description,
+                "일정": schedule,
+                "테마": theme,
+                "페이지태그": json.loads(tags),
+                "courses": [
+                    {"cos_no": cos_no, "cos_title": cos_title, "cos_add": cos_add, "cos_tag": json.loads(cos_tag)}
+                    for cos_no, cos_title, cos_add, cos_tag in stops
+                ],
+            }
+
+    def export_places(
+        self, json_path: Optional[str] = None, csv_path: Optional[str] = None, location_ids: Optional[List[str]] = None
+    ) -> int:
+        """
+        장소 결과를 JSON / CSV로 저장 (CSV 열은 result_sink.export_csv와 같은 순서, 저장한 개수 반환)
+        location_ids를 주면 그 장소만 입력 순서로 (None이면 저장소 전체)
+        """
+        count = 0
+        if json_path:
+            count = write_json_array(self.iter_places(location_ids), json_path, indent=2)
+        if csv_path:
+            columns = list(BASE_COLUMNS)
+            for record in self.iter_places(location_ids):
+                columns.extend(key for key in record if key not in columns)
+            sink = CsvSink(csv_path, columns)
+            try:
+                count = 0
+                for record in self.iter_places(location_ids):
+                    sink.write(record)
+                    count += 1
+            finally:
+                sink.close()
+        return count
+
+    def export_courses(self, json_path: Optional[str] = None, csv_path: Optional[str] = None) -> int:
+        """코스를 JSON / CSV로 저장 (CSV는 세부 코스 한 줄씩, 저장한 코스 수 반환)"""
+        count = 0
+        if json_path:
+            count = write_json_array(self.iter_courses(), json_path, indent=4)
+        if csv_path:
+            with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=COURSE_CSV_COLUMNS, lineterminator="\n")
+                writer.writeheader()
+                count = 0
+                for page in self.iter_courses():
+                    count += 1
+                    for stop in page["courses"]:
+                        writer.writerow({
+                            "cotid": page["cotid"],
+                            "코스 이름": page["코스 이름"],
+                            "코스 지역": page["코스 지역"],
+                            "코스 개요": page["코스 개요"],
+                            "일정": page["일정"],
+                            "테마": page["테마"],
+                            "페이지태그": ", ".join(page["페이지태그"]),
+                            "세부코스 번호": stop["cos_no"],
+                            "세부코스 제목": stop["cos_title"],
+                            "세부코스 주소": stop["cos_add"],
+                            "세부코스 태그": ", ".join(stop["cos_tag"]),
+                        })
+        return count
+
+    def close(self):
+        with self.lock:
+            self.flush()
+            self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 결과 저장소에서 JSON / CSV 내보내기")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="JSON / CSV 생성")
+    export.add_argument("table", choices=["places", "courses"], help="places (장소) 또는 courses (여행 코스)")
+    export.add_argument("--output", "-o", required=True, help="출력 파일명 (확장자 제외, .json과 .csv 생성)")
+    export.add_argument("--store", default=STORE_PATH, help=f"저장소 경로 (기본값: {STORE_PATH})")
+
+    args = parser.parse_args()
+
+    store = CrawlStore(args.store)
+    try:
+        exporter = store.export_places if args.table == "places" else store.export_courses
+        count = exporter(f"{args.output}.json", f"{args.output}.csv")
+        print(f"💾 {args.output}.json / {args.output}.csv 저장 완료 ({count}개)")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
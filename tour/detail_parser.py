@@ -0,0 +1,225 @@
+"""
+상세 페이지 HTML 파싱 백엔드
+- selectolax (lexbor) / lxml / BeautifulSoup(html.parser) 중 선택, 페이지마다 한 번만 파싱
+- 항목명/값은 #detailGo 안의 <li>에서만, 사진은 div#galleryGo 안의 swiper-slide에서만 추출
+  (기존 _parse_detail_section은 문서 전체의 <li>를 훑음)
+- 백엔드를 지정하지 않으면 HTML_PARSER 환경변수, 없으면 "auto" (selectolax -> lxml -> bs4 순서로 설치된 것)
+- 세 백엔드 모두 같은 형식 반환
+  {"title": 제목 또는 None, "has_detail": #detailGo 존재 여부, "detail_info": {항목명: 값}, "photo_urls": [URL]}
+"""
+
+import os
+import re
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+PARSERS = ("auto", "selectolax", "lxml", "bs4")
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        # selectolax 1.0 이전 (Modest 백엔드)
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+_TITLE_CLASS = re.compile(r"tit")
+
+
+def resolve_parser(parser: Optional[str] = None) -> str:
+    if parser is None:
+        parser = os.environ.get("HTML_PARSER", "auto")
+    if parser == "auto":
+        if HTMLParser is not None:
+            return "selectolax"
+        return "lxml" if lxml_html is not None else "bs4"
+    if parser not in PARSERS:
+        raise ValueError(f"알 수 없는 HTML 파서: {parser} (사용 가능: {', '.join(PARSERS)})")
+    if parser == "selectolax" and HTMLParser is None:
+        raise ImportError("selectolax가 설치되어 있지 않습니다. (pip install selectolax)")
+    if parser == "lxml" and lxml_html is None:
+        raise ImportError("lxml이 설치되어 있지 않습니다. (pip install lxml)")
+    return parser
+
+
+def set_default_parser(parser: str):
+    """기본 HTML 파서 지정"""
+    os.environ["HTML_PARSER"] = resolve_parser(parser)
+
+
+def available_parsers() -> List[str]:
+    """설치된 백엔드 (auto 제외)"""
+    parsers = []
+    if HTMLParser is not None:
+        parsers.append("selectolax")
+    if lxml_html is not None:
+        parsers.append("lxml")
+    return parsers + ["bs4"]
+
+
+def _join_values(label: str, values: List[str], item_text: str, has_spans: bool) -> str:
+    """항목값: span(.pc 우선) 텍스트를 ' / '로 합침, span이 없으면 항목 전체 텍스트에서 항목명 제거"""
+    if has_spans:
+        values = [value for value in values if value]
+        return " / ".join(values) if values else ""
+    return item_text.replace(label, "").strip()
+
+
+def _photo_url(src: Optional[str], data_src: Optional[str]) -> Optional[str]:
+    url = src or data_src
+    if url and url.startswith("http"):
+        return url.replace("&amp;", "&")
+    return None
+
+
+def _add_unique(urls: List[str], url: Optional[str]):
+    if url and url not in urls:
+        urls.append(url)
+
+
+def _title_class_match(class_value: str) -> bool:
+    return any(_TITLE_CLASS.search(name) for name in [class_value, *class_value.split()])
+
+
+def _parse_selectolax(html: str) -> Dict:
+    """selectolax (lexbor, C로 구현된 CSS 선택자)"""
+    tree = HTMLParser(html)
+
+    title_node = tree.css_first("h2")
+    if title_node is None:
+        title_node = next((node for node in tree.css("h1[class]") if _title_class_match(node.attributes.get("class") or "")), None)
+
+    detail = tree.css_first("#detailGo")
+    detail_info = {}
+    if detail is not None:
+        for item in detail.css("li"):
+            label_node = item.css_first("strong")
+            if label_node is None:
+                continue
+            label = label_node.text().strip()
+            spans = item.css("span.pc") or item.css("span")
+            value = _join_values(label, [span.text().strip() for span in spans], item.text(), bool(spans))
+            if value:
+                detail_info[label] = value
+
+    photo_urls = []
+    gallery = tree.css_first("div#galleryGo")
+    if gallery is not None:
+        for slide in gallery.css("div.swiper-slide"):
+            img = slide.css_first("img")
+            if img is not None:
+                _add_unique(photo_urls, _photo_url(img.attributes.get("src"), img.attributes.get("data-src")))
+
+    return {
+        "title": title_node.text().strip() if title_node is not None else None,
+        "has_detail": detail is not None,
+        "detail_info": detail_info,
+        "photo_urls": photo_urls,
+    }
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _parse_lxml(html: str) -> Dict:
+    """lxml (libxml2 HTML 파서 + XPath)"""
+    root = lxml_html.document_fromstring(html)
+
+    titles = root.xpath("(//h2)[1]")
+    if not titles:
+        titles = [node for node in root.xpath("//h1[@class]") if _title_class_match(node.get("class"))][:1]
+
+    details = root.xpath("(//*[@id='detailGo'])[1]")
+    detail_info = {}
+    if details:
+        for item in details[0].iterdescendants("li"):
+            labels = item.xpath("(.//strong)[1]")
+            if not labels:
+                continue
+            label = labels[0].text_content().strip()
+            spans = item.xpath(f".//span[{_has_class('pc')}]") or item.xpath(".//span")
+            value = _join_values(label, [span.text_content().strip() for span in spans], item.text_content(), bool(spans))
+            if value:
+                detail_info[label] = value
+
+    photo_urls = []
+    galleries = root.xpath("(//div[@id='galleryGo'])[1]")
+    if galleries:
+        for slide in galleries[0].xpath(f".//div[{_has_class('swiper-slide')}]"):
+            imgs = slide.xpath("(.//img)[1]")
+            if imgs:
+                _add_unique(photo_urls, _photo_url(imgs[0].get("src"), imgs[0].get("data-src")))
+
+    return {
+        "title": titles[0].text_content().strip() if titles else None,
+        "has_detail": bool(details),
+        "detail_info": detail_info,
+        "photo_urls": photo_urls,
+    }
+
+
+def _parse_bs4(html: str) -> Dict:
+    """BeautifulSoup html.parser (추가 설치 없이 사용 가능)"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    title_tag = soup.find("h2") or soup.find("h1", class_=_TITLE_CLASS)
+
+    detail = soup.find(id="detailGo")
+    detail_info = {}
+    if detail is not None:
+        for item in detail.find_all("li"):
+            label_tag = item.find("strong")
+            if not label_tag:
+                continue
+            label = label_tag.text.strip()
+            spans = item.find_all("span", class_="pc") or item.find_all("span")
+            value = _join_values(label, [span.text.strip() for span in spans], item.text, bool(spans))
+            if value:
+                detail_info[label] = value
+
+    photo_urls = []
+    gallery = soup.find("div", id="galleryGo")
+    if gallery is not None:
+        for slide in gallery.find_all("div", class_="swiper-slide"):
+            img = slide.find("img")
+            if img:
+                _add_unique(photo_urls, _photo_url(img.get("src"), img.get("data-src")))
+
+    return {
+        "title": title_tag.text.strip() if title_tag else None,
+        "has_detail": detail is not None,
+        "detail_info": detail_info,
+        "photo_urls": photo_urls,
+    }
+
+
+_BACKENDS = {
+    "selectolax": _parse_selectolax,
+    "lxml": _parse_lxml,
+    "bs4": _parse_bs4,
+}
+
+
+def parse_detail(html: str, parser: Optional[str] = None) -> Dict:
+    """
+    상세 페이지 HTML 파싱 (한 번만 파싱)
+
+    Args:
+        html: ms_detail.do HTML
+        parser: "auto" | "selectolax" | "lxml" | "bs4" (None이면 HTML_PARSER 환경변수, 없으면 "auto")
+
+    Returns:
+        {"title", "has_detail", "detail_info", "photo_urls"}
+    """
+    parser = resolve_parser(parser)
+    if not html or not html.strip():
+        return {"title": None, "has_detail": False, "detail_info": {}, "photo_urls": []}
+    return _BACKENDS[parser](html)
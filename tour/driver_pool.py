@@ -0,0 +1,160 @@
+"""
+Selenium 상세 페이지 병렬 크롤링 (WebDriver 풀)
+- 헤드리스 Chrome N개가 작업 큐 하나에서 장소 ID를 꺼내서 크롤링 (VisitKoreaCrawler.crawl_detail_info)
+- 드라이버마다 pages_per_driver 페이지를 처리하면 새 Chrome으로 교체 (메모리 누적 방지)
+- 드라이버가 죽으면 (세션 끊김, 시작 실패) 새 Chrome으로 교체하고 해당 장소를 다시 큐에 넣음
+- 결과는 입력 순서대로 합침
+"""
+
+import os
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from area_list_api import BASE_URL
+
+
+def default_pool_size() -> int:
+    """Chrome 하나가 코어 하나 정도를 쓰므로 코어 수 (최대 8)"""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _driver_alive(crawler) -> bool:
+    if crawler._driver is None:
+        return False
+    try:
+        crawler._driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def _discard_driver(crawler):
+    """죽은 드라이버 정리 (quit 실패는 무시, 다음 접근 때 새로 실행됨)"""
+    if crawler._driver is not None:
+        try:
+            crawler._driver.quit()
+        except Exception:
+            pass
+        crawler._driver = None
+
+
+class DriverPool:
+    """헤드리스 Chrome 여러 개로 상세 페이지 크롤링"""
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        headless: bool = True,
+        base_url: str = BASE_URL,
+        pages_per_driver: int = 50,
+        retries: int = 1,
+        delay: float = 0.0,
+        crawler_options: Optional[Dict] = None,
+    ):
+        """
+        Args:
+            size: 드라이버 수 (None이면 코어 수, 최대 8)
+            headless: 헤드리스 모드
+            base_url: 사이트 주소
+            pages_per_driver: 드라이버 하나가 처리할 페이지 수 (넘으면 새 Chrome으로 교체, 0이면 교체 안 함)
+            retries: 드라이버가 죽었을 때 같은 장소를 다시 시도할 횟수
+            delay: 드라이버마다 페이지 사이 대기 시간 (초)
+            crawler_options: 드라이버마다 만드는 VisitKoreaCrawler에 넘길 추가 인자
+        """
+        self.size = max(1, size or default_pool_size())
+        self.headless = headless
+        self.base_url = base_url
+        self.pages_per_driver = pages_per_driver
+        self.retries = retries
+        self.delay = delay
+        self.crawler_options = crawler_options or {}
+
+        self.lock = threading.Lock()
+        self.stats = {"pages": 0, "recycled": 0, "crashed": 0, "retried": 0}
+        self.timings = []
+
+    def _count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def _worker(self, worker_id: int, tasks: queue.Queue, results: List, total: int, on_result: Optional[Callable]):
+        from visitkorea_crawler import VisitKoreaCrawler
+
+        crawler = VisitKoreaCrawler(headless=self.headless, base_url=self.base_url, **self.crawler_options)
+        pages = 0
+        try:
+            while True:
+                try:
+                    index, location_id, attempt = tasks.get_nowait()
+                except queue.Empty:
+                    break
+
+                if self.pages_per_driver and pages >= self.pages_per_driver:
+                    _discard_driver(crawler)
+                    self._count("recycled")
+                    pages = 0
+
+                result = crawler.crawl_detail_info(location_id)
+                pages += 1
+
+                if 'error' in result and not _driver_alive(crawler):
+                    _discard_driver(crawler)
+                    self._count("crashed")
+                    pages = 0
+                    if attempt < self.retries:
+                        self._count("retried")
+                        print(f"  🔁 [드라이버 {worker_id}] Chrome 재시작 후 다시 시도: {location_id}")
+                        tasks.put((index, location_id, attempt + 1))
+                        continue
+
+                with self.lock:
+                    results[index] = result
+                    self.stats["pages"] += 1
+                    done = self.stats["pages"]
+                    if on_result:
+                        on_result(result)
+                mark = "❌" if 'error' in result else "✓"
+                print(f"[{done}/{total}] {mark} {result['name']} (드라이버 {worker_id})")
+
+                if self.delay:
+                    time.sleep(self.delay)
+        finally:
+            _discard_driver(crawler)
+            with self.lock:
+                self.timings.extend(crawler.timer.records)
+
+    def crawl(self, location_ids: List[str], on_result: Optional[Callable] = None) -> List[Dict]:
+        """
+        여러 장소 상세 정보 크롤링
+
+        Args:
+            location_ids: 장소 ID 리스트
+            on_result: 결과가 나올 때마다 호출 (완료 순서, 한 번에 한 스레드만 호출)
+
+        Returns:
+            상세 정보 리스트 (입력 순서)
+        """
+        tasks = queue.Queue()
+        for index, location_id in enumerate(location_ids):
+            tasks.put((index, location_id, 0))
+        results = [None] * len(location_ids)
+
+        size = min(self.size, len(location_ids)) or 1
+        print(f"🚗 Chrome {size}개로 {len(location_ids)}개 장소 크롤링")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=size) as pool:
+            futures = [pool.submit(self._worker, worker_id, tasks, results, len(location_ids), on_result) for worker_id in range(1, size + 1)]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"\n⚡ {len(location_ids)}개 페이지 {elapsed:.1f}초 ({len(location_ids) / elapsed if elapsed else 0:.2f}페이지/초), "
+            f"교체 {self.stats['recycled']}회, 비정상 종료 {self.stats['crashed']}회"
+        )
+        return results
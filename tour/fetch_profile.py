@@ -0,0 +1,106 @@
+"""
+페이지 종류별 리소스 차단 (Chrome DevTools Network.setBlockedURLs)
+- HTML만 파싱하므로 이미지 / 글꼴 / 동영상 / 분석 스크립트는 받을 필요가 없음
+- 목록 페이지: 이미지, 글꼴, 미디어, 분석 스크립트 차단
+- 상세 페이지: 같은 항목 차단, tabChange 등 사이트 스크립트와 CSS는 그대로
+  (사진 URL은 img 태그의 src / data-src에서 읽으므로 이미지를 받지 않아도 됨)
+- 성능 로그(goog:loggingPrefs)로 페이지별 전송 바이트 / 요청 수 / 차단 수 집계
+"""
+
+import json
+from typing import Dict, List
+
+from selenium.common.exceptions import WebDriverException
+
+IMAGES = ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"]
+FONTS = ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"]
+MEDIA = ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*youtube.com/embed*", "*player.vimeo.com*"]
+TRACKERS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*wcs.naver.net*",
+    "*t1.daumcdn.net/kas*",
+]
+
+#. 프로필별 {페이지 종류: 차단할 URL 패턴}
+FETCH_PROFILES = {
+    "full": {"list": [], "detail": []},
+    "lean": {
+        "list": IMAGES + FONTS + MEDIA + TRACKERS,
+        "detail": IMAGES + FONTS + MEDIA + TRACKERS,
+    },
+}
+
+#. 성능 로그를 켜는 ChromeOptions capability
+LOGGING_PREFS = {"performance": "ALL"}
+
+
+class NetworkProfile:
+    """드라이버 하나의 리소스 차단 설정과 네트워크 사용량 집계"""
+
+    def __init__(self, driver, profile: str = "full"):
+        """
+        Args:
+            driver: Chrome WebDriver (goog:loggingPrefs에 LOGGING_PREFS를 넣어서 만든 것)
+            profile: FETCH_PROFILES 키
+        """
+        if profile not in FETCH_PROFILES:
+            raise ValueError(f"profile은 {tuple(FETCH_PROFILES)} 중 하나여야 합니다: {profile}")
+        self.driver = driver
+        self.profile = profile
+        self.blocked: List[str] = []
+
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            self.enabled = True
+        except (AttributeError, WebDriverException):
+            self.enabled = False
+
+    def use(self, page_type: str):
+        """
+        다음에 열 페이지 종류에 맞춰 차단 목록 설정 (이전 페이지 사용량 기록은 비움)
+
+        Args:
+            page_type: "list" 또는 "detail"
+        """
+        if not self.enabled:
+            return
+        patterns = FETCH_PROFILES[self.profile][page_type]
+        if patterns != self.blocked:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            self.blocked = patterns
+        self.usage()
+
+    def usage(self) -> Dict:
+        """
+        마지막 호출 이후 네트워크 사용량
+
+        Returns:
+            {"bytes": 전송 바이트, "requests": 요청 수, "blocked": 차단된 요청 수}
+            (성능 로그를 읽을 수 없으면 빈 딕셔너리)
+        """
+        try:
+            entries = self.driver.get_log("performance")
+        except (AttributeError, WebDriverException):
+            return {}
+
+        total_bytes = 0
+        requests = 0
+        blocked = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                requests += 1
+            elif method == "Network.loadingFinished":
+                total_bytes += params.get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked += 1
+
+        return {"bytes": int(total_bytes), "requests": requests, "blocked": blocked}
@@ -0,0 +1,194 @@
+"""
+고정 time.sleep 대신 DOM 조건으로 기다리기
+- 문서 로드 완료, XHR/fetch 요청이 잠잠해짐, 카드 수 증가, #detailGo 내용 채워짐 등
+- 조건이 만족되면 바로 다음 단계로 넘어가고, 시간 초과면 그냥 진행 (기존 sleep과 같은 동작)
+- mode="sleep"이면 기존 고정 대기 시간 그대로 (전후 시간 비교용)
+- PageTimer로 페이지별 소요 시간을 기록해서 두 방식 비교
+"""
+
+import time
+import json
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+#. 대기 종류별 최대 시간 (초)
+WAIT_TIMEOUTS = {
+    "page": 15,     # 페이지 로드 + 요청 완료
+    "popup": 5,     # 지역 선택 팝업
+    "more": 10,     # 더보기 클릭 후 카드 추가
+    "detail": 3,    # 상세정보 탭 내용 (기존 고정 대기 2초)
+    "idle": 0.5,    # 마지막 요청 후 이만큼 조용하면 완료로 봄
+}
+WAIT_MODES = ("condition", "sleep")
+POLL_SECONDS = 0.1
+
+#. 새 문서마다 XHR / fetch 진행 중인 요청 수를 세는 스크립트 (CDP로 페이지 스크립트보다 먼저 실행)
+XHR_TRACKER = """
+(function () {
+  if (window.__pendingRequests !== undefined) return;
+  window.__pendingRequests = 0;
+  window.__lastRequestDone = Date.now();
+  function done() { window.__pendingRequests--; window.__lastRequestDone = Date.now(); }
+  var send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    window.__pendingRequests++;
+    this.addEventListener('loadend', done);
+    return send.apply(this, arguments);
+  };
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      window.__pendingRequests++;
+      return originalFetch.apply(this, arguments).finally(done);
+    };
+  }
+})();
+"""
+
+CARD_SELECTOR = "a[href*='goDetailPage(']"
+DETAIL_ITEM_SELECTOR = "#detailGo li strong"
+DETAIL_SELECTOR = "#detailGo"
+
+
+def install_xhr_tracker(driver) -> bool:
+    """요청 추적 스크립트 등록 (Chrome 전용, 실패하면 False -> XHR 조건은 문서 로드만 확인)"""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": XHR_TRACKER})
+        return True
+    except (AttributeError, WebDriverException):
+        return False
+
+
+def document_ready(driver) -> bool:
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def xhr_idle(quiet: float) -> Callable:
+    """문서 로드가 끝났고 진행 중인 요청 없이 quiet초가 지났으면 True"""
+    script = (
+        "if (document.readyState !== 'complete') return false;"
+        "if (window.__pendingRequests === undefined) return true;"
+        f"return window.__pendingRequests <= 0 && Date.now() - window.__lastRequestDone >= {int(quiet * 1000)};"
+    )
+    return lambda driver: driver.execute_script(script)
+
+
+def element_count(driver, css: str) -> int:
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length", css)
+
+
+def count_increased(css: str, before: int) -> Callable:
+    """css로 찾은 요소 수가 before보다 많아지면 True"""
+    return lambda driver: element_count(driver, css) > before
+
+
+def present(css: str) -> Callable:
+    return lambda driver: element_count(driver, css) > 0
+
+
+def detail_settled(quiet: float) -> Callable:
+    """상세정보 항목이 보이거나, #detailGo가 있고 요청이 잠잠해졌으면 True (항목이 없는 페이지에서 시간 초과까지 기다리지 않음)"""
+    idle = xhr_idle(quiet)
+    return lambda driver: element_count(driver, DETAIL_ITEM_SELECTOR) > 0 or (element_count(driver, DETAIL_SELECTOR) > 0 and idle(driver))
+
+
+def invisible(css: str) -> Callable:
+    """요소가 없거나 모두 숨겨졌으면 True"""
+    def check(driver):
+        return all(not element.is_displayed() for element in driver.find_elements(By.CSS_SELECTOR, css))
+    return check
+
+
+class PageWaits:
+    """드라이버 하나에 묶인 대기 도우미"""
+
+    def __init__(self, driver, mode: str = "condition", timeouts: Optional[Dict] = None):
+        """
+        Args:
+            driver: WebDriver
+            mode: "condition" (DOM 조건) 또는 "sleep" (기존 고정 대기)
+            timeouts: WAIT_TIMEOUTS 중 바꿀 값
+        """
+        if mode not in WAIT_MODES:
+            raise ValueError(f"mode는 {WAIT_MODES} 중 하나여야 합니다: {mode}")
+        self.driver = driver
+        self.mode = mode
+        self.timeouts = {**WAIT_TIMEOUTS, **(timeouts or {})}
+
+    def until(self, sleep: float, condition: Optional[Callable] = None, timeout: str = "page") -> bool:
+        """
+        sleep 모드면 sleep초 대기, condition 모드면 condition이 참이 될 때까지 대기
+
+        Args:
+            sleep: 기존 고정 대기 시간 (초)
+            condition: driver -> bool (None이면 condition 모드에서 기다리지 않음)
+            timeout: WAIT_TIMEOUTS 키
+
+        Returns:
+            조건 만족 여부 (sleep 모드 / 조건 없음은 True, 시간 초과는 False)
+        """
+        if self.mode == "sleep":
+            time.sleep(sleep)
+            return True
+        if condition is None:
+            return True
+        try:
+            WebDriverWait(self.driver, self.timeouts[timeout], poll_frequency=POLL_SECONDS).until(condition)
+            return True
+        except TimeoutException:
+            return False
+
+    def page_loaded(self, sleep: float) -> bool:
+        return self.until(sleep, xhr_idle(self.timeouts["idle"]), "page")
+
+    def cards_added(self, sleep: float, before: int) -> bool:
+        return self.until(sleep, count_increased(CARD_SELECTOR, before), "more")
+
+    def detail_loaded(self, sleep: float) -> bool:
+        return self.until(sleep, detail_settled(self.timeouts["idle"]), "detail")
+
+
+class PageTimer:
+    """페이지별 소요 시간 (와 네트워크 사용량) 기록"""
+
+    def __init__(self, mode: str, profile: Optional[str] = None):
+        self.mode = mode
+        self.profile = profile
+        self.records: List[Dict] = []
+
+    def record(self, kind: str, key: str, seconds: float, **usage):
+        """usage: NetworkProfile.usage() 결과 (bytes, requests, blocked)"""
+        self.records.append({"kind": kind, "key": key, "mode": self.mode, "seconds": round(seconds, 3), **usage})
+
+    def summary(self) -> Dict[str, Dict]:
+        """{종류: {"count", "total", "mean", "max", "bytes", "mean_bytes"}}"""
+        result = {}
+        for record in self.records:
+            stat = result.setdefault(record["kind"], {"count": 0, "total": 0.0, "max": 0.0, "bytes": 0})
+            stat["count"] += 1
+            stat["total"] += record["seconds"]
+            stat["max"] = max(stat["max"], record["seconds"])
+            stat["bytes"] += record.get("bytes", 0)
+        for stat in result.values():
+            stat["mean"] = stat["total"] / stat["count"]
+            stat["mean_bytes"] = stat["bytes"] / stat["count"]
+        return result
+
+    def print_summary(self):
+        label = f"{self.mode}, {self.profile}" if self.profile else self.mode
+        for kind, stat in self.summary().items():
+            line = f"⏱️  {kind} ({label}): {stat['count']}개, 평균 {stat['mean']:.2f}초, 최대 {stat['max']:.2f}초, 합계 {stat['total']:.1f}초"
+            if stat["bytes"]:
+                line += f", 평균 {stat['mean_bytes'] / 1024:.0f}KB"
+            print(line)
+
+    def save(self, filename: str):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(
+                {"mode": self.mode, "profile": self.profile, "summary": self.summary(), "pages": self.records},
+                f, ensure_ascii=False, indent=2
+            )
+        print(f"💾 페이지별 소요 시간 저장: {filename}")
@@ -0,0 +1,196 @@
+"""
+상세 페이지 파서 벤치마크 (저장해 둔 HTML 사용)
+- save: 상세 페이지 HTML을 파일로 저장 (실제 사이트 또는 stub_server.py)
+- run: 기존 방식(BeautifulSoup 두 번 + 문서 전체 <li>)과 detail_parser 백엔드별 파싱 시간 / 결과 비교
+
+사용 예시:
+  python stub_server.py --port 8000 &
+  python parser_benchmark.py save --base-url http://127.0.0.1:8000 --count 200
+  python parser_benchmark.py run --repeat 5
+"""
+
+import os
+import re
+import json
+import time
+import glob
+import argparse
+from typing import Dict, List
+
+import requests
+from bs4 import BeautifulSoup
+
+from area_list_api import AreaListClient, BASE_URL, USER_AGENT
+from detail_parser import available_parsers, parse_detail
+
+FIXTURE_DIR = "data/html_fixtures"
+
+#. 비교하는 항목
+COMPARED_KEYS = ("title", "detail_info", "photo_urls")
+
+
+def parse_current(html: str) -> Dict:
+    """기존 crawl_detail_info와 같은 방식 (탭 전환 전후로 BeautifulSoup 두 번, 문서 전체 <li>)"""
+    from visitkorea_crawler import VisitKoreaCrawler
+
+    soup = BeautifulSoup(html, 'html.parser')
+    title_tag = soup.find('h2') or soup.find('h1', class_=re.compile(r'tit'))
+
+    soup = BeautifulSoup(html, 'html.parser')
+    return {
+        "title": title_tag.text.strip() if title_tag else None,
+        "has_detail": soup.find(id='detailGo') is not None,
+        "detail_info": VisitKoreaCrawler._parse_detail_section(soup),
+        "photo_urls": VisitKoreaCrawler._extract_photo_urls(soup),
+    }
+
+
+def _scope_only(output: Dict, reference: Dict) -> bool:
+    """상세정보 차이가 #detailGo 밖의 <li> 항목이 빠진 것뿐인지"""
+    return all(reference.get(key) == value for key, value in output.items())
+
+
+def save_fixtures(base_url: str, directory: str, count: int, ids_path: str = None) -> int:
+    """
+    상세 페이지 HTML 저장 ({cotid}.html)
+
+    Args:
+        base_url: 사이트 주소
+        directory: 저장 폴더
+        count: 저장할 페이지 수
+        ids_path: 장소 ID 목록 JSON (None이면 목록 API로 수집)
+    """
+    if ids_path:
+        with open(ids_path, encoding="utf-8") as f:
+            location_ids = json.load(f)[:count]
+    else:
+        client = AreaListClient(base_url)
+        try:
+            location_ids = client.fetch_ids()[:count]
+        finally:
+            client.close()
+
+    os.makedirs(directory, exist_ok=True)
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+
+    saved = 0
+    for location_id in location_ids:
+        resp = session.get(f"{base_url.rstrip('/')}/detail/ms_detail.do", params={"cotid": location_id}, timeout=15)
+        if resp.status_code != 200:
+            print(f"  ⚠️  {location_id}: HTTP {resp.status_code}")
+            continue
+        with open(os.path.join(directory, f"{location_id}.html"), "w", encoding="utf-8") as f:
+            f.write(resp.text)
+        saved += 1
+
+    session.close()
+    return saved
+
+
+def run_benchmark(paths: List[str], parsers: List[str], repeat: int = 3) -> Dict:
+    """
+    Returns:
+        {"pages": 페이지 수, "results": {파서: {"seconds", "ms_per_page", "speedup", "same_as_current", "same_as_bs4", "mismatches"}}}
+        same_as_bs4는 같은 범위(#detailGo / #galleryGo)로 추출하는 bs4 백엔드와 결과가 같은 페이지 수
+    """
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            pages.append((os.path.basename(path), f.read()))
+
+    def measure(parse) -> tuple:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outputs = [parse(html) for _, html in pages]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, outputs
+
+    current_seconds, current_outputs = measure(parse_current)
+    _, scoped_outputs = measure(lambda html: parse_detail(html, "bs4"))
+
+    results = {"current": {"seconds": current_seconds, "same_as_current": len(pages), "mismatches": []}}
+    for parser in parsers:
+        seconds, outputs = measure(lambda html: parse_detail(html, parser))
+        mismatches = []
+        same_as_bs4 = 0
+        for (name, _), output, reference, scoped in zip(pages, outputs, current_outputs, scoped_outputs):
+            differing = [key for key in COMPARED_KEYS if output[key] != reference[key]]
+            if differing == ["detail_info"] and _scope_only(output["detail_info"], reference["detail_info"]):
+                differing = ["detail_info (#detailGo 밖 항목 제외)"]
+            if differing:
+                mismatches.append({"page": name, "keys": differing})
+            if all(output[key] == scoped[key] for key in COMPARED_KEYS):
+                same_as_bs4 += 1
+        results[parser] = {
+            "seconds": seconds,
+            "same_as_current": len(pages) - len(mismatches),
+            "same_as_bs4": same_as_bs4,
+            "mismatches": mismatches,
+        }
+
+    for result in results.values():
+        result["ms_per_page"] = result["seconds"] * 1000 / len(pages)
+        result["speedup"] = current_seconds / result["seconds"] if result["seconds"] else 0.0
+
+    return {"pages": len(pages), "repeat": repeat, "results": results}
+
+
+def print_report(report: Dict):
+    total = report["pages"]
+    print(f"\n📊 HTML {total}개, {report['repeat']}회 반복 중 가장 빠른 시간")
+    print(f"{'파서':<12}{'페이지당':>10}{'속도':>8}{'기존과 같음':>14}{'bs4와 같음':>12}")
+    for parser, result in report["results"].items():
+        same_as_bs4 = f"{result['same_as_bs4']}/{total}" if "same_as_bs4" in result else "-"
+        print(
+            f"{parser:<12}{result['ms_per_page']:>8.2f}ms{result['speedup']:>7.1f}x"
+            f"{result['same_as_current']:>10}/{total}{same_as_bs4:>12}"
+        )
+
+    for parser, result in report["results"].items():
+        for mismatch in result["mismatches"][:5]:
+            print(f"  ⚠️  {parser}: {mismatch['page']} - 다른 항목 {', '.join(mismatch['keys'])}")
+        if len(result["mismatches"]) > 5:
+            print(f"  ... {parser}: 외 {len(result['mismatches']) - 5}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상세 페이지 파서 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    save = subparsers.add_parser("save", help="상세 페이지 HTML 저장")
+    save.add_argument("--base-url", default=BASE_URL, help=f"사이트 주소 (기본값: {BASE_URL})")
+    save.add_argument("--count", type=int, default=100, help="저장할 페이지 수 (기본값: 100)")
+    save.add_argument("--ids", default=None, help="장소 ID 목록 JSON (기본값: 목록 API로 수집)")
+    save.add_argument("--dir", default=FIXTURE_DIR, help=f"저장 폴더 (기본값: {FIXTURE_DIR})")
+
+    run = subparsers.add_parser("run", help="파싱 시간 / 결과 비교")
+    run.add_argument("--dir", default=FIXTURE_DIR, help=f"HTML 폴더 (기본값: {FIXTURE_DIR})")
+    run.add_argument("--parsers", nargs="+", default=None, help="비교할 파서 (기본값: 설치된 것 모두)")
+    run.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    run.add_argument("--output", "-o", default=None, help="결과 JSON 경로")
+
+    args = parser.parse_args()
+
+    if args.command == "save":
+        saved = save_fixtures(args.base_url, args.dir, args.count, args.ids)
+        print(f"💾 HTML {saved}개 저장: {args.dir}")
+        return
+
+    paths = sorted(glob.glob(os.path.join(args.dir, "*.html")))
+    if not paths:
+        parser.error(f"HTML 파일이 없습니다: {args.dir} (먼저 save 실행)")
+
+    report = run_benchmark(paths, args.parsers or available_parsers(), args.repeat)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+크롤링 결과 스트리밍 저장 (JSONL / CSV)
+- 장소 하나가 끝날 때마다 한 줄씩 추가 (전체 결과를 메모리에 모으지 않음)
+- fsync는 fsync_every개마다 한 번 (중간에 죽어도 잃는 건 마지막 몇 개뿐)
+- 이어서 실행하면 끊긴 마지막 줄을 잘라내고 이미 저장된 ID는 건너뜀
+- 최종 JSON / CSV는 JSONL 파일을 한 줄씩 읽어서 만듦 (같은 ID는 마지막 줄만)
+"""
+
+import os
+import csv
+import json
+from typing import Dict, Iterator, List, Optional, Set
+
+#. CSV 앞쪽에 고정으로 두는 열 (나머지 상세정보 항목은 처음 나온 순서대로)
+BASE_COLUMNS = ["id", "name", "url", "photo_urls"]
+#. 고정 열에 없는 항목을 JSON으로 모아 두는 열 (CsvSink에 열 목록을 직접 준 경우)
+EXTRA_COLUMN = "extra"
+
+
+def _truncate_partial_line(path: str):
+    """쓰다가 끊긴 마지막 줄 제거 (다음에 추가하는 줄과 붙지 않게)"""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # 마지막 줄바꿈 위치 찾기
+        position = size
+        while position > 0:
+            step = min(64 * 1024, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step)
+            index = block.rfind(b"\n")
+            if index >= 0:
+                f.truncate(position + index + 1)
+                return
+        f.truncate(0)
+
+
+def iter_jsonl(path: str) -> Iterator[Dict]:
+    """JSONL 결과를 한 줄씩 (깨진 줄은 건너뜀)"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def iter_latest(path: str) -> Iterator[Dict]:
+    """같은 ID가 여러 번 있으면 마지막 결과만 (파일 순서, 메모리에는 ID별 줄 번호만 둠)"""
+    last_line = {}
+    for number, record in enumerate(iter_jsonl(path)):
+        last_line[record.get("id")] = number
+    for number, record in enumerate(iter_jsonl(path)):
+        if last_line.get(record.get("id")) == number:
+            yield record
+
+
+class JsonlSink:
+    """결과를 JSONL로 한 줄씩 저장"""
+
+    def __init__(self, path: str, resume: bool = False, fsync_every: int = 20):
+        """
+        Args:
+            path: JSONL 경로
+            resume: 기존 파일에 이어서 저장 (False면 새로 시작)
+            fsync_every: 몇 개마다 디스크에 강제로 기록할지
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.pending = 0
+        self.done: Set[str] = set()
+
+        if resume and os.path.exists(path):
+            _truncate_partial_line(path)
+            self.done = {record["id"] for record in iter_jsonl(path) if "id" in record and "error" not in record}
+            self.file = open(path, "a", encoding="utf-8")
+        else:
+            self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, record: Dict):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.pending += 1
+        if "error" not in record:
+            self.done.add(record["id"])
+        if self.pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+
+class CsvSink:
+    """결과를 정해진 열로 CSV에 한 줄씩 저장"""
+
+    def __init__(self, path: str, columns: Optional[List[str]] = None):
+        """
+        Args:
+            path: CSV 경로
+            columns: 열 목록 (None이면 BASE_COLUMNS + EXTRA_COLUMN, 목록에 없는 항목은 EXTRA_COLUMN에 JSON으로)
+        """
+        self.columns = list(columns or BASE_COLUMNS + [EXTRA_COLUMN])
+        self.file = open(path, "w", encoding="utf-8-sig", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=self.columns, lineterminator="\n")
+        self.writer.writeheader()
+
+    def write(self, record: Dict):
+        row = {}
+        extra = {}
+        for key, value in record.items():
+            if isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False)
+            if key in self.columns:
+                row[key] = value
+            else:
+                extra[key] = value
+        if extra and EXTRA_COLUMN in self.columns:
+            row[EXTRA_COLUMN] = json.dumps(extra, ensure_ascii=False)
+        self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+
+def write_json_array(records: Iterator[Dict], path: str, indent: int = 2) -> int:
+    """레코드를 한 개씩 JSON 배열로 씀 (json.dump(list, indent=indent)와 같은 모양, 저장한 개수 반환)"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for record in records:
+            text = json.dumps(record, ensure_ascii=False, indent=indent)
+            f.write(",\n" if count else "\n")
+            f.write("\n".join(" " * indent + line for line in text.splitlines()))
+            count += 1
+        f.write("\n]" if count else "]")
+    return count
+
+
+def export_json(jsonl_path: str, json_path: str) -> int:
+    """JSONL -> JSON 배열 (한 줄씩 읽어서 씀, 기존 save_to_json과 같은 indent=2, 저장한 개수 반환)"""
+    return write_json_array(iter_latest(jsonl_path), json_path, indent=2)
+
+
+def export_csv(jsonl_path: str, csv_path: str) -> int:
+    """
+    JSONL -> CSV (한 줄씩 읽어서 씀, 저장한 개수 반환)
+    열: BASE_COLUMNS + 나머지 항목을 처음 나온 순서대로 (실행마다 같은 데이터면 같은 열, 나중 줄로 대체된 결과는 제외)
+    """
+    columns = list(BASE_COLUMNS)
+    seen = set(columns)
+    for record in iter_latest(jsonl_path):
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                columns.append(key)
+
+    sink = CsvSink(csv_path, columns)
+    count = 0
+    try:
+        for record in iter_latest(jsonl_path):
+            sink.write(record)
+            count += 1
+    finally:
+        sink.close()
+    return count
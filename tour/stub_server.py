@@ -0,0 +1,202 @@
+"""
+로컬 테스트용 구석구석 흉내 서버
+- POST /main/areaListAjax.do : 가짜 장소 목록 JSON (page, pageSize)
+- GET  /main/area_list.do    : 목록 페이지 (카드 없음)
+- GET  /detail/ms_detail.do  : #detailGo / #galleryGo가 있는 상세 페이지 (ETag, If-None-Match면 304)
+  (--fail-first면 장소마다 처음 N번은 429/503 + Retry-After, --js-every면 #detailGo가 빈 페이지)
+- 실제 사이트에 요청하지 않고 크롤러의 API 경로 / 대체 경로를 확인할 때 사용
+
+사용 예시:
+  python stub_server.py --port 8000 --places 100
+  python visitkorea_crawler.py --base-url http://127.0.0.1:8000 --discovery api
+"""
+
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+DETAIL_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>{name}</title></head>
+<body>
+<div class="titArea"><h2 id="topTitle">{name}</h2></div>
+<div id="detailGo" class="area_txtView">
+  <div class="inr_wrap"><div class="inr"><p>{name} 소개 문장입니다.</p>
+  <ul>
+    <li><strong>문의 및 안내</strong><span class="mo"><a href="tel:02-000-{index:04d}">02-000-{index:04d}</a></span><span class="pc">02-000-{index:04d}</span></li>
+    <li><strong>주소</strong><span>서울특별시 테스트구 샘플로 {index}</span></li>
+    <li><strong>이용시간</strong><span>09:00~18:00</span></li>
+    <li><strong>휴일</strong><span>연중무휴</span></li>
+  </ul></div></div>
+</div>
+<div id="galleryGo">
+  <div class="swiper-container"><div class="swiper-wrapper">
+    <div class="swiper-slide"><img src="http://127.0.0.1/img/{cotid}_1.jpg&amp;w=800" alt=""></div>
+    <div class="swiper-slide"><img class="swiper-lazy" data-src="http://127.0.0.1/img/{cotid}_2.jpg" alt=""></div>
+  </div></div>
+</div>
+<script>function tabChange(id) {{ document.getElementById(id).scrollIntoView(); }}</script>
+</body>
+</html>
+"""
+
+#. JavaScript로 상세정보를 채우는 페이지 (정적 HTML의 #detailGo는 비어 있음)
+JS_ONLY_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>{name}</title></head>
+<body>
+<div class="titArea"><h2 id="topTitle">{name}</h2></div>
+<div id="detailGo" class="area_txtView"></div>
+<script>document.getElementById('detailGo').innerHTML = '<ul><li><strong>주소</strong><span>서울특별시 테스트구 샘플로 {index}</span></li></ul>';</script>
+</body>
+</html>
+"""
+
+
+def place_id(index: int) -> str:
+    return f"stub-{index:05d}"
+
+
+def make_handler(options: Dict):
+    """
+    Args:
+        options: {"places": 장소 수, "fail_list": 목록 API 500 응답, "no_total": 전체 개수 생략, "delay": 응답 지연 (초),
+                  "revision": 상세 페이지 내용 버전 (바꾸면 이름과 ETag가 달라짐),
+                  "fail_first": 장소마다 처음 몇 번을 실패로 응답할지, "fail_status": 실패 상태 코드 (429 / 503),
+                  "retry_after": 실패 응답의 Retry-After (초), "js_every": 장소 번호가 이 값의 배수면 #detailGo가 빈 페이지,
+                  "hits": 장소별 상세 페이지 요청 수를 기록할 딕셔너리 (없으면 새로 만듦),
+                  "list_forms": 목록 API 요청 폼을 기록할 리스트 (없으면 새로 만듦)}
+    """
+    hits = options.setdefault("hits", {})
+    list_forms = options.setdefault("list_forms", [])
+    hits_lock = threading.Lock()
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            if options.get("verbose"):
+                super().log_message(format, *args)
+
+        def _send(self, status: int, body: str, content_type: str, headers: Optional[Dict] = None):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            time.sleep(options.get("delay", 0))
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+
+            if url.path == "/detail/ms_detail.do":
+                cotid = query.get("cotid", [""])[0]
+                if not cotid.startswith("stub-"):
+                    self._send(404, "not found", "text/plain")
+                    return
+                index = int(cotid.split("-")[1])
+                with hits_lock:
+                    hits[cotid] = hits.get(cotid, 0) + 1
+                    attempt = hits[cotid]
+                if attempt <= options.get("fail_first", 0):
+                    self._send(
+                        options.get("fail_status", 503), "try again later", "text/plain",
+                        {"Retry-After": str(options.get("retry_after", 1))}
+                    )
+                    return
+                revision = options.get("revision", 0)
+                etag = f'"{cotid}-{revision}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                name = f"테스트 장소 {index}" + (f" (v{revision})" if revision else "")
+                js_every = options.get("js_every", 0)
+                template = JS_ONLY_TEMPLATE if js_every and index % js_every == 0 else DETAIL_TEMPLATE
+                self._send(200, template.format(name=name, index=index, cotid=cotid), "text/html", {"ETag": etag})
+            elif url.path == "/main/area_list.do":
+                self._send(200, "<html><body><div class='list_setup_area'><ul></ul></div></body></html>", "text/html")
+            else:
+                self._send(404, "not found", "text/plain")
+
+        def do_POST(self):
+            time.sleep(options.get("delay", 0))
+            url = urlparse(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+
+            if url.path != "/main/areaListAjax.do":
+                self._send(404, "not found", "text/plain")
+                return
+            with hits_lock:
+                list_forms.append({key: values[0] for key, values in form.items()})
+            if options.get("fail_list"):
+                self._send(500, "<html>error</html>", "text/html")
+                return
+
+            page = int(form.get("page", ["1"])[0])
+            size = int(form.get("pageSize", ["12"])[0])
+            start = (page - 1) * size
+            indexes = range(start + 1, min(start + size, options["places"]) + 1)
+
+            body = {"result": [{"cotid": place_id(i), "title": f"테스트 장소 {i}"} for i in indexes]}
+            if not options.get("no_total"):
+                body["totalCount"] = options["places"]
+            self._send(200, json.dumps({"header": {"process": "success"}, "body": body}, ensure_ascii=False), "application/json")
+
+    return StubHandler
+
+
+def start_server(port: int = 0, places: int = 100, **options) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 서버 시작 (port=0이면 빈 포트 사용, 주소는 server.server_address)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler({"places": places, **options}))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 테스트용 구석구석 흉내 서버")
+    parser.add_argument("--port", type=int, default=8000, help="포트 (기본값: 8000)")
+    parser.add_argument("--places", type=int, default=100, help="가짜 장소 수 (기본값: 100)")
+    parser.add_argument("--fail-list", action="store_true", help="목록 API가 500을 반환 (Selenium 대체 경로 확인용)")
+    parser.add_argument("--no-total", action="store_true", help="목록 응답에서 전체 개수 생략")
+    parser.add_argument("--delay", type=float, default=0.0, help="응답마다 지연 시간 (초)")
+    parser.add_argument("--revision", type=int, default=0, help="상세 페이지 내용 버전 (증분 크롤링 확인용)")
+    parser.add_argument("--fail-first", type=int, default=0, help="장소마다 처음 N번은 실패 응답 (재시도 확인용)")
+    parser.add_argument("--fail-status", type=int, choices=[429, 503], default=503, help="실패 응답 상태 코드 (기본값: 503)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="실패 응답의 Retry-After (초, 기본값: 1)")
+    parser.add_argument("--js-every", type=int, default=0, help="장소 번호가 N의 배수면 #detailGo가 빈 페이지 (브라우저 대체 경로 확인용)")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    options = {
+        "places": args.places,
+        "fail_list": args.fail_list,
+        "no_total": args.no_total,
+        "delay": args.delay,
+        "revision": args.revision,
+        "fail_first": args.fail_first,
+        "fail_status": args.fail_status,
+        "retry_after": args.retry_after,
+        "js_every": args.js_every,
+        "verbose": args.verbose,
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(options))
+    print(f"🧪 테스트 서버: http://127.0.0.1:{args.port} (장소 {args.places}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
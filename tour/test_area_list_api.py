@@ -0,0 +1,113 @@
+"""
+area_list_api / 장소 목록 수집 경로 테스트 (stub_server.py를 빈 포트로 띄워서 실제 HTTP로 확인)
+
+실행:
+  python -m pytest -q test_area_list_api.py
+"""
+
+import pytest
+
+from area_list_api import AREA_CODE_PARAM, AreaListClient, AreaListError, SEOUL_AREA_CODE
+from stub_server import place_id, start_server
+from visitkorea_crawler import VisitKoreaCrawler
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**options):
+        options.setdefault("list_forms", [])
+        server = start_server(port=0, **options)
+        servers.append(server)
+        host, port = server.server_address
+        return f"http://{host}:{port}", options
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def requested_pages(options):
+    return sorted(int(form["page"]) for form in options["list_forms"])
+
+
+def test_parallel_pages_with_total(stub):
+    base_url, options = stub(places=30)
+    client = AreaListClient(base_url, workers=4, params={AREA_CODE_PARAM: "1"})
+    try:
+        location_ids = client.fetch_ids()
+    finally:
+        client.close()
+
+    assert location_ids == [place_id(i) for i in range(1, 31)]
+    # 전체 30개 / 페이지당 12개 -> 3페이지만 요청
+    assert requested_pages(options) == [1, 2, 3]
+    assert all(form[AREA_CODE_PARAM] == "1" for form in options["list_forms"])
+
+
+def test_max_pages_with_total(stub):
+    base_url, options = stub(places=30)
+    client = AreaListClient(base_url)
+    try:
+        location_ids = client.fetch_ids(max_pages=2)
+    finally:
+        client.close()
+
+    assert location_ids == [place_id(i) for i in range(1, 25)]
+    assert requested_pages(options) == [1, 2]
+
+
+def test_no_total_stops_at_first_empty_page(stub):
+    base_url, options = stub(places=30, no_total=True)
+    client = AreaListClient(base_url, workers=2)
+    try:
+        location_ids = client.fetch_ids()
+    finally:
+        client.close()
+
+    assert location_ids == [place_id(i) for i in range(1, 31)]
+    # 1페이지, (2, 3), (4, 5) 묶음에서 4페이지가 비어 있으므로 종료
+    assert requested_pages(options) == [1, 2, 3, 4, 5]
+
+
+def test_list_error_raises(stub):
+    base_url, _ = stub(places=30, fail_list=True)
+    client = AreaListClient(base_url, retries=0)
+    try:
+        with pytest.raises(AreaListError):
+            client.fetch_ids()
+    finally:
+        client.close()
+
+
+def test_discover_uses_api_with_area_code(stub):
+    base_url, options = stub(places=5)
+    crawler = VisitKoreaCrawler(base_url=base_url)
+
+    location_ids = crawler.discover_location_ids(method="auto")
+
+    assert location_ids == [place_id(i) for i in range(1, 6)]
+    assert options["list_forms"][0][AREA_CODE_PARAM] == SEOUL_AREA_CODE
+    # 목록 API만 쓰면 Chrome을 띄우지 않음
+    assert crawler._driver is None
+
+
+def test_discover_falls_back_to_selenium(stub, monkeypatch):
+    base_url, _ = stub(places=5, fail_list=True)
+    crawler = VisitKoreaCrawler(base_url=base_url)
+    calls = []
+
+    def extract_location_ids(url=None, max_clicks=1000):
+        calls.append(max_clicks)
+        return ["from-selenium"]
+
+    monkeypatch.setattr(crawler, "extract_location_ids", extract_location_ids)
+
+    assert crawler.discover_location_ids(method="auto", max_clicks=7) == ["from-selenium"]
+    assert calls == [7]
+
+    with pytest.raises(AreaListError):
+        crawler.discover_location_ids(method="api")
+    assert calls == [7]
@@ -0,0 +1,114 @@
+"""
+async_fetcher 테스트 (stub_server.py를 빈 포트로 띄워서 실제 HTTP로 확인)
+
+실행:
+  python -m pytest -q test_async_fetcher.py
+"""
+
+import time
+
+import pytest
+
+from async_fetcher import fetch_details
+from stub_server import place_id, start_server
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**options):
+        options.setdefault("hits", {})
+        server = start_server(port=0, **options)
+        servers.append(server)
+        host, port = server.server_address
+        return f"http://{host}:{port}", options
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_results_keep_input_order(stub):
+    base_url, _ = stub(places=20)
+    location_ids = [place_id(i) for i in (7, 3, 12, 1, 20, 5)]
+
+    results, needs_js = fetch_details(location_ids, base_url, concurrency=4, rate=100)
+
+    assert needs_js == []
+    assert [result["id"] for result in results] == location_ids
+    assert results[1]["name"] == "테스트 장소 3"
+    assert results[1]["주소"] == "서울특별시 테스트구 샘플로 3"
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retries_with_retry_after(stub, status):
+    base_url, options = stub(places=10, fail_first=2, fail_status=status, retry_after=0.2)
+    location_ids = [place_id(i) for i in range(1, 5)]
+
+    start = time.perf_counter()
+    results, _ = fetch_details(location_ids, base_url, concurrency=4, rate=100)
+    elapsed = time.perf_counter() - start
+
+    assert all("error" not in result for result in results)
+    # 기본 재시도 2번: 장소마다 실패 2번 + 성공 1번
+    assert options["hits"] == {location_id: 3 for location_id in location_ids}
+    # Retry-After 0.2초를 두 번 기다림
+    assert elapsed >= 0.4
+
+
+def test_gives_up_after_retries(stub):
+    base_url, options = stub(places=10, fail_first=5, fail_status=503, retry_after=0)
+    location_ids = [place_id(1)]
+
+    results, _ = fetch_details(location_ids, base_url, rate=100)
+
+    assert "error" in results[0]
+    assert options["hits"][place_id(1)] == 3
+
+
+def test_empty_detail_needs_js(stub):
+    base_url, _ = stub(places=10, js_every=3)
+    location_ids = [place_id(i) for i in range(1, 11)]
+
+    results, needs_js = fetch_details(location_ids, base_url, concurrency=4, rate=100)
+
+    assert needs_js == [2, 5, 8]
+    assert [location_ids[i] for i in needs_js] == [place_id(3), place_id(6), place_id(9)]
+    assert all(results[i] is None for i in needs_js)
+    assert all(results[i]["id"] == location_ids[i] for i in range(10) if i not in needs_js)
+
+
+def test_not_modified_with_validators(stub):
+    base_url, _ = stub(places=10)
+    location_ids = [place_id(i) for i in range(1, 6)]
+    validators = {}
+
+    fetch_details(location_ids, base_url, rate=100, validators=validators)
+    assert set(validators) == set(location_ids)
+
+    results, needs_js = fetch_details(location_ids, base_url, rate=100, validators=validators)
+
+    assert needs_js == []
+    assert [result["id"] for result in results] == location_ids
+    assert all(result.get("not_modified") for result in results)
+
+
+def test_parse_error_becomes_error_record(stub):
+    base_url, _ = stub(places=10)
+    location_ids = [place_id(i) for i in range(1, 4)]
+
+    def parse_page(html, location_id, url):
+        if location_id == place_id(2):
+            raise ValueError("bad document")
+        return {"id": location_id, "name": "ok", "url": url}
+
+    validators = {}
+    results, needs_js = fetch_details(location_ids, base_url, rate=100, parse_page=parse_page, validators=validators)
+
+    assert needs_js == []
+    assert [result["id"] for result in results] == location_ids
+    assert results[1]["error"] == "bad document"
+    assert "error" not in results[0] and "error" not in results[2]
+    assert place_id(2) not in validators
@@ -1,6 +1,6 @@
 """
 한국관광공사 구석구석 웹사이트 크롤러
-- 메인 페이지에서 장소 카드 목록 수집
+- 메인 페이지에서 장소 카드 목록 수집 (목록 API 우선, 실패하면 Selenium으로 더보기 클릭)
 - 각 장소의 상세 정보 크롤링
 """
 
@@ -8,7 +8,7 @@ import re
 import time
 import json
 import argparse
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,19 +17,50 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
 import pandas as pd
 
+from area_list_api import AreaListClient, AreaListError, AREA_CODE_PARAM, BASE_URL, SEOUL_AREA_CODE
+from crawl_state import CrawlState, STATE_PATH, content_hash
+from crawl_store import CrawlStore, STORE_PATH
+from result_sink import JsonlSink, export_csv, export_json
+from detail_parser import PARSERS, parse_detail, set_default_parser
+from fetch_profile import NetworkProfile, FETCH_PROFILES, LOGGING_PREFS
+from page_waits import PageWaits, PageTimer, WAIT_TIMEOUTS, CARD_SELECTOR, element_count, install_xhr_tracker, invisible, present
+
 
 class VisitKoreaCrawler:
     """한국관광공사 구석구석 크롤러"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        base_url: str = BASE_URL,
+        wait_mode: str = "condition",
+        wait_timeouts: Optional[Dict] = None,
+        fetch_profile: str = "full",
+    ):
         """
         Args:
             headless: 브라우저를 백그라운드에서 실행할지 여부
+            base_url: 사이트 주소 (로컬 테스트 서버 주소로 바꿀 수 있음)
+            wait_mode: "condition" (DOM 조건 대기) 또는 "sleep" (기존 고정 대기)
+            wait_timeouts: 대기 종류별 최대 시간 (page_waits.WAIT_TIMEOUTS 중 바꿀 값)
+            fetch_profile: "full" (모든 리소스) 또는 "lean" (이미지 / 글꼴 / 미디어 / 분석 스크립트 차단)
         """
-        self.base_url = "https://korean.visitkorea.or.kr"
-        self.driver = self._init_driver(headless)
-        
+        self.base_url = base_url.rstrip('/')
+        self.headless = headless
+        self.wait_mode = wait_mode
+        self.wait_timeouts = wait_timeouts
+        self.fetch_profile = fetch_profile
+        self.timer = PageTimer(wait_mode, fetch_profile)
+        self._driver = None
+        
+    @property
+    def driver(self):
+        """브라우저는 처음 필요할 때 실행 (API만 쓰면 Chrome을 띄우지 않음)"""
+        if self._driver is None:
+            self._driver = self._init_driver(self.headless)
+        return self._driver
         
+
     def _init_driver(self, headless: bool = False):
         options = webdriver.ChromeOptions()
         
@@ -52,28 +83,86 @@ class VisitKoreaCrawler:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # 페이지별 전송 바이트 집계용 성능 로그
+        options.set_capability('goog:loggingPrefs', LOGGING_PREFS)
+        
         # [수정] 드라이버는 여기서 한 번만 생성합니다.
         driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(10)
+        
+        # 조건 대기 모드에서는 암묵적 대기를 끔 (없는 선택자마다 10초씩 기다리지 않게)
+        if self.wait_mode == "condition":
+            driver.implicitly_wait(0)
+            install_xhr_tracker(driver)
+        else:
+            driver.implicitly_wait(10)
         
         # Wait 객체는 드라이버가 생성된 후에 연결합니다.
         self.wait = WebDriverWait(driver, 15)
+        self.waits = PageWaits(driver, self.wait_mode, self.wait_timeouts)
+        self.network = NetworkProfile(driver, self.fetch_profile)
         
         return driver
     
+    def _open(self, url: str, page_type: str):
+        """페이지 종류("list" / "detail")에 맞는 리소스 차단을 설정하고 페이지 열기"""
+        driver = self.driver
+        self.network.use(page_type)
+        driver.get(url)
+    
+    def discover_location_ids(
+        self,
+        method: str = "auto",
+        max_clicks: int = 1000,
+        max_pages: Optional[int] = None,
+        workers: int = 4,
+        area_code: Optional[str] = SEOUL_AREA_CODE,
+    ) -> List[str]:
+        """
+        장소 ID 수집
+        
+        Args:
+            method: "api" (목록 API만), "selenium" (더보기 클릭만), "auto" (API 실패 시 Selenium)
+            max_clicks: Selenium 더보기 버튼 최대 클릭 횟수
+            max_pages: API 최대 페이지 수 (None이면 끝까지)
+            workers: API 동시 요청 수
+            area_code: API 지역 코드 (기본값: 서울, None이면 전국)
+            
+        Returns:
+            장소 ID 리스트
+        """
+        if method in ("api", "auto"):
+            params = {AREA_CODE_PARAM: area_code} if area_code else None
+            client = AreaListClient(self.base_url, workers=workers, params=params)
+            try:
+                start = time.perf_counter()
+                location_ids = client.fetch_ids(max_pages)
+                print(f"\n✅ 목록 API로 총 {len(location_ids)}개 장소 발견 ({time.perf_counter() - start:.1f}초)\n")
+                return location_ids
+            except AreaListError as e:
+                if method == "api":
+                    raise
+                print(f"⚠️  목록 API 사용 실패, Selenium으로 대체합니다: {e}")
+            finally:
+                client.close()
+        
+        return self.extract_location_ids(max_clicks=max_clicks)
+    
     def extract_location_ids(self, url: str = None, max_clicks: int = 1000) -> List[str]:
         if url is None:
             url = f"{self.base_url}/main/area_list.do?type=Place"
             
         print(f"📍 페이지 접속: {url}")
-        self.driver.get(url)
-        time.sleep(5) 
+        start = time.perf_counter()
+        self._open(url, 'list')
+        self.waits.page_loaded(5)
         
         self._close_popups()
         
         # [추가] 지역 버튼들이 있는 Swiper 영역이 렌더링되도록 살짝 스크롤
         self.driver.execute_script("window.scrollTo(0, 150);")
-        time.sleep(2)
+        self.waits.page_loaded(2)
+        self.timer.record('list_load', url, time.perf_counter() - start, **self.network.usage())
+        filter_start = time.perf_counter()
 
         try:
             print("🔍 지역 필터 설정 시작...")
@@ -83,11 +172,11 @@ class VisitKoreaCrawler:
             
             # 버튼 위치로 스크롤 후 클릭
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", seoul_btn)
-            time.sleep(1)
+            self.waits.until(1)
             self.driver.execute_script("arguments[0].click();", seoul_btn)
             
-            print("   - 팝업 로딩 대기 중 (5초)...")
-            time.sleep(5) 
+            print("   - 팝업 로딩 대기 중...")
+            self.waits.until(5, present("label[for='mapAll']"), "popup")
 
             # ③ 체크박스 상태 확인 (input 태그) 및 클릭 (label 태그)
             # mapAll 아이디를 가진 실제 input 요소가 체크되어 있는지 확인합니다.
@@ -107,7 +196,7 @@ class VisitKoreaCrawler:
                 """)
             print("   - 변경 이벤트(Change Event) 강제 전송 완료")
             
-            time.sleep(2) 
+            self.waits.page_loaded(2)
 
             # ③ '선택' 버튼 클릭 전, 경고창이 이미 떠있다면 닫기
             try:
@@ -117,7 +206,7 @@ class VisitKoreaCrawler:
             except:
                 pass
             
-            time.sleep(2) # 클릭 상태 반영 대기            
+            self.waits.until(2) # 클릭 상태 반영 대기 (조건 대기 모드는 바로 진행)
             
               # '선택' 버튼 찾기
             apply_btn = self.wait.until(EC.presence_of_element_located((By.XPATH, "//*[text()='선택']")))
@@ -126,16 +215,18 @@ class VisitKoreaCrawler:
             self.driver.execute_script("arguments[0].click();", apply_btn)
             print("✅ '선택' 버튼 클릭 완료")
             
-            # 팝업이 닫히고 데이터가 새로고침될 때까지 충분히 대기
-            time.sleep(5) 
+            # 팝업이 닫히고 데이터가 새로고침될 때까지 대기
+            self.waits.until(5, invisible("label[for='mapAll']"), "popup")
+            self.waits.page_loaded(0)
 
         except Exception as e:
             print(f"❌ 팝업 처리 중 오류 발생: {e}")
-
+        
+        self.timer.record('list_filter', url, time.perf_counter() - filter_start, **self.network.usage())
 
 # 1. 페이지 하단으로 스크롤하여 더보기 버튼이 로드되게 함
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
+        self.waits.page_loaded(2)
 
         # # 페이지 스크롤하여 컨텐츠 로드
         # self.driver.execute_script("window.scrollTo(0, 500);")
@@ -170,20 +261,23 @@ class VisitKoreaCrawler:
                     break
                 
                 # JavaScript로 버튼 클릭 (element click intercepted 방지)
+                click_start = time.perf_counter()
+                cards_before = element_count(self.driver, CARD_SELECTOR)
                 try:
                     self.driver.execute_script("arguments[0].click();", more_button)
                     click_count += 1
                     print(f"  🔄 더보기 클릭 {click_count}회")
-                    time.sleep(2)  # 로딩 대기
+                    self.waits.cards_added(2, cards_before)  # 카드가 늘어날 때까지 대기
                 except Exception as e:
                     print(f"  ⚠️  클릭 실패, 재시도: {str(e)[:30]}")
                     # 스크롤 후 재시도
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", more_button)
-                    time.sleep(1)
+                    self.waits.until(1)
                     self.driver.execute_script("arguments[0].click();", more_button)
                     click_count += 1
                     print(f"  🔄 더보기 클릭 {click_count}회 (재시도 성공)")
-                    time.sleep(2)
+                    self.waits.cards_added(2, cards_before)
+                self.timer.record('list_more', str(click_count), time.perf_counter() - click_start, **self.network.usage())
                 
             except Exception as e:
                 print(f"  ℹ️  더보기 버튼 클릭 종료: {str(e)[:50]}")
@@ -234,7 +328,7 @@ class VisitKoreaCrawler:
                     # JavaScript로 클릭 (더 안정적)
                     self.driver.execute_script("arguments[0].click();", agree_button)
                     print("  ✓ 위치 정보 동의 완료")
-                    time.sleep(1)
+                    self.waits.until(1, invisible("#locationServicePop"), "popup")
                     return  # 동의 버튼 클릭 성공 시 종료
             except:
                 # 위치 정보 팝업이 없으면 다음 단계로
@@ -258,7 +352,7 @@ class VisitKoreaCrawler:
                         if btn.is_displayed():
                             self.driver.execute_script("arguments[0].click();", btn)
                             print("  ✓ 팝업 닫기 완료")
-                            time.sleep(0.5)
+                            self.waits.until(0.5)
                             return  # 하나만 닫고 종료
                 except:
                     continue
@@ -280,31 +374,26 @@ class VisitKoreaCrawler:
         detail_url = f"{self.base_url}/detail/ms_detail.do?cotid={location_id}"
         print(f"📄 상세 페이지 접속: {location_id}")
         
+        start = time.perf_counter()
         try:
-            self.driver.get(detail_url)
-            time.sleep(2)
-            
-            # 기본 정보 수집
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # 장소명
-            title_tag = soup.find('h2') or soup.find('h1', class_=re.compile(r'tit'))
-            title = title_tag.text.strip() if title_tag else "제목 없음"
+            self._open(detail_url, 'detail')
+            self.waits.page_loaded(2)
             
             # '상세정보' 탭 클릭 (JavaScript로 직접 실행)
             try:
                 self.driver.execute_script("tabChange('detailGo');")
-                time.sleep(2)  # 탭 전환 대기
-                print("  ✓ 상세정보 탭 클릭 완료")
+                if self.waits.detail_loaded(2):  # 상세정보 항목이 채워질 때까지 대기
+                    print("  ✓ 상세정보 탭 클릭 완료")
+                else:
+                    print("  ⚠️  상세정보 항목 대기 시간 초과")
             except Exception as e:
                 print(f"  ⚠️  상세정보 탭 클릭 실패: {str(e)}")
             
-            # 상세정보 파싱
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            detail_info = self._parse_detail_section(soup)
-            
-            # 사진 URL 추출
-            photo_urls = self._extract_photo_urls(soup)
+            # 탭 전환 후 페이지를 한 번만 파싱 (장소명, #detailGo 상세정보, #galleryGo 사진 URL)
+            parsed = parse_detail(self.driver.page_source)
+            title = parsed['title'] or "제목 없음"
+            detail_info = parsed['detail_info']
+            photo_urls = parsed['photo_urls']
             
             # 결과 구성
             result = {
@@ -315,7 +404,10 @@ class VisitKoreaCrawler:
                 **detail_info
             }
             
-            print(f"  ✓ {title} - {len(detail_info)}개 항목, {len(photo_urls)}개 사진 수집")
+            usage = self.network.usage()
+            self.timer.record('detail', location_id, time.perf_counter() - start, **usage)
+            size = f", {usage['bytes'] / 1024:.0f}KB" if usage else ""
+            print(f"  ✓ {title} - {len(detail_info)}개 항목, {len(photo_urls)}개 사진 수집 ({time.perf_counter() - start:.1f}초{size})")
             return result
             
         except Exception as e:
@@ -327,9 +419,36 @@ class VisitKoreaCrawler:
                 'error': str(e)
             }
     
-    def _parse_detail_section(self, soup: BeautifulSoup) -> Dict:
+    @staticmethod
+    def parse_detail_page(html: str, location_id: str, detail_url: str) -> Optional[Dict]:
+        """
+        브라우저 없이 받은 상세 페이지 HTML 파싱
+        
+        Args:
+            html: ms_detail.do 응답 HTML
+            location_id: 장소 ID (cotid)
+            detail_url: 상세 페이지 URL
+            
+        Returns:
+            crawl_detail_info와 같은 형식의 딕셔너리
+            (HTML에 상세정보가 없으면 None -> JavaScript 실행이 필요한 페이지)
+        """
+        parsed = parse_detail(html)
+        if not parsed['has_detail'] or not parsed['detail_info']:
+            return None
+        
+        return {
+            'id': location_id,
+            'name': parsed['title'] or "제목 없음",
+            'url': detail_url,
+            'photo_urls': parsed['photo_urls'],
+            **parsed['detail_info']
+        }
+    
+    @staticmethod
+    def _parse_detail_section(soup: BeautifulSoup) -> Dict:
         """
-        상세정보 섹션 파싱
+        상세정보 섹션 파싱 (문서 전체의 <li>를 훑는 기존 방식, parser_benchmark.py의 비교 기준)
         
         Args:
             soup: BeautifulSoup 객체
@@ -366,7 +485,8 @@ class VisitKoreaCrawler:
         
         return detail_info
     
-    def _extract_photo_urls(self, soup: BeautifulSoup) -> List[str]:
+    @staticmethod
+    def _extract_photo_urls(soup: BeautifulSoup) -> List[str]:
         """
         사진 URL 추출
         
@@ -399,17 +519,80 @@ class VisitKoreaCrawler:
         
         return photo_urls
     
-    def crawl_multiple(self, location_ids: List[str], delay: float = 1.0) -> List[Dict]:
+    def crawl_multiple(
+        self,
+        location_ids: List[str],
+        delay: float = 1.0,
+        backend: str = "selenium",
+        concurrency: int = 8,
+        rate: float = 5.0,
+        drivers: int = 1,
+        pages_per_driver: int = 50,
+        validators: Optional[Dict[str, Dict]] = None,
+        on_result: Optional[Callable] = None,
+    ) -> List[Dict]:
         """
         여러 장소의 상세 정보 크롤링
         
         Args:
             location_ids: 장소 ID 리스트
-            delay: 각 요청 사이 대기 시간 (초)
+            delay: 각 요청 사이 대기 시간 (초, selenium 백엔드)
+            backend: "selenium" (브라우저로 한 곳씩) 또는 "async" (HTTP 동시 요청,
+                     정적 HTML에 상세정보가 없는 페이지만 브라우저로 다시 크롤링)
+            concurrency: 동시 요청 수 (async 백엔드)
+            rate: 호스트당 초당 요청 수 (async 백엔드)
+            drivers: 브라우저 크롤링에 쓸 Chrome 수 (2 이상이면 DriverPool, Chrome마다 delay만큼 대기)
+            pages_per_driver: Chrome 하나가 처리할 페이지 수 (넘으면 새로 실행, DriverPool)
+            validators: {장소 ID: {"etag", "last_modified"}} 조건부 요청용 (async 백엔드, 응답 값으로 갱신됨)
+            on_result: 장소 하나가 끝날 때마다 결과를 받는 함수 (예: JsonlSink.write, 완료 순서)
             
         Returns:
-            상세 정보 리스트
+            상세 정보 리스트 (입력 순서)
         """
+        if backend == "async":
+            from async_fetcher import fetch_details
+            
+            results, needs_js = fetch_details(
+                location_ids,
+                base_url=self.base_url,
+                concurrency=concurrency,
+                rate=rate,
+                parse_page=self.parse_detail_page,
+                validators=validators,
+                on_result=on_result
+            )
+            if needs_js:
+                print(f"\n🌐 JavaScript가 필요한 {len(needs_js)}개 장소는 브라우저로 크롤링합니다.")
+                browser_results = self.crawl_multiple(
+                    [location_ids[idx] for idx in needs_js],
+                    delay=delay,
+                    drivers=drivers,
+                    pages_per_driver=pages_per_driver,
+                    on_result=on_result
+                )
+                for idx, result in zip(needs_js, browser_results):
+                    results[idx] = result
+            return results
+        
+        if drivers > 1:
+            from driver_pool import DriverPool
+            
+            pool = DriverPool(
+                size=drivers,
+                headless=self.headless,
+                base_url=self.base_url,
+                pages_per_driver=pages_per_driver,
+                delay=delay,
+                crawler_options={
+                    'wait_mode': self.wait_mode,
+                    'wait_timeouts': self.wait_timeouts,
+                    'fetch_profile': self.fetch_profile
+                }
+            )
+            results = pool.crawl(location_ids, on_result)
+            self.timer.records.extend(pool.timings)
+            return results
+        
         results = []
         total = len(location_ids)
         
@@ -417,12 +600,53 @@ class VisitKoreaCrawler:
             print(f"\n[{idx}/{total}] ", end='')
             result = self.crawl_detail_info(location_id)
             results.append(result)
+            if on_result:
+                on_result(result)
             
             if idx < total:
                 time.sleep(delay)
         
         return results
     
+    def crawl_incremental(self, location_ids: List[str], state: CrawlState, ttl: float, **options) -> List[Dict]:
+        """
+        증분 크롤링: 새 장소와 마지막 크롤링이 ttl초보다 오래된 장소만 다시 크롤링
+        
+        Args:
+            location_ids: 장소 ID 리스트
+            state: 크롤링 상태 저장소
+            ttl: 다시 크롤링하기까지의 시간 (초)
+            **options: crawl_multiple 인자 (on_result에는 새 장소, 내용이 바뀐 장소, 실패만 넘김)
+            
+        Returns:
+            상세 정보 리스트 (입력 순서, 다시 크롤링하지 않은 장소는 저장된 결과)
+        """
+        due = state.due(location_ids, ttl)
+        print(f"🔁 증분 크롤링: {len(location_ids)}개 중 {len(due)}개 다시 크롤링 ({len(location_ids) - len(due)}개는 TTL 이내)")
+        
+        # 결과를 받는 함수에는 TTL 이내 장소, 304 응답, 해시가 같은 결과를 넘기지 않음 (바뀐 것만 다시 씀)
+        on_result = options.pop('on_result', None)
+        if on_result:
+            known = state.hashes(due)
+            
+            def forward(result):
+                if result.get('not_modified'):
+                    return
+                if 'error' not in result and known.get(result['id']) == content_hash(result):
+                    return
+                on_result(result)
+            options['on_result'] = forward
+        
+        validators = state.validators(due)
+        fresh = self.crawl_multiple(due, validators=validators, **options) if due else []
+        counts = state.update(fresh, validators)
+        print(f"\n📝 새 장소 {counts['new']}개, 변경 {counts['changed']}개, 변경 없음 {counts['unchanged']}개, 실패 {counts['failed']}개")
+        
+        stored = state.records(location_ids)
+        failed = {result['id']: result for result in fresh if result and 'error' in result}
+        results = [stored.get(location_id) or failed.get(location_id) for location_id in location_ids]
+        return [result for result in results if result]
+    
     def save_to_csv(self, data: List[Dict], filename: str):
         """결과를 CSV 파일로 저장"""
         df = pd.DataFrame(data)
@@ -446,8 +670,9 @@ class VisitKoreaCrawler:
     
     def close(self):
         """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
+        if self._driver:
+            self._driver.quit()
+            self._driver = None
             print("\n🔚 브라우저 종료")
 
 
@@ -469,6 +694,24 @@ def main():
   
   # 백그라운드 모드로 100개 크롤링
   python visitkorea_crawler.py --count 100 --headless
+  
+  # 목록은 Selenium으로만 수집
+  python visitkorea_crawler.py --discovery selenium
+  
+  # 상세 페이지를 헤드리스 Chrome 4개로 크롤링
+  python visitkorea_crawler.py --count 200 --fetcher selenium --drivers 4
+  
+  # 기존 고정 대기 + 모든 리소스 로드로 실행 (페이지별 소요 시간 / 전송량 비교용, *_timings.json)
+  python visitkorea_crawler.py --count 20 --fetcher selenium --wait-mode sleep --fetch-profile full
+  
+  # 중간에 끊긴 크롤링 이어서 실행
+  python visitkorea_crawler.py --count 10000 --resume
+  
+  # 주간 갱신: 새 장소와 7일이 지난 장소만 다시 크롤링
+  python visitkorea_crawler.py --count 100000 --incremental --ttl-hours 168
+  
+  # 로컬 테스트 서버로 실행 (python stub_server.py --port 8000)
+  python visitkorea_crawler.py --base-url http://127.0.0.1:8000 --discovery api
         '''
     )
     
@@ -492,6 +735,138 @@ def main():
         help='헤드리스 모드로 실행 (브라우저 창 숨김)'
     )
     
+    parser.add_argument(
+        '--discovery',
+        choices=['auto', 'api', 'selenium'],
+        default='auto',
+        help='장소 목록 수집 방법 (기본값: auto - 목록 API, 실패하면 Selenium)'
+    )
+    
+    parser.add_argument(
+        '--area-code',
+        type=str,
+        default=SEOUL_AREA_CODE,
+        help=f"목록 API 지역 코드 (기본값: {SEOUL_AREA_CODE} - 서울, Selenium 경로의 '서울' 필터와 같은 범위, all이면 전국)"
+    )
+    
+    parser.add_argument(
+        '--api-workers',
+        type=int,
+        default=4,
+        help='목록 API 동시 요청 수 (기본값: 4)'
+    )
+    
+    parser.add_argument(
+        '--max-pages',
+        type=int,
+        default=None,
+        help='목록 API 최대 페이지 수 (기본값: 끝까지)'
+    )
+    
+    parser.add_argument(
+        '--fetcher',
+        choices=['async', 'selenium'],
+        default='async',
+        help='상세 페이지 수집 방법 (기본값: async - HTTP 동시 요청, JavaScript가 필요한 페이지만 브라우저)'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='async 동시 요청 수 (기본값: 8)'
+    )
+    
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=5.0,
+        help='async 호스트당 초당 최대 요청 수 (기본값: 5)'
+    )
+    
+    parser.add_argument(
+        '--drivers',
+        type=int,
+        default=1,
+        help='브라우저 크롤링에 쓸 Chrome 수 (기본값: 1, 2 이상이면 병렬, --headless 여부와 요청 간 대기는 Chrome마다 적용)'
+    )
+    
+    parser.add_argument(
+        '--pages-per-driver',
+        type=int,
+        default=50,
+        help='Chrome 하나가 처리할 페이지 수, 넘으면 새로 실행 (기본값: 50, 0이면 교체 안 함)'
+    )
+    
+    parser.add_argument(
+        '--wait-mode',
+        choices=['condition', 'sleep'],
+        default='condition',
+        help='브라우저 대기 방식 (기본값: condition - DOM 조건, sleep - 기존 고정 대기)'
+    )
+    
+    parser.add_argument(
+        '--wait-timeout',
+        action='append',
+        default=[],
+        metavar='KEY=SECONDS',
+        help='대기 종류별 최대 시간 (page, popup, more, detail, idle), 여러 번 지정 가능 (예: --wait-timeout detail=5)'
+    )
+    
+    parser.add_argument(
+        '--fetch-profile',
+        choices=list(FETCH_PROFILES),
+        default='lean',
+        help='브라우저 리소스 로드 방식 (기본값: lean - 이미지/글꼴/미디어/분석 스크립트 차단, full - 모두 로드)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='이전 실행의 결과 파일(<output>.jsonl)에 이어서 저장, 이미 저장된 장소는 건너뜀'
+    )
+    
+    parser.add_argument(
+        '--store',
+        type=str,
+        default=STORE_PATH,
+        help=f'결과를 cotid 기준으로 누적하는 SQLite 저장소 (기본값: {STORE_PATH})'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='증분 크롤링: 새 장소와 TTL이 지난 장소만 다시 크롤링, 내용이 바뀐 결과만 상태 파일 / JSONL / 저장소에 다시 씀 (JSON / CSV는 저장소에서 이번 대상 장소만 골라 생성)'
+    )
+    
+    parser.add_argument(
+        '--ttl-hours',
+        type=float,
+        default=24 * 7,
+        help='증분 크롤링에서 다시 크롤링하기까지의 시간 (기본값: 168시간)'
+    )
+    
+    parser.add_argument(
+        '--state',
+        type=str,
+        default=STATE_PATH,
+        help=f'증분 크롤링 상태 파일 (기본값: {STATE_PATH})'
+    )
+    
+    parser.add_argument(
+        '--html-parser',
+        choices=list(PARSERS),
+        default='auto',
+        help='상세 페이지 HTML 파서 (기본값: auto - selectolax, lxml, bs4 중 설치된 것)'
+    )
+    
+    parser.add_argument(
+        '--base-url',
+        type=str,
+        default=BASE_URL,
+        help=f'사이트 주소 (기본값: {BASE_URL})'
+    )
+    
     parser.add_argument(
         '--output', '-o',
         type=str,
@@ -500,16 +875,42 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error("--rate는 0보다 커야 합니다")
+    
+    wait_timeouts = {}
+    for item in args.wait_timeout:
+        key, _, seconds = item.partition('=')
+        if key not in WAIT_TIMEOUTS or not seconds:
+            parser.error(f"--wait-timeout 형식 오류: {item} (키: {', '.join(WAIT_TIMEOUTS)})")
+        try:
+            wait_timeouts[key] = float(seconds)
+        except ValueError:
+            parser.error(f"--wait-timeout 형식 오류: {item} (초는 숫자여야 합니다)")
+    
+    set_default_parser(args.html_parser)
     
     # 크롤러 초기화
-    crawler = VisitKoreaCrawler(headless=args.headless)
+    crawler = VisitKoreaCrawler(
+        headless=args.headless,
+        base_url=args.base_url,
+        wait_mode=args.wait_mode,
+        wait_timeouts=wait_timeouts,
+        fetch_profile=args.fetch_profile
+    )
     
     try:
-        # 1. 장소 ID 수집 (더보기 버튼 클릭)
+        # 1. 장소 ID 수집 (목록 API 또는 더보기 버튼 클릭)
         print("=" * 60)
         print("1단계: 장소 ID 수집")
         print("=" * 60)
-        location_ids = crawler.extract_location_ids(max_clicks=args.max_clicks)
+        location_ids = crawler.discover_location_ids(
+            method=args.discovery,
+            max_clicks=args.max_clicks,
+            max_pages=args.max_pages,
+            workers=args.api_workers,
+            area_code=None if args.area_code == 'all' else args.area_code
+        )
         
         # ID 목록 저장
         crawler.save_location_ids(location_ids, f'{args.output}_ids.json')
@@ -517,22 +918,79 @@ def main():
         # 지정된 개수만큼 크롤링
         target_count = min(args.count, len(location_ids))
         target_ids = location_ids[:target_count]
+        # 증분 실행의 JSON / CSV는 --resume으로 건너뛴 장소까지 포함한 이번 대상 전체
+        export_ids = target_ids
         print(f"\n📊 총 {len(location_ids)}개 중 {target_count}개 장소를 크롤링합니다.\n")
         
+        # 결과는 끝날 때마다 JSONL에 추가 (중간에 끊겨도 --resume으로 이어서 실행)
+        sink_path = f'{args.output}.jsonl'
+        sink = JsonlSink(sink_path, resume=args.resume)
+        store = CrawlStore(args.store)
+        
+        def save_result(result):
+            sink.write(result)
+            store.put_place(result)
+
+        if sink.done:
+            target_ids = [location_id for location_id in target_ids if location_id not in sink.done]
+            print(f"⏭️  {sink_path}에 저장된 {target_count - len(target_ids)}개 장소는 건너뜁니다.\n")
+        
         # 2. 상세 정보 크롤링
         print("=" * 60)
         print("2단계: 상세 정보 크롤링")
         print("=" * 60)
-        results = crawler.crawl_multiple(target_ids, delay=1.5)
-        
-        # 3. 결과 저장
-        print("\n" + "=" * 60)
-        print("3단계: 결과 저장")
-        print("=" * 60)
-        crawler.save_to_json(results, f'{args.output}.json')
-        crawler.save_to_csv(results, f'{args.output}.csv')
-        
-        print(f"\n✅ 크롤링 완료! {len(results)}개 장소 정보 저장됨")
+        crawl_options = {
+            'delay': 1.5,
+            'backend': args.fetcher,
+            'concurrency': args.concurrency,
+            'rate': args.rate,
+            'drivers': args.drivers,
+            'pages_per_driver': args.pages_per_driver,
+            'on_result': save_result
+        }
+        try:
+            try:
+                if args.incremental:
+                    state = CrawlState(args.state)
+                    try:
+                        # 저장소에 없는 장소는 상태 파일의 마지막 결과로 채움 (바뀐 결과만 저장소에 다시 쓰므로)
+                        stored_ids = store.place_ids()
+                        for record in state.records([location_id for location_id in export_ids if location_id not in stored_ids]).values():
+                            store.put_place(record)
+                        results = crawler.crawl_incremental(target_ids, state, args.ttl_hours * 3600, **crawl_options)
+                    finally:
+                        state.close()
+                else:
+                    results = crawler.crawl_multiple(target_ids, **crawl_options)
+            finally:
+                sink.close()
+            
+            # 3. 결과 저장
+            # 일반 실행은 JSONL을 한 줄씩 읽어서, 증분 실행은 JSONL에 바뀐 장소만 있으므로 저장소에서 이번 대상 장소만 골라 JSON / CSV 생성
+            print("\n" + "=" * 60)
+            print("3단계: 결과 저장")
+            print("=" * 60)
+            json_path, csv_path = f'{args.output}.json', f'{args.output}.csv'
+            if args.incremental:
+                counts = [
+                    store.export_places(json_path=json_path, location_ids=export_ids),
+                    store.export_places(csv_path=csv_path, location_ids=export_ids)
+                ]
+            else:
+                counts = [export_json(sink_path, json_path), export_csv(sink_path, csv_path)]
+            for filename, count in zip((json_path, csv_path), counts):
+                print(f"\n💾 저장 완료: {filename}")
+                print(f"   총 {count}개 항목")
+        finally:
+            store.close()
+        print(f"🗄️  저장소에도 기록됨: {args.store} (python crawl_store.py export places -o <파일명>)")
+        
+        print(f"\n✅ 크롤링 완료! 이번 실행에서 {len(results)}개 장소 정보 저장됨")
+        
+        # 브라우저로 처리한 페이지의 소요 시간과 전송량 (--wait-mode, --fetch-profile 비교용)
+        if crawler.timer.records:
+            crawler.timer.print_summary()
+            crawler.timer.save(f'{args.output}_timings.json')
         
         print("\n" + "=" * 60)
         print("결과 미리보기")